@@ -11,6 +11,17 @@ STACK_NAME="alcolook-backend"
 REGION="us-east-1"  # 버지니아 북부 리전
 JWT_SECRET="your-super-secret-jwt-key-change-this-in-production"
 
+# 모든 함수 패키지에 함께 들어가는 공유 모듈
+SHARED_MODULES="runtime_context.py json_codec.py client_factory.py user_store.py"
+
+# 모든 함수 패키지에 함께 들어가는 벤더링한 패키지 (jwt.Signer, jwt.Verifier 등은 PyPI의
+# PyJWT에 없으므로 lambda/jwt를 그대로 넣음)
+VENDORED_PACKAGES="jwt"
+
+# 패키징할 Lambda 함수 (update_profile은 CloudFormation 스택 밖에서 만든 함수이므로,
+# alcolook-update-profile 함수가 없으면 코드 업데이트를 건너뛰고 패키지만 dist/에 남김)
+FUNCTIONS="user_register user_login forgot_password update_profile"
+
 # 1. CloudFormation 스택 배포
 echo "📦 CloudFormation 스택 배포 중..."
 aws cloudformation deploy \
@@ -27,7 +38,7 @@ echo "📝 Lambda 함수 배포 중..."
 mkdir -p temp
 
 # 각 Lambda 함수 배포
-for func in user_register user_login forgot_password; do
+for func in $FUNCTIONS; do
     echo "  - $func 함수 배포 중..."
     
     # 패키지 디렉토리 생성
@@ -35,13 +46,25 @@ for func in user_register user_login forgot_password; do
     
     # 함수 코드만 복사 (의존성은 Lambda 런타임에서 제공)
     cp lambda/${func}.py temp/$func/
+    for module in $SHARED_MODULES; do
+        cp lambda/$module temp/$func/
+    done
+    for package in $VENDORED_PACKAGES; do
+        cp -R lambda/$package temp/$func/
+    done
     
     # ZIP 파일 생성
     cd temp/$func
-    zip -r ../${func}.zip .
+    zip -r ../${func}.zip . -x '*__pycache__*'
     cd ../..
     
     # Lambda 함수 업데이트
+    if ! aws lambda get-function --function-name alcolook-${func//_/-} --region $REGION > /dev/null 2>&1; then
+        mkdir -p dist
+        cp temp/${func}.zip dist/
+        echo "    ⚠️  alcolook-${func//_/-} 함수가 없어 배포를 건너뜁니다 (패키지: dist/${func}.zip)"
+        continue
+    fi
     aws lambda update-function-code \
         --function-name alcolook-${func//_/-} \
         --zip-file fileb://temp/${func}.zip \
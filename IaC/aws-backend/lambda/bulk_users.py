@@ -0,0 +1,340 @@
+"""
+alcolook-users 대량 가져오기/내보내기 도구
+
+제휴사 사용자 등 많은 계정을 한 번에 만들거나 백업할 때 로컬에서 실행한다.
+(Lambda 핸들러가 아니며 배포 패키지에는 포함되지 않음)
+
+    # 가져오기: NDJSON 또는 CSV (확장자가 .csv면 CSV, '-'는 표준 입력)
+    python bulk_users.py import partner_users.ndjson
+    python bulk_users.py import partner_users.csv --hash-workers 4 --writers 8
+
+    # 내보내기: 병렬 스캔 결과를 NDJSON으로 ('-'는 표준 출력)
+    python bulk_users.py export users.ndjson --segments 8
+
+가져오기 레코드는 회원가입 요청과 같은 email, password, name 필드를 가진다.
+password 대신 password_hash(sha256 hex)가 있으면 그대로 저장하므로, 내보낸 파일을
+다시 가져올 수 있다. user_id, created_at, updated_at이 없으면 새로 만든다. (CSV의 빈
+칸은 값이 없는 것으로 본다)
+
+- 입력은 BLOCK_SIZE개씩 스트리밍으로 읽으므로 메모리 사용량은 입력 크기와 무관하다.
+  (중복 확인을 위해 이미 읽은 이메일 목록만 유지)
+- JSON으로 파싱할 수 없는 줄, 필수 필드가 없거나 password_hash가 소문자 sha256 hex가
+  아닌 레코드, user_id/created_at/updated_at이 있지만 빈 문자열이 아닌 문자열이 아닌
+  레코드는 줄 번호와 함께 stderr에 알리고 건너뛴다. (invalid로 집계)
+- 같은 이메일이 입력에 여러 번 있으면 처음 것만 쓴다.
+- 이미 가입된 이메일은 건너뛴다. (--overwrite를 주면 덮어씀. batch_write_item은
+  조건부 쓰기를 지원하지 않으므로, 확인과 쓰기 사이에 가입한 사용자는 덮어쓸 수 있음)
+- 비밀번호 해시는 프로세스 풀(CPU가 둘 이상일 때)에서, 쓰기는 batch_write_item
+  25개씩 스레드 풀에서 병렬로 처리하고, 처리되지 않은 항목은 백오프하며 재시도한다.
+  (user_store.put_users)
+- 중간에 실패하면 같은 입력으로 다시 실행하면 된다. 이미 저장된 사용자는 건너뛴다.
+
+내보내기는 세그먼트마다 스레드 하나가 스캔하고, 크기가 제한된 큐를 통해 한 줄씩
+기록한다. 재설정 토큰(reset_*) 속성은 내보내지 않는다.
+
+AWS 자격 증명과 리전, DYNAMODB_ENDPOINT_URL 등은 Lambda와 같은 환경 변수를 따른다.
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import os
+import queue
+import re
+import sys
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+import json_codec
+import user_store
+
+# 한 번에 읽어 해시/확인/쓰기하는 레코드 수
+BLOCK_SIZE = 1000
+
+# 해시 작업 하나에 묶는 비밀번호 수 (프로세스 간 전달 비용을 줄이기 위함)
+HASH_CHUNK_SIZE = 250
+
+# 내보내기 스캔 페이지 크기와 세그먼트별로 쌓아 둘 수 있는 페이지 수
+EXPORT_PAGE_SIZE = 500
+EXPORT_QUEUE_PAGES = 4
+
+EXPORT_EXCLUDED = ('reset_token', 'reset_expires', 'reset_created')
+
+# user_register/user_login과 같은 sha256 hexdigest (소문자 64자)
+PASSWORD_HASH_PATTERN = re.compile(r'[0-9a-f]{64}')
+
+# JSON으로 파싱할 수 없는 줄을 나타내는 레코드
+_MALFORMED = object()
+
+
+def hash_passwords(passwords):
+    # user_register와 같은 sha256 hex (프로세스 풀 작업자에서 실행)
+    return [hashlib.sha256(password.encode()).hexdigest() for password in passwords]
+
+
+def read_records(stream, fmt):
+    """
+    (줄 번호, 레코드 dict)를 차례로 반환한다. 빈 줄은 건너뛰고, JSON으로 파싱할 수
+    없는 줄은 레코드 대신 _MALFORMED를 반환한다. (한 줄의 오류로 전체가 중단되지 않도록)
+    CSV의 빈 칸은 레코드에 넣지 않는다.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, {
+                field: value for field, value in record.items() if value != ''
+            }
+        return
+
+    for line_num, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json_codec.loads(line)
+        except json_codec.JSONDecodeError:
+            record = _MALFORMED
+        yield line_num, record
+
+
+def _blocks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        block = list(itertools.islice(iterator, size))
+        if not block:
+            return
+        yield block
+
+
+def _validate(line_num, record):
+    if record is _MALFORMED:
+        return f'line {line_num}: malformed JSON'
+    if not isinstance(record, dict):
+        return f'line {line_num}: not an object'
+    for field in ('email', 'name'):
+        if not isinstance(record.get(field), str) or not record[field]:
+            return f'line {line_num}: {field} is required'
+    if not record.get('password') and not record.get('password_hash'):
+        return f'line {line_num}: password or password_hash is required'
+    if record.get('password') and not isinstance(record['password'], str):
+        return f'line {line_num}: password must be a string'
+    # 로그인할 수 없는 계정이 만들어지지 않도록 hexdigest 형식만 허용
+    password_hash = record.get('password_hash')
+    if password_hash and (
+        not isinstance(password_hash, str)
+        or not PASSWORD_HASH_PATTERN.fullmatch(password_hash)
+    ):
+        return f'line {line_num}: password_hash must be a sha256 hex digest'
+    # 그대로 저장되는 값이므로 내보낸 파일처럼 문자열이어야 함
+    for field in ('user_id', 'created_at', 'updated_at'):
+        if record.get(field) is not None and (
+            not isinstance(record[field], str) or not record[field]
+        ):
+            return f'line {line_num}: {field} must be a non-empty string'
+    return None
+
+
+def _hash_block(hash_pool, records):
+    # password_hash가 없는 레코드만 해시 (hash_pool이 None이면 현재 프로세스에서)
+    pending = [record for record in records if not record.get('password_hash')]
+    passwords = [record['password'] for record in pending]
+    chunks = [
+        passwords[start:start + HASH_CHUNK_SIZE]
+        for start in range(0, len(passwords), HASH_CHUNK_SIZE)
+    ]
+    if hash_pool is None:
+        results = map(hash_passwords, chunks)
+    else:
+        results = hash_pool.map(hash_passwords, chunks)
+
+    for record, password_hash in zip(pending, itertools.chain.from_iterable(results)):
+        record['password_hash'] = password_hash
+
+
+def _user_item(record, now):
+    return {
+        'email': record['email'],
+        'user_id': record.get('user_id') or str(uuid.uuid4()),
+        'name': record['name'],
+        'password_hash': record['password_hash'],
+        'created_at': record.get('created_at') or now,
+        'updated_at': record.get('updated_at') or now,
+    }
+
+
+def import_users(stream, fmt='ndjson', hash_workers=None, writers=4, overwrite=False):
+    """
+    레코드를 읽어 사용자를 만들고 건수 통계 dict를 반환한다.
+    """
+    stats = {'imported': 0, 'existing': 0, 'duplicate': 0, 'invalid': 0}
+    seen = set()
+
+    if hash_workers is None:
+        hash_workers = os.cpu_count() or 1
+    # 짧은 비밀번호의 sha256은 프로세스 간 전달보다 싸므로 CPU가 하나면 현재 프로세스에서 해시
+    hash_pool = None
+    if hash_workers > 1:
+        hash_pool = ProcessPoolExecutor(max_workers=hash_workers)
+    write_pool = ThreadPoolExecutor(max_workers=writers)
+
+    try:
+        for block in _blocks(read_records(stream, fmt), BLOCK_SIZE):
+            records = []
+            for line_num, record in block:
+                error = _validate(line_num, record)
+                if error:
+                    print(error, file=sys.stderr)
+                    stats['invalid'] += 1
+                elif record['email'] in seen:
+                    stats['duplicate'] += 1
+                else:
+                    seen.add(record['email'])
+                    records.append(record)
+
+            if not overwrite and records:
+                existing = user_store.find_existing_emails(r['email'] for r in records)
+                stats['existing'] += len(existing)
+                records = [r for r in records if r['email'] not in existing]
+
+            _hash_block(hash_pool, records)
+            now = datetime.utcnow().isoformat()
+            users = [_user_item(record, now) for record in records]
+
+            batches = [
+                users[start:start + user_store.BATCH_WRITE_LIMIT]
+                for start in range(0, len(users), user_store.BATCH_WRITE_LIMIT)
+            ]
+            # 블록 안의 쓰기가 모두 끝난 뒤 다음 블록을 읽음 (실패하면 예외가 그대로 전파)
+            for _ in write_pool.map(user_store.put_users, batches):
+                pass
+            stats['imported'] += len(users)
+    finally:
+        write_pool.shutdown()
+        if hash_pool is not None:
+            hash_pool.shutdown()
+
+    return stats
+
+
+def _scan_segment(segment, total_segments, pages, stop):
+    try:
+        page = []
+        for user in user_store.scan_users(segment, total_segments, EXPORT_PAGE_SIZE):
+            page.append(user)
+            if len(page) >= EXPORT_PAGE_SIZE:
+                pages.put(page)
+                page = []
+                if stop.is_set():
+                    return
+        if page:
+            pages.put(page)
+    except Exception as e:
+        pages.put(e)
+    finally:
+        pages.put(None)
+
+
+def export_users(stream, segments=4):
+    """
+    모든 사용자를 NDJSON으로 stream에 기록하고 기록한 수를 반환한다. (순서는 정해지지 않음)
+    """
+    pages = queue.Queue(maxsize=segments * EXPORT_QUEUE_PAGES)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(
+            target=_scan_segment, args=(segment, segments, pages, stop), daemon=True
+        )
+        for segment in range(segments)
+    ]
+    for thread in threads:
+        thread.start()
+
+    count = 0
+    running = segments
+    try:
+        while running:
+            page = pages.get()
+            if page is None:
+                running -= 1
+                continue
+            if isinstance(page, Exception):
+                raise page
+            for user in page:
+                for field in EXPORT_EXCLUDED:
+                    user.pop(field, None)
+                stream.write(json_codec.dumps(user) + '\n')
+            count += len(page)
+    finally:
+        # 오류로 끝날 때 스캔 스레드가 꽉 찬 큐에서 멈추지 않도록 비워 줌
+        stop.set()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                pages.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    return count
+
+
+def _open(path, mode):
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    return open(path, mode, encoding='utf-8', newline='' if mode == 'r' else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='alcolook-users bulk import/export')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='create users from NDJSON/CSV')
+    import_parser.add_argument('path', help="input file ('-' for stdin)")
+    import_parser.add_argument('--format', choices=('ndjson', 'csv'))
+    import_parser.add_argument(
+        '--hash-workers',
+        type=int,
+        default=None,
+        help='password hashing processes (default: CPU count, 0 or 1: hash inline)',
+    )
+    import_parser.add_argument(
+        '--writers', type=int, default=4, help='concurrent batch_write_item calls'
+    )
+    import_parser.add_argument(
+        '--overwrite', action='store_true', help='replace users that already exist'
+    )
+
+    export_parser = commands.add_parser('export', help='write all users as NDJSON')
+    export_parser.add_argument('path', help="output file ('-' for stdout)")
+    export_parser.add_argument(
+        '--segments', type=int, default=4, help='parallel scan segments'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'import':
+        fmt = args.format or ('csv' if args.path.endswith('.csv') else 'ndjson')
+        stream = _open(args.path, 'r')
+        try:
+            stats = import_users(
+                stream,
+                fmt,
+                hash_workers=args.hash_workers,
+                writers=args.writers,
+                overwrite=args.overwrite,
+            )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        print(json_codec.dumps(stats), file=sys.stderr)
+    else:
+        stream = _open(args.path, 'w')
+        try:
+            count = export_users(stream, segments=args.segments)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        print(json_codec.dumps({'exported': count}), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
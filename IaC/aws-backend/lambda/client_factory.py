@@ -0,0 +1,84 @@
+"""
+Lambda 핸들러들이 공유하는 AWS 클라이언트 팩토리
+
+botocore 기본 설정 대신 연결 풀, TCP keep-alive, standard 재시도, 짧은 연결/읽기
+타임아웃을 적용한 클라이언트를 만든다. warm 컨테이너에서는
+runtime_context가 만들어진 객체를 재사용하므로 HTTP 연결도 호출 사이에 유지된다.
+
+함수별로 다음 환경 변수로 조정할 수 있다:
+
+    BOTO_MAX_POOL_CONNECTIONS  클라이언트당 최대 연결 수 (기본 10)
+    BOTO_CONNECT_TIMEOUT       연결 타임아웃, 초 (기본 0.5)
+    BOTO_READ_TIMEOUT          읽기 타임아웃, 초 (기본 1)
+    BOTO_TCP_KEEPALIVE         TCP keep-alive 사용 여부 (기본 true)
+    AWS_MAX_ATTEMPTS           첫 요청을 포함한 최대 시도 횟수 (기본 2)
+    AWS_RETRY_MODE             재시도 모드: legacy, standard, adaptive (기본 standard)
+    DYNAMODB_ENDPOINT_URL      DynamoDB 엔드포인트 (로컬 DynamoDB 등 대체 서버)
+    SES_ENDPOINT_URL           SES 엔드포인트
+
+AWS 호출 하나가 걸릴 수 있는 최악의 시간은 대략
+최대 시도 횟수 × (연결 타임아웃 + 읽기 타임아웃) + 재시도 대기(standard 모드에서 첫 재시도
+전 최대 1초)로, 기본값이면 2 × (0.5 + 1) + 1 = 4초다. 함수의 Timeout이 핸들러의 AWS 호출
+수 × 이 시간보다 짧으면 느린 응답에서 핸들러가 500을 반환하기 전에 Lambda가 종료되므로,
+CloudFormation 템플릿의 함수 Timeout은 이에 맞춰 정해 두었다. (Lambda 기본값 3초보다 김)
+값을 늘릴 때는 Timeout도 함께 늘려야 한다.
+
+예: 로컬 DynamoDB에 붙여 핸들러를 실행할 때
+
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 AWS_REGION=us-east-1 python ...
+"""
+import os
+
+from botocore.config import Config
+
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+DEFAULT_CONNECT_TIMEOUT = 0.5
+DEFAULT_READ_TIMEOUT = 1.0
+DEFAULT_MAX_ATTEMPTS = 2
+DEFAULT_RETRY_MODE = 'standard'
+
+
+def _env_flag(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def client_config(**overrides):
+    """
+    환경 변수로 조정한 botocore Config를 만든다. 인자로 넘긴 값이 우선한다.
+    """
+    settings = {
+        'max_pool_connections': int(
+            os.environ.get('BOTO_MAX_POOL_CONNECTIONS', DEFAULT_MAX_POOL_CONNECTIONS)
+        ),
+        'connect_timeout': float(
+            os.environ.get('BOTO_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT)
+        ),
+        'read_timeout': float(
+            os.environ.get('BOTO_READ_TIMEOUT', DEFAULT_READ_TIMEOUT)
+        ),
+        'tcp_keepalive': _env_flag('BOTO_TCP_KEEPALIVE', True),
+        'retries': {
+            'total_max_attempts': int(
+                os.environ.get('AWS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+            ),
+            'mode': os.environ.get('AWS_RETRY_MODE', DEFAULT_RETRY_MODE),
+        },
+    }
+    settings.update(overrides)
+    return Config(**settings)
+
+
+def endpoint_url(service):
+    # 예: DYNAMODB_ENDPOINT_URL, SES_ENDPOINT_URL (없으면 AWS 기본 엔드포인트)
+    return os.environ.get(f'{service.upper()}_ENDPOINT_URL') or None
+
+
+def create_client(session, service, **config_overrides):
+    return session.client(
+        service,
+        config=client_config(**config_overrides),
+        endpoint_url=endpoint_url(service),
+    )
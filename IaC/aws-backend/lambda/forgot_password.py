@@ -1,18 +1,10 @@
-import json
-import boto3
 import uuid
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 
-dynamodb = boto3.resource('dynamodb')
-users_table = dynamodb.Table('alcolook-users')
-
-# SES는 선택적으로 사용 (설정되지 않으면 로그만 출력)
-try:
-    ses = boto3.client('ses')
-    SES_AVAILABLE = True
-except Exception:
-    SES_AVAILABLE = False
+import json_codec
+import runtime_context
+import user_store
 
 def lambda_handler(event, context):
     try:
@@ -29,18 +21,21 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 200,
                 'headers': headers,
-                'body': json.dumps({'message': 'OK'})
+                'body': json_codec.dumps({'message': 'OK'})
             }
         
+        # SES는 선택적으로 사용 (설정되지 않으면 로그만 출력)
+        ses = runtime_context.get_ses()
+
         # 요청 본문 파싱
         try:
-            body = json.loads(event['body'])
+            body = json_codec.loads(event['body'])
             email = body.get('email', '').strip().lower()
-        except (json.JSONDecodeError, TypeError):
+        except (json_codec.JSONDecodeError, TypeError):
             return {
                 'statusCode': 400,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '잘못된 요청 형식입니다.'
                 })
             }
@@ -50,26 +45,25 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 400,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '유효한 이메일을 입력해주세요.'
                 })
             }
         
         # 사용자 존재 확인
         try:
-            response = users_table.get_item(Key={'email': email})
-            if 'Item' not in response:
+            user = user_store.get_user(email)
+            if user is None:
                 # 보안상 사용자가 존재하지 않아도 성공 메시지 반환
                 print(f"Password reset requested for non-existent email: {email}")
                 return {
                     'statusCode': 200,
                     'headers': headers,
-                    'body': json.dumps({
+                    'body': json_codec.dumps({
                         'message': '비밀번호 재설정 링크를 이메일로 보내드렸습니다.'
                     })
                 }
             
-            user = response['Item']
             print(f"Password reset requested for user: {email}")
             
         except ClientError as e:
@@ -77,7 +71,7 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 500,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '서버 오류가 발생했습니다.'
                 })
             }
@@ -88,28 +82,24 @@ def lambda_handler(event, context):
         
         # 재설정 정보를 users 테이블에 저장 (별도 테이블 대신)
         try:
-            users_table.update_item(
-                Key={'email': email},
-                UpdateExpression='SET reset_token = :token, reset_expires = :expires, reset_created = :created',
-                ExpressionAttributeValues={
-                    ':token': reset_token,
-                    ':expires': expires_at.isoformat(),
-                    ':created': datetime.utcnow().isoformat()
-                }
-            )
+            user_store.update_user(email, {
+                'reset_token': reset_token,
+                'reset_expires': expires_at.isoformat(),
+                'reset_created': datetime.utcnow().isoformat()
+            })
             print(f"Reset token saved for user: {email}")
         except ClientError as e:
             print(f"Error saving reset token: {e}")
             return {
                 'statusCode': 500,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '서버 오류가 발생했습니다.'
                 })
             }
         
         # 이메일 발송 (SES가 사용 가능한 경우에만)
-        if SES_AVAILABLE:
+        if ses is not None:
             reset_url = f"https://alcolook-app.com/reset-password?token={reset_token}"
             
             email_body = f"""안녕하세요, {user.get('name', '사용자')}님!
@@ -146,7 +136,7 @@ AlcoLook 팀"""
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'message': '비밀번호 재설정 링크를 이메일로 보내드렸습니다.'
             })
         }
@@ -159,7 +149,7 @@ AlcoLook 팀"""
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'error': '서버 오류가 발생했습니다.'
             })
         }
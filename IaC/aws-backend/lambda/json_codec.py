@@ -0,0 +1,24 @@
+"""
+Lambda 핸들러들이 공유하는 JSON 코덱
+
+요청 본문 파싱은 토큰과 같은 jwt.json_backend를 쓴다. orjson이 설치되어 있으면
+orjson으로 읽고, orjson이 처리하지 못하는 입력은 json 모듈로 다시 처리하므로
+파싱 결과와 예외는 json 모듈과 같다.
+
+응답 본문은 orjson 사용 여부와 관계없이 json.dumps 기본 설정 그대로 직렬화한다.
+(', ' / ': ' 구분자, 한글 등 비 ASCII 문자는 \\u 이스케이프) orjson은 이 형식을
+만들 수 없으므로 클라이언트가 받는 본문이 설치 환경에 따라 달라지지 않게 json을 쓴다.
+"""
+import json
+
+from jwt import json_backend
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    return json_backend.loads(data)
+
+
+def dumps(obj):
+    return json.dumps(obj)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from .api_jwk import PyJWK, PyJWKSet
 from .api_jws import (
     PyJWS,
@@ -6,7 +8,16 @@ from .api_jws import (
     register_algorithm,
     unregister_algorithm,
 )
-from .api_jwt import PyJWT, decode, decode_complete, encode
+from .api_jwt import (
+    PyJWT,
+    Signer,
+    Verifier,
+    decode,
+    decode_complete,
+    decode_many,
+    encode,
+    encode_many,
+)
 from .exceptions import (
     DecodeError,
     ExpiredSignatureError,
@@ -26,6 +37,8 @@ from .exceptions import (
     PyJWTError,
 )
 from .jwks_client import PyJWKClient
+from .token_cache import VerifiedTokenCache
+from .verification import VerificationEngine
 
 __version__ = "2.10.1"
 
@@ -43,14 +56,21 @@ __copyright__ = "Copyright 2015-2022 José Padilla"
 
 
 __all__ = [
+    "AsyncPyJWKClient",
     "PyJWS",
     "PyJWT",
     "PyJWKClient",
     "PyJWK",
     "PyJWKSet",
+    "Signer",
+    "VerificationEngine",
+    "VerifiedTokenCache",
+    "Verifier",
     "decode",
     "decode_complete",
+    "decode_many",
     "encode",
+    "encode_many",
     "get_unverified_header",
     "register_algorithm",
     "unregister_algorithm",
@@ -73,3 +93,13 @@ __all__ = [
     "PyJWKSetError",
     "PyJWTError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first use so that importing jwt does not import asyncio.
+    if name == "AsyncPyJWKClient":
+        from .jwks_client_async import AsyncPyJWKClient
+
+        return AsyncPyJWKClient
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
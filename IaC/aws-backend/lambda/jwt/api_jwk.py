@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+from collections.abc import Callable
 from typing import Any
 
-from .algorithms import get_default_algorithms, has_crypto, requires_cryptography
+from .algorithms import _has_crypto, default_algorithms, requires_cryptography
 from .exceptions import (
     InvalidKeyError,
     MissingCryptographyError,
@@ -14,10 +16,28 @@ from .exceptions import (
 )
 from .types import JWKDict
 
+# Guards materializing PyJWK.key. Shared by all keys so that PyJWK instances
+# stay small and picklable; materializing is rare and short.
+_key_lock = threading.Lock()
+
+# PyJWK._key before the key has been built.
+_UNSET: Any = object()
+
 
 class PyJWK:
+    """
+    A JSON Web Key.
+
+    The kty, alg and crv members and the presence of the members the key
+    type requires are checked when the object is created. The key itself
+    is only built from the JWK the first time :attr:`key` is read, so that
+    loading a large JWK Set only pays for the keys that are used; errors in
+    the key material are raised from there. :attr:`key` can be assigned as
+    before.
+    """
+
     def __init__(self, jwk_data: JWKDict, algorithm: str | None = None) -> None:
-        self._algorithms = get_default_algorithms()
+        self._algorithms = default_algorithms
         self._jwk_data = jwk_data
 
         kty = self._jwk_data.get("kty", None)
@@ -55,7 +75,7 @@ class PyJWK:
             else:
                 raise InvalidKeyError(f"Unsupported kty: {kty}")
 
-        if not has_crypto and algorithm in requires_cryptography:
+        if algorithm in requires_cryptography and not _has_crypto():
             raise MissingCryptographyError(
                 f"{algorithm} requires 'cryptography' to be installed."
             )
@@ -67,7 +87,26 @@ class PyJWK:
         else:
             raise PyJWKError(f"Unable to find an algorithm for key: {self._jwk_data}")
 
-        self.key = self.Algorithm.from_jwk(self._jwk_data)
+        self._key: Any = _UNSET
+        check_members = _MEMBER_CHECKS.get(type(self.Algorithm).__name__)
+        if check_members is not None and isinstance(self._jwk_data, dict):
+            check_members(self._jwk_data)
+        else:
+            self._key = self.Algorithm.from_jwk(self._jwk_data)
+
+    @property
+    def key(self) -> Any:
+        key = self._key
+        if key is _UNSET:
+            with _key_lock:
+                key = self._key
+                if key is _UNSET:
+                    key = self._key = self.Algorithm.from_jwk(self._jwk_data)
+        return key
+
+    @key.setter
+    def key(self, value: Any) -> None:
+        self._key = value
 
     @staticmethod
     def from_dict(obj: JWKDict, algorithm: str | None = None) -> PyJWK:
@@ -91,9 +130,67 @@ class PyJWK:
         return self._jwk_data.get("use", None)
 
 
+def _check_oct_members(obj: JWKDict) -> None:
+    if obj.get("kty") != "oct":
+        raise InvalidKeyError("Not an HMAC key")
+    if "k" not in obj:
+        raise InvalidKeyError('oct key should have "k" parameter')
+
+
+def _check_rsa_members(obj: JWKDict) -> None:
+    if obj.get("kty") != "RSA":
+        raise InvalidKeyError("Not an RSA key")
+    if "n" not in obj or "e" not in obj:
+        raise InvalidKeyError("Not a public or private key")
+    if "d" not in obj:
+        return
+
+    if "oth" in obj:
+        raise InvalidKeyError("Unsupported RSA private key: > 2 primes not supported")
+    props_found = [prop in obj for prop in ("p", "q", "dp", "dq", "qi")]
+    if any(props_found) and not all(props_found):
+        raise InvalidKeyError(
+            "RSA key must include all parameters if any are present besides d"
+        )
+
+
+def _check_ec_members(obj: JWKDict) -> None:
+    if obj.get("kty") != "EC" or "x" not in obj or "y" not in obj:
+        raise InvalidKeyError("Not an Elliptic curve key")
+    curve = obj.get("crv")
+    if curve not in ("P-256", "P-384", "P-521", "secp256k1"):
+        raise InvalidKeyError(f"Invalid curve: {curve}")
+
+
+def _check_okp_members(obj: JWKDict) -> None:
+    if obj.get("kty") != "OKP":
+        raise InvalidKeyError("Not an Octet Key Pair")
+    curve = obj.get("crv")
+    if curve != "Ed25519" and curve != "Ed448":
+        raise InvalidKeyError(f"Invalid curve: {curve}")
+    if "x" not in obj:
+        raise InvalidKeyError('OKP should have "x" parameter')
+
+
+# The checks of each algorithm's from_jwk() that do not need the key
+# material, by algorithm class name. Keys of other algorithms are built
+# when the PyJWK is created.
+_MEMBER_CHECKS: dict[str, Callable[[JWKDict], None]] = {
+    "HMACAlgorithm": _check_oct_members,
+    "RSAAlgorithm": _check_rsa_members,
+    "RSAPSSAlgorithm": _check_rsa_members,
+    "ECAlgorithm": _check_ec_members,
+    "OKPAlgorithm": _check_okp_members,
+}
+
+
 class PyJWKSet:
     def __init__(self, keys: list[JWKDict]) -> None:
         self.keys = []
+        # Keys usable for verifying signatures, as PyJWKClient selects them.
+        self.signing_keys: list[PyJWK] = []
+        self._keys_by_kid: dict[Any, PyJWK] = {}
+        self._signing_keys_by_kid: dict[Any, PyJWK] = {}
 
         if not keys:
             raise PyJWKSetError("The JWK Set did not contain any keys")
@@ -101,20 +198,60 @@ class PyJWKSet:
         if not isinstance(keys, list):
             raise PyJWKSetError("Invalid JWK Set value")
 
+        candidates = []
         for key in keys:
             try:
-                self.keys.append(PyJWK(key))
+                candidates.append(PyJWK(key))
             except PyJWTError as error:
                 if isinstance(error, MissingCryptographyError):
                     raise error
                 # skip unusable keys
                 continue
 
+        kid_counts: dict[Any, int] = {}
+        for candidate in candidates:
+            try:
+                kid_counts[candidate.key_id] = kid_counts.get(candidate.key_id, 0) + 1
+            except TypeError:
+                continue
+
+        # Keys whose material is broken used to be skipped here. Build the keys
+        # that this still matters for: those sharing a kid, where a broken key
+        # must not shadow a later usable one, and keys up to the first usable
+        # one, so that a set without any usable key is still rejected.
+        found_usable = False
+        for candidate in candidates:
+            try:
+                shared_kid = kid_counts.get(candidate.key_id, 0) > 1
+            except TypeError:
+                shared_kid = False
+            if shared_kid or not found_usable:
+                try:
+                    candidate.key
+                except PyJWTError:
+                    continue
+                found_usable = True
+            self.keys.append(candidate)
+
         if len(self.keys) == 0:
             raise PyJWKSetError(
                 "The JWK Set did not contain any usable keys. Perhaps 'cryptography' is not installed?"
             )
 
+        for key in self.keys:
+            is_signing_key = key.public_key_use in ["sig", None] and key.key_id
+            if is_signing_key:
+                self.signing_keys.append(key)
+
+            # The first key with a given kid wins, as with a linear scan.
+            try:
+                self._keys_by_kid.setdefault(key.key_id, key)
+                if is_signing_key:
+                    self._signing_keys_by_kid.setdefault(key.key_id, key)
+            except TypeError:
+                # Unhashable kid values are not valid JWKs and cannot match.
+                continue
+
     @staticmethod
     def from_dict(obj: dict[str, Any]) -> PyJWKSet:
         keys = obj.get("keys", [])
@@ -126,10 +263,19 @@ class PyJWKSet:
         return PyJWKSet.from_dict(obj)
 
     def __getitem__(self, kid: str) -> PyJWK:
-        for key in self.keys:
-            if key.key_id == kid:
-                return key
-        raise KeyError(f"keyset has no key for kid: {kid}")
+        try:
+            return self._keys_by_kid[kid]
+        except (KeyError, TypeError):
+            raise KeyError(f"keyset has no key for kid: {kid}") from None
+
+    def find_signing_key(self, kid: str) -> PyJWK | None:
+        """
+        Returns the first key in ``signing_keys`` with the given kid, or None.
+        """
+        try:
+            return self._signing_keys_by_kid.get(kid)
+        except TypeError:
+            return None
 
 
 class PyJWTSetWithTimestamp:
@@ -1,24 +1,31 @@
 from __future__ import annotations
 
 import binascii
+import hmac
 import json
 import warnings
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from . import json_backend
 from .algorithms import (
     Algorithm,
-    get_default_algorithms,
-    has_crypto,
+    AlgorithmRegistry,
+    HMACAlgorithm,
+    _has_crypto,
+    default_algorithms,
     requires_cryptography,
 )
 from .api_jwk import PyJWK
+from .batch import imap_ordered
 from .exceptions import (
     DecodeError,
     InvalidAlgorithmError,
     InvalidSignatureError,
     InvalidTokenError,
 )
+from .lru import LRUCache
 from .utils import base64url_decode, base64url_encode
 from .warnings import RemovedInPyjwt3Warning
 
@@ -26,6 +33,38 @@ if TYPE_CHECKING:
     from .algorithms import AllowedPrivateKeys, AllowedPublicKeys
 
 
+# Parsed headers keyed by the PyJWS class, the JSON backend that parsed them
+# and their raw base64url segment. Hits skip the base64 decode, JSON parsing
+# and header validation.
+header_cache = LRUCache(maxsize=32)
+
+# Header segments longer than this are parsed every time instead of cached.
+MAX_CACHED_HEADER_SIZE = 1024
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Encoded header segments keyed by everything that goes into them, so that
+# repeated encode() calls with the same header skip JSON and base64 encoding.
+encoded_header_cache = LRUCache(maxsize=32)
+
+
+class _ParsedHeader(NamedTuple):
+    header: Mapping[str, Any]
+    valid_kid: bool
+    detached: bool
+    cacheable: bool
+
+
+class _Signing(NamedTuple):
+    header_prefix: bytes
+    algorithm: Algorithm
+    key: Any
+    is_payload_detached: bool
+    # An hmac object that has absorbed the key and header_prefix, copied for
+    # each payload instead of hashing them again.
+    mac_template: hmac.HMAC | None = None
+
+
 class PyJWS:
     header_typ = "JWT"
 
@@ -34,15 +73,13 @@ class PyJWS:
         algorithms: Sequence[str] | None = None,
         options: dict[str, Any] | None = None,
     ) -> None:
-        self._algorithms = get_default_algorithms()
         self._valid_algs = (
-            set(algorithms) if algorithms is not None else set(self._algorithms)
+            set(algorithms) if algorithms is not None else set(default_algorithms)
         )
 
-        # Remove algorithms that aren't on the whitelist
-        for key in list(self._algorithms.keys()):
-            if key not in self._valid_algs:
-                del self._algorithms[key]
+        # A view of the shared default algorithms limited to the whitelist;
+        # register_algorithm() and unregister_algorithm() only change the view.
+        self._algorithms = AlgorithmRegistry(self._valid_algs)
 
         if options is None:
             options = {}
@@ -96,7 +133,7 @@ class PyJWS:
         try:
             return self._algorithms[alg_name]
         except KeyError as e:
-            if not has_crypto and alg_name in requires_cryptography:
+            if alg_name in requires_cryptography and not _has_crypto():
                 raise NotImplementedError(
                     f"Algorithm '{alg_name}' could not be found. Do you have cryptography installed?"
                 ) from e
@@ -112,8 +149,6 @@ class PyJWS:
         is_payload_detached: bool = False,
         sort_headers: bool = True,
     ) -> str:
-        segments = []
-
         # declare a new var to narrow the type for type checkers
         if algorithm is None:
             if isinstance(key, PyJWK):
@@ -133,8 +168,85 @@ class PyJWS:
             if headers_b64 is False:
                 is_payload_detached = True
 
+        signing = self._prepare_signing(
+            key, algorithm_, headers, json_encoder, is_payload_detached, sort_headers
+        )
+        return self._encode_prepared(payload, signing)
+
+    def _prepare_signing(
+        self,
+        key: AllowedPrivateKeys | PyJWK | str | bytes,
+        algorithm: str,
+        headers: dict[str, Any] | None = None,
+        json_encoder: type[json.JSONEncoder] | None = None,
+        is_payload_detached: bool = False,
+        sort_headers: bool = True,
+    ) -> _Signing:
+        """
+        Returns everything needed to sign payloads with the given key and
+        header: the encoded header segment, the algorithm and prepared key.
+        """
+        header_segment = self._encode_header(
+            algorithm, headers, json_encoder, is_payload_detached, sort_headers
+        )
+
+        alg_obj = self.get_algorithm_by_name(algorithm)
+        if isinstance(key, PyJWK):
+            key = key.key
+        key = alg_obj.prepare_key(key)
+
+        return _Signing(header_segment + b".", alg_obj, key, is_payload_detached)
+
+    def _with_mac_template(self, signing: _Signing) -> _Signing:
+        """
+        Adds a ``mac_template`` to ``signing`` if its algorithm signs with
+        :meth:`HMACAlgorithm.sign`. Worth it for signers that are reused:
+        the header segment is only hashed once.
+        """
+        algorithm = signing.algorithm
+        if (
+            not isinstance(algorithm, HMACAlgorithm)
+            or type(algorithm).sign is not HMACAlgorithm.sign
+        ):
+            return signing
+
+        mac = algorithm.new_mac(signing.key)
+        mac.update(signing.header_prefix)
+        return signing._replace(mac_template=mac)
+
+    def _encode_header(
+        self,
+        algorithm: str,
+        headers: dict[str, Any] | None,
+        json_encoder: type[json.JSONEncoder] | None,
+        is_payload_detached: bool,
+        sort_headers: bool,
+    ) -> bytes:
+        cache_key = None
+        if headers is None or all(
+            type(name) is str and type(value) in _SCALAR_TYPES
+            for name, value in headers.items()
+        ):
+            # Value types are part of the key so that e.g. 1 and True, which
+            # compare equal, do not share an encoding.
+            cache_key = (
+                type(self),
+                algorithm,
+                self.header_typ,
+                tuple(
+                    (name, type(value), value)
+                    for name, value in (headers or {}).items()
+                ),
+                json_encoder,
+                is_payload_detached,
+                sort_headers,
+            )
+            cached = encoded_header_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Header
-        header: dict[str, Any] = {"typ": self.header_typ, "alg": algorithm_}
+        header: dict[str, Any] = {"typ": self.header_typ, "alg": algorithm}
 
         if headers:
             self._validate_headers(headers)
@@ -149,33 +261,36 @@ class PyJWS:
             # True is the standard value for b64, so no need for it
             del header["b64"]
 
-        json_header = json.dumps(
-            header, separators=(",", ":"), cls=json_encoder, sort_keys=sort_headers
-        ).encode()
+        json_header = json_backend.dumps(
+            header, cls=json_encoder, sort_keys=sort_headers
+        )
+        header_segment = base64url_encode(json_header)
 
-        segments.append(base64url_encode(json_header))
+        if cache_key is not None:
+            encoded_header_cache.put(cache_key, header_segment)
+        return header_segment
 
-        if is_payload_detached:
+    def _encode_prepared(self, payload: bytes, signing: _Signing) -> str:
+        if signing.is_payload_detached:
             msg_payload = payload
         else:
             msg_payload = base64url_encode(payload)
-        segments.append(msg_payload)
-
-        # Segments
-        signing_input = b".".join(segments)
-
-        alg_obj = self.get_algorithm_by_name(algorithm_)
-        if isinstance(key, PyJWK):
-            key = key.key
-        key = alg_obj.prepare_key(key)
-        signature = alg_obj.sign(signing_input, key)
 
-        segments.append(base64url_encode(signature))
+        if signing.mac_template is not None:
+            mac = signing.mac_template.copy()
+            mac.update(msg_payload)
+            signature = mac.digest()
+        else:
+            signing_input = signing.header_prefix + msg_payload
+            signature = signing.algorithm.sign(signing_input, signing.key)
 
         # Don't put the payload content inside the encoded token when detached
-        if is_payload_detached:
-            segments[1] = b""
-        encoded_string = b".".join(segments)
+        if signing.is_payload_detached:
+            encoded_string = signing.header_prefix + b"." + base64url_encode(signature)
+        else:
+            encoded_string = (
+                signing.header_prefix + msg_payload + b"." + base64url_encode(signature)
+            )
 
         return encoded_string.decode("utf-8")
 
@@ -196,34 +311,8 @@ class PyJWS:
                 RemovedInPyjwt3Warning,
                 stacklevel=2,
             )
-        if options is None:
-            options = {}
-        merged_options = {**self.options, **options}
-        verify_signature = merged_options["verify_signature"]
-
-        if verify_signature and not algorithms and not isinstance(key, PyJWK):
-            raise DecodeError(
-                'It is required that you pass in a value for the "algorithms" argument when calling decode().'
-            )
-
-        payload, signing_input, header, signature = self._load(jwt)
-
-        if header.get("b64", True) is False:
-            if detached_payload is None:
-                raise DecodeError(
-                    'It is required that you pass in a value for the "detached_payload" argument to decode a message having the b64 header set to false.'
-                )
-            payload = detached_payload
-            signing_input = b".".join([signing_input.rsplit(b".", 1)[0], payload])
-
-        if verify_signature:
-            self._verify_signature(signing_input, header, signature, key, algorithms)
-
-        return {
-            "payload": payload,
-            "header": header,
-            "signature": signature,
-        }
+        signature_check = self._prepare_signature_check(key, algorithms, options)
+        return self._decode_prepared(jwt, signature_check, detached_payload)
 
     def decode(
         self,
@@ -247,18 +336,48 @@ class PyJWS:
         )
         return decoded["payload"]
 
+    def decode_many(
+        self,
+        jwts: Iterable[str | bytes],
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Decodes a stream of tokens with a shared key, algorithm allow-list
+        and options, yielding each payload in input order.
+
+        A token that fails to decode yields its exception instead of raising
+        it. ``max_workers`` spreads the work across a thread pool; ``hmac``
+        and ``cryptography`` release the GIL while checking signatures.
+        """
+        signature_check = self._prepare_signature_check(key, algorithms, options)
+
+        def decode_one(jwt: str | bytes) -> Any:
+            return self._decode_prepared(jwt, signature_check)["payload"]
+
+        return imap_ordered(decode_one, jwts, max_workers)
+
     def get_unverified_header(self, jwt: str | bytes) -> dict[str, Any]:
         """Returns back the JWT header parameters as a dict()
 
         Note: The signature is not verified so the header parameters
         should not be fully trusted until signature verification is complete
         """
-        headers = self._load(jwt)[2]
-        self._validate_headers(headers)
+        parsed = self._load_parsed(jwt)[2]
+        if not parsed.valid_kid:
+            self._validate_kid(parsed.header["kid"])
 
-        return headers
+        return dict(parsed.header)
 
     def _load(self, jwt: str | bytes) -> tuple[bytes, bytes, dict[str, Any], bytes]:
+        payload, signing_input, parsed, signature = self._load_parsed(jwt)
+        return (payload, signing_input, dict(parsed.header), signature)
+
+    def _load_parsed(
+        self, jwt: str | bytes
+    ) -> tuple[bytes, bytes, _ParsedHeader, bytes]:
         if isinstance(jwt, str):
             jwt = jwt.encode("utf-8")
 
@@ -271,30 +390,113 @@ class PyJWS:
         except ValueError as err:
             raise DecodeError("Not enough segments") from err
 
+        # Tokens from the same issuer usually share one header segment.
+        cache_key = (type(self), json_backend.get_backend(), header_segment)
+        parsed = header_cache.get(cache_key)
+        if parsed is None:
+            parsed = self._parse_header(header_segment)
+            if parsed.cacheable and len(header_segment) <= MAX_CACHED_HEADER_SIZE:
+                header_cache.put(cache_key, parsed)
+
+        try:
+            payload = base64url_decode(payload_segment)
+        except (TypeError, binascii.Error) as err:
+            raise DecodeError("Invalid payload padding") from err
+
+        try:
+            signature = base64url_decode(crypto_segment)
+        except (TypeError, binascii.Error) as err:
+            raise DecodeError("Invalid crypto padding") from err
+
+        return (payload, signing_input, parsed, signature)
+
+    def _parse_header(self, header_segment: bytes) -> _ParsedHeader:
         try:
             header_data = base64url_decode(header_segment)
         except (TypeError, binascii.Error) as err:
             raise DecodeError("Invalid header padding") from err
 
         try:
-            header = json.loads(header_data)
+            header = json_backend.loads(header_data)
         except ValueError as e:
             raise DecodeError(f"Invalid header string: {e}") from e
 
         if not isinstance(header, dict):
             raise DecodeError("Invalid header string: must be a json object")
 
-        try:
-            payload = base64url_decode(payload_segment)
-        except (TypeError, binascii.Error) as err:
-            raise DecodeError("Invalid payload padding") from err
+        return _ParsedHeader(
+            header=MappingProxyType(header),
+            valid_kid="kid" not in header or isinstance(header["kid"], str),
+            detached=header.get("b64", True) is False,
+            # Only flat headers are shared: callers get a shallow copy and
+            # could otherwise mutate nested values held by the cache.
+            cacheable=all(
+                isinstance(value, _SCALAR_TYPES) for value in header.values()
+            ),
+        )
 
-        try:
-            signature = base64url_decode(crypto_segment)
-        except (TypeError, binascii.Error) as err:
-            raise DecodeError("Invalid crypto padding") from err
+    def _prepare_signature_check(
+        self,
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> _SignatureCheck | None:
+        """
+        Returns the signature check to run for the given options, or None
+        when signature verification is disabled.
+        """
+        if options is None:
+            options = {}
+        merged_options = {**self.options, **options}
 
-        return (payload, signing_input, header, signature)
+        if not merged_options["verify_signature"]:
+            return None
+
+        if not algorithms and not isinstance(key, PyJWK):
+            raise DecodeError(
+                'It is required that you pass in a value for the "algorithms" argument when calling decode().'
+            )
+
+        return _SignatureCheck(self, key, algorithms)
+
+    def _decode_prepared(
+        self,
+        jwt: str | bytes,
+        signature_check: _SignatureCheck | None,
+        detached_payload: bytes | None = None,
+    ) -> dict[str, Any]:
+        decoded, signing_input = self._load_decoded(jwt, detached_payload)
+        if signature_check is not None:
+            signature_check(signing_input, decoded["header"], decoded["signature"])
+
+        return decoded
+
+    def _load_decoded(
+        self,
+        jwt: str | bytes,
+        detached_payload: bytes | None = None,
+    ) -> tuple[dict[str, Any], bytes]:
+        """
+        Returns the decoded token and its signing input, without checking
+        the signature.
+        """
+        payload, signing_input, parsed, signature = self._load_parsed(jwt)
+        header = dict(parsed.header)
+
+        if parsed.detached:
+            if detached_payload is None:
+                raise DecodeError(
+                    'It is required that you pass in a value for the "detached_payload" argument to decode a message having the b64 header set to false.'
+                )
+            payload = detached_payload
+            signing_input = b".".join([signing_input.rsplit(b".", 1)[0], payload])
+
+        decoded = {
+            "payload": payload,
+            "header": header,
+            "signature": signature,
+        }
+        return decoded, signing_input
 
     def _verify_signature(
         self,
@@ -303,43 +505,106 @@ class PyJWS:
         signature: bytes,
         key: AllowedPublicKeys | PyJWK | str | bytes = "",
         algorithms: Sequence[str] | None = None,
+    ) -> None:
+        _SignatureCheck(self, key, algorithms)(signing_input, header, signature)
+
+    def _validate_headers(self, headers: dict[str, Any]) -> None:
+        if "kid" in headers:
+            self._validate_kid(headers["kid"])
+
+    def _validate_kid(self, kid: Any) -> None:
+        if not isinstance(kid, str):
+            raise InvalidTokenError("Key ID header parameter must be a string")
+
+
+class _SignatureCheck:
+    """
+    Verifies signatures for a fixed key and algorithm allow-list.
+
+    The key is prepared at most once per algorithm and reused for every
+    token checked through the same instance. For HMAC algorithms the
+    instance also keeps an ``hmac`` object that has absorbed the key, which
+    each signature check copies.
+    """
+
+    def __init__(
+        self,
+        jws: PyJWS,
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
     ) -> None:
         if algorithms is None and isinstance(key, PyJWK):
             algorithms = [key.algorithm_name]
+        self._jws = jws
+        self._key = key
+        self._algorithms = algorithms
+        self._prepared: dict[str, tuple[Algorithm, Any, hmac.HMAC | None]] = {}
+
+    def __call__(
+        self, signing_input: bytes, header: dict[str, Any], signature: bytes
+    ) -> None:
+        alg_obj, prepared_key, mac_template = self.resolve(header)
+        if mac_template is not None:
+            mac = mac_template.copy()
+            mac.update(signing_input)
+            valid = hmac.compare_digest(signature, mac.digest())
+        else:
+            valid = alg_obj.verify(signing_input, prepared_key, signature)
+
+        if not valid:
+            raise InvalidSignatureError("Signature verification failed")
+
+    def resolve(
+        self, header: dict[str, Any]
+    ) -> tuple[Algorithm, Any, hmac.HMAC | None]:
+        """
+        Returns the algorithm, prepared key and HMAC template (if any) to
+        check a token with ``header``, raising if its alg is missing or not
+        allowed.
+        """
         try:
             alg = header["alg"]
         except KeyError:
             raise InvalidAlgorithmError("Algorithm not specified") from None
 
-        if not alg or (algorithms is not None and alg not in algorithms):
+        if not alg or (self._algorithms is not None and alg not in self._algorithms):
             raise InvalidAlgorithmError("The specified alg value is not allowed")
 
+        try:
+            return self._prepared[alg]
+        except KeyError:
+            return self._prepare(alg)
+
+    def _prepare(self, alg: str) -> tuple[Algorithm, Any, hmac.HMAC | None]:
+        key = self._key
         if isinstance(key, PyJWK):
-            alg_obj = key.Algorithm
-            prepared_key = key.key
+            alg_obj, prepared_key = key.Algorithm, key.key
         else:
             try:
-                alg_obj = self.get_algorithm_by_name(alg)
+                alg_obj = self._jws.get_algorithm_by_name(alg)
             except NotImplementedError as e:
                 raise InvalidAlgorithmError("Algorithm not supported") from e
             prepared_key = alg_obj.prepare_key(key)
 
-        if not alg_obj.verify(signing_input, prepared_key, signature):
-            raise InvalidSignatureError("Signature verification failed")
-
-    def _validate_headers(self, headers: dict[str, Any]) -> None:
-        if "kid" in headers:
-            self._validate_kid(headers["kid"])
+        mac_template = None
+        if (
+            isinstance(alg_obj, HMACAlgorithm)
+            and type(alg_obj).verify is HMACAlgorithm.verify
+            and type(alg_obj).sign is HMACAlgorithm.sign
+            and type(prepared_key) is bytes
+        ):
+            mac_template = alg_obj.new_mac(prepared_key)
 
-    def _validate_kid(self, kid: Any) -> None:
-        if not isinstance(kid, str):
-            raise InvalidTokenError("Key ID header parameter must be a string")
+        prepared = (alg_obj, prepared_key, mac_template)
+        self._prepared[alg] = prepared
+        return prepared
 
 
 _jws_global_obj = PyJWS()
 encode = _jws_global_obj.encode
 decode_complete = _jws_global_obj.decode_complete
 decode = _jws_global_obj.decode
+decode_many = _jws_global_obj.decode_many
 register_algorithm = _jws_global_obj.register_algorithm
 unregister_algorithm = _jws_global_obj.unregister_algorithm
 get_algorithm_by_name = _jws_global_obj.get_algorithm_by_name
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
+import time
 import warnings
 from calendar import timegm
-from collections.abc import Iterable, Sequence
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from . import api_jws
+from . import api_jws, json_backend
+from .batch import imap_chunks_in_processes, imap_ordered
 from .exceptions import (
     DecodeError,
     ExpiredSignatureError,
@@ -16,21 +19,46 @@ from .exceptions import (
     InvalidIssuedAtError,
     InvalidIssuerError,
     InvalidJTIError,
+    InvalidSignatureError,
     InvalidSubjectError,
     MissingRequiredClaimError,
+    PyJWTError,
 )
+from .lru import LRUCache
 from .warnings import RemovedInPyjwt3Warning
 
+from .api_jwk import PyJWK
+
 if TYPE_CHECKING:
-    from .algorithms import AllowedPrivateKeys, AllowedPublicKeys
-    from .api_jwk import PyJWK
+    from .algorithms import Algorithm, AllowedPrivateKeys, AllowedPublicKeys
+    from .token_cache import VerifiedTokenCache
+    from .verification import VerificationEngine
+
+
+# Claim plans keyed by the PyJWT class and the options and expectations they
+# were compiled from, so that decode() calls with the same arguments skip
+# compiling one. Plans do not hold the instance or the options dict, so the
+# cache keeps neither alive and serves every instance.
+claim_plan_cache = LRUCache(maxsize=32)
+
+# Audience and issuer types that can be part of a claim_plan_cache key.
+_CACHEABLE_TYPES = (str, list, tuple, frozenset, type(None))
 
 
 class PyJWT:
-    def __init__(self, options: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        options: dict[str, Any] | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """
+        ``clock`` returns the current POSIX timestamp used for the exp, nbf
+        and iat checks. It defaults to :func:`time.time`.
+        """
         if options is None:
             options = {}
         self.options: dict[str, Any] = {**self._get_default_options(), **options}
+        self.clock = clock
 
     @staticmethod
     def _get_default_options() -> dict[str, bool | list[str]]:
@@ -55,6 +83,66 @@ class PyJWT:
         json_encoder: type[json.JSONEncoder] | None = None,
         sort_headers: bool = True,
     ) -> str:
+        json_payload = self._encode_claims(payload, headers, json_encoder)
+
+        return api_jws.encode(
+            json_payload,
+            key,
+            algorithm,
+            headers,
+            json_encoder,
+            sort_headers=sort_headers,
+        )
+
+    def encode_many(
+        self,
+        payloads: Iterable[dict[str, Any]],
+        key: AllowedPrivateKeys | PyJWK | str | bytes,
+        algorithm: str | None = None,
+        headers: dict[str, Any] | None = None,
+        json_encoder: type[json.JSONEncoder] | None = None,
+        sort_headers: bool = True,
+        processes: int | None = None,
+        chunksize: int = 256,
+    ) -> Iterator[str]:
+        """
+        Encodes a stream of payloads with shared arguments, yielding each
+        token in input order. Tokens are identical to ``encode()`` with the
+        same arguments.
+
+        The key is prepared and the header encoded once for the whole batch
+        (see :class:`Signer`). With ``processes`` greater than 1, payloads are
+        sent to a process pool in chunks of ``chunksize``, and each worker
+        builds its own Signer once; this instance, the key and the other
+        arguments must then be picklable. Only a bounded number of chunks is
+        read ahead of the consumer, so ``payloads`` can be an arbitrarily long
+        iterator. An exception raised for a payload ends the stream.
+        """
+        signer_kwargs: dict[str, Any] = {
+            "headers": headers,
+            "json_encoder": json_encoder,
+            "sort_headers": sort_headers,
+        }
+        # Built even when the workers sign, so that bad arguments fail here.
+        signer = Signer(key, algorithm, jwt_obj=self, **signer_kwargs)
+        if not processes or processes <= 1:
+            return signer.encode_many(payloads)
+
+        return imap_chunks_in_processes(
+            _encode_chunk,
+            payloads,
+            processes,
+            chunksize,
+            initializer=_init_encode_worker,
+            initargs=(self, key, algorithm, signer_kwargs),
+        )
+
+    def _encode_claims(
+        self,
+        payload: dict[str, Any],
+        headers: dict[str, Any] | None = None,
+        json_encoder: type[json.JSONEncoder] | None = None,
+    ) -> bytes:
         # Check that we get a dict
         if not isinstance(payload, dict):
             raise TypeError(
@@ -69,21 +157,12 @@ class PyJWT:
             if isinstance(payload.get(time_claim), datetime):
                 payload[time_claim] = timegm(payload[time_claim].utctimetuple())
 
-        json_payload = self._encode_payload(
+        return self._encode_payload(
             payload,
             headers=headers,
             json_encoder=json_encoder,
         )
 
-        return api_jws.encode(
-            json_payload,
-            key,
-            algorithm,
-            headers,
-            json_encoder,
-            sort_headers=sort_headers,
-        )
-
     def _encode_payload(
         self,
         payload: dict[str, Any],
@@ -96,11 +175,7 @@ class PyJWT:
         This method is intended to be overridden by subclasses that need to
         encode the payload in a different way, e.g. compress the payload.
         """
-        return json.dumps(
-            payload,
-            separators=(",", ":"),
-            cls=json_encoder,
-        ).encode("utf-8")
+        return json_backend.dumps(payload, cls=json_encoder)
 
     def decode_complete(
         self,
@@ -185,7 +260,7 @@ class PyJWT:
         payloads.
         """
         try:
-            payload = json.loads(decoded["payload"])
+            payload = json_backend.loads(decoded["payload"])
         except ValueError as e:
             raise DecodeError(f"Invalid payload string: {e}") from e
         if not isinstance(payload, dict):
@@ -233,47 +308,139 @@ class PyJWT:
         )
         return decoded["payload"]
 
-    def _validate_claims(
+    def decode_many(
+        self,
+        jwts: Iterable[str | bytes],
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+        audience: str | Iterable[str] | None = None,
+        issuer: str | Sequence[str] | None = None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+        max_workers: int | None = None,
+        engine: VerificationEngine | None = None,
+    ) -> Iterator[Any]:
+        """
+        Decodes a stream of tokens with shared arguments, yielding each
+        payload in input order.
+
+        The key, options and claim checks are prepared once for the whole
+        batch (see :meth:`compile`). A token that fails validation yields its
+        exception instead of raising it. ``max_workers`` spreads the work
+        across a thread pool; ``hmac`` and ``cryptography`` release the GIL
+        while checking signatures. With an ``engine``, signatures are checked
+        by the :class:`~jwt.VerificationEngine` instead, with its key, which
+        ``key`` defaults to.
+        """
+        if engine is not None:
+            if isinstance(key, str) and not key:
+                key = engine.key
+            elif not engine.holds_key(key):
+                raise ValueError("key must be the key of the engine")
+
+        verifier = self.compile(
+            key,
+            algorithms,
+            options,
+            audience=audience,
+            issuer=issuer,
+            subject=subject,
+            leeway=leeway,
+        )
+        return verifier.decode_many(jwts, max_workers=max_workers, engine=engine)
+
+    def compile(
+        self,
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
+        options: dict[str, Any] | None = None,
+        audience: str | Iterable[str] | None = None,
+        issuer: str | Sequence[str] | None = None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+    ) -> Verifier:
+        """
+        Returns a :class:`Verifier` bound to this instance that decodes tokens
+        with a fixed key, algorithm allow-list, options and claim expectations.
+        """
+        return Verifier(
+            key,
+            algorithms,
+            options=options,
+            audience=audience,
+            issuer=issuer,
+            subject=subject,
+            leeway=leeway,
+            jwt_obj=self,
+        )
+
+    def _compile_claim_checks(
         self,
-        payload: dict[str, Any],
         options: dict[str, Any],
         audience=None,
         issuer=None,
         subject: str | None = None,
         leeway: float | timedelta = 0,
-    ) -> None:
-        if isinstance(leeway, timedelta):
-            leeway = leeway.total_seconds()
-
+        clock: Callable[[], float] | None = None,
+    ) -> _ClaimPlan:
+        """
+        Resolves the claim checks for the given options and expectations into
+        a :class:`_ClaimPlan`.
+        """
         if audience is not None and not isinstance(audience, (str, Iterable)):
             raise TypeError("audience must be a string, iterable or None")
 
-        self._validate_required_claims(payload, options)
-
-        now = datetime.now(tz=timezone.utc).timestamp()
-
-        if "iat" in payload and options["verify_iat"]:
-            self._validate_iat(payload, now, leeway)
-
-        if "nbf" in payload and options["verify_nbf"]:
-            self._validate_nbf(payload, now, leeway)
-
-        if "exp" in payload and options["verify_exp"]:
-            self._validate_exp(payload, now, leeway)
+        return _ClaimPlan(options, audience, issuer, subject, leeway, clock)
 
-        if options["verify_iss"]:
-            self._validate_iss(payload, issuer)
+    def _validate_claims(
+        self,
+        payload: dict[str, Any],
+        options: dict[str, Any],
+        audience=None,
+        issuer=None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+    ) -> None:
+        plan = None
+        cache_key: Any = None
+        if isinstance(audience, _CACHEABLE_TYPES) and isinstance(
+            issuer, _CACHEABLE_TYPES
+        ):
+            try:
+                cache_key = (
+                    type(self),
+                    tuple(options["require"]),
+                    options["verify_iat"],
+                    options["verify_nbf"],
+                    options["verify_exp"],
+                    options["verify_iss"],
+                    options["verify_aud"],
+                    options["verify_sub"],
+                    options["verify_jti"],
+                    options.get("strict_aud", False),
+                    tuple(audience) if isinstance(audience, list) else audience,
+                    tuple(issuer) if isinstance(issuer, list) else issuer,
+                    subject,
+                    leeway,
+                )
+                plan = claim_plan_cache.get(cache_key)
+            except TypeError:
+                # Unhashable arguments are resolved on every call.
+                cache_key = None
 
-        if options["verify_aud"]:
-            self._validate_aud(
-                payload, audience, strict=options.get("strict_aud", False)
+        if plan is None:
+            plan = self._compile_claim_checks(
+                options,
+                audience=audience,
+                issuer=issuer,
+                subject=subject,
+                leeway=leeway,
             )
+            if cache_key is not None:
+                claim_plan_cache.put(cache_key, plan)
 
-        if options["verify_sub"]:
-            self._validate_sub(payload, subject)
-
-        if options["verify_jti"]:
-            self._validate_jti(payload)
+        plan.validate(payload, self, options)
 
     def _validate_required_claims(
         self,
@@ -403,13 +570,18 @@ class PyJWT:
             audience_claims = [audience_claims]
         if not isinstance(audience_claims, list):
             raise InvalidAudienceError("Invalid claim format in token")
-        if any(not isinstance(c, str) for c in audience_claims):
-            raise InvalidAudienceError("Invalid claim format in token")
+        for claim in audience_claims:
+            if not isinstance(claim, str):
+                raise InvalidAudienceError("Invalid claim format in token")
 
         if isinstance(audience, str):
-            audience = [audience]
+            matched = audience in audience_claims
+        elif isinstance(audience, frozenset):
+            matched = not audience.isdisjoint(audience_claims)
+        else:
+            matched = any(aud in audience_claims for aud in audience)
 
-        if all(aud not in audience_claims for aud in audience):
+        if not matched:
             raise InvalidAudienceError("Audience doesn't match")
 
     def _validate_iss(self, payload: dict[str, Any], issuer: Any) -> None:
@@ -423,11 +595,432 @@ class PyJWT:
             if payload["iss"] != issuer:
                 raise InvalidIssuerError("Invalid issuer")
         else:
-            if payload["iss"] not in issuer:
+            try:
+                valid = payload["iss"] in issuer
+            except TypeError:
+                # An unhashable claim cannot be in a frozenset of issuers.
+                valid = False
+            if not valid:
                 raise InvalidIssuerError("Invalid issuer")
 
 
+class _ClaimPlan:
+    """
+    The claim checks for one set of options, audience, issuer, subject and
+    leeway, resolved into a tuple of bound
+    ``check(jwt_obj, payload, options, now)`` methods.
+
+    Everything that does not depend on the token is worked out here: the
+    leeway is converted to seconds, audiences and issuers are stored as
+    frozensets, and disabled checks are left out, so :meth:`validate` only
+    reads the clock (when a time claim is checked) and runs the enabled
+    checks. The checks call the ``_validate_*`` methods of the PyJWT
+    instance passed to :meth:`validate`, so subclasses that override them
+    keep working and one plan can serve any instance.
+    """
+
+    __slots__ = (
+        "checks",
+        "needs_now",
+        "clock",
+        "_audience",
+        "_issuer",
+        "_subject",
+        "_leeway",
+        "_strict_aud",
+    )
+
+    def __init__(
+        self,
+        options: dict[str, Any],
+        audience: str | Iterable[str] | None = None,
+        issuer: str | Sequence[str] | None = None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+
+        self._audience = _as_frozenset(audience)
+        self._issuer = _as_frozenset(issuer)
+        self._subject = subject
+        self._leeway = leeway
+        self._strict_aud = options.get("strict_aud", False)
+        self.clock = clock
+
+        # Same order as the checks have always run in.
+        checks: list[Callable[..., None]] = []
+        if options["require"]:
+            checks.append(self._check_required)
+        if options["verify_iat"]:
+            checks.append(self._check_iat)
+        if options["verify_nbf"]:
+            checks.append(self._check_nbf)
+        if options["verify_exp"]:
+            checks.append(self._check_exp)
+        if options["verify_iss"] and issuer is not None:
+            checks.append(self._check_iss)
+        if options["verify_aud"]:
+            checks.append(self._check_aud)
+        if options["verify_sub"]:
+            checks.append(self._check_sub)
+        if options["verify_jti"]:
+            checks.append(self._check_jti)
+
+        self.checks = tuple(checks)
+        self.needs_now = bool(
+            options["verify_iat"] or options["verify_nbf"] or options["verify_exp"]
+        )
+
+    def validate(
+        self, payload: dict[str, Any], jwt_obj: PyJWT, options: dict[str, Any]
+    ) -> None:
+        """
+        Runs the checks against ``payload`` with the ``_validate_*`` methods
+        and clock of ``jwt_obj``. ``options`` are the merged options the plan
+        was compiled from, passed on to ``_validate_required_claims``.
+        """
+        if self.needs_now:
+            clock = self.clock if self.clock is not None else jwt_obj.clock
+            now = clock() if clock is not None else time.time()
+        else:
+            now = 0.0
+
+        for check in self.checks:
+            check(jwt_obj, payload, options, now)
+
+    def _check_required(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        jwt_obj._validate_required_claims(payload, options)
+
+    def _check_iat(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        if "iat" in payload:
+            jwt_obj._validate_iat(payload, now, self._leeway)
+
+    def _check_nbf(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        if "nbf" in payload:
+            jwt_obj._validate_nbf(payload, now, self._leeway)
+
+    def _check_exp(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        if "exp" in payload:
+            jwt_obj._validate_exp(payload, now, self._leeway)
+
+    def _check_iss(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        jwt_obj._validate_iss(payload, self._issuer)
+
+    def _check_aud(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        jwt_obj._validate_aud(payload, self._audience, strict=self._strict_aud)
+
+    def _check_sub(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        jwt_obj._validate_sub(payload, self._subject)
+
+    def _check_jti(
+        self, jwt_obj: PyJWT, payload: dict[str, Any], options: Any, now: float
+    ) -> None:
+        jwt_obj._validate_jti(payload)
+
+
+def _as_frozenset(values: Any) -> Any:
+    # Strings, None and iterables of unhashable values are kept as they are.
+    if values is None or isinstance(values, (str, frozenset)):
+        return values
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
+
+
+class Verifier:
+    """
+    Decodes JWTs with a fixed key, algorithm allow-list, options and claim
+    expectations.
+
+    Everything :meth:`PyJWT.decode` works out per call (merged options, the
+    prepared key, which claim checks apply) is resolved once here, so each
+    token only pays for parsing, the signature check and the enabled claim
+    checks. Payloads and exceptions are the same as ``decode()`` with the same
+    arguments.
+
+    Example usage:
+
+    >>> verifier = jwt.Verifier(secret, algorithms=["HS256"])
+    >>> verifier.decode(token)
+
+    Pass a :class:`~jwt.token_cache.VerifiedTokenCache` as ``cache`` to skip
+    verification entirely for tokens this verifier accepted recently, and a
+    ``clock`` returning a POSIX timestamp to check time claims against
+    something other than :func:`time.time`.
+    """
+
+    def __init__(
+        self,
+        key: AllowedPublicKeys | PyJWK | str | bytes = "",
+        algorithms: Sequence[str] | None = None,
+        *,
+        options: dict[str, Any] | None = None,
+        audience: str | Iterable[str] | None = None,
+        issuer: str | Sequence[str] | None = None,
+        subject: str | None = None,
+        leeway: float | timedelta = 0,
+        cache: VerifiedTokenCache | None = None,
+        clock: Callable[[], float] | None = None,
+        jwt_obj: PyJWT | None = None,
+    ) -> None:
+        if jwt_obj is None:
+            jwt_obj = _jwt_global_obj
+        self._jwt = jwt_obj
+        self._jws = api_jws._jws_global_obj
+        self._key = key
+        self.cache = cache
+
+        options = dict(options or {})
+        options.setdefault("verify_signature", True)
+
+        if not options["verify_signature"]:
+            options.setdefault("verify_exp", False)
+            options.setdefault("verify_nbf", False)
+            options.setdefault("verify_iat", False)
+            options.setdefault("verify_aud", False)
+            options.setdefault("verify_iss", False)
+            options.setdefault("verify_sub", False)
+            options.setdefault("verify_jti", False)
+
+        self._signature_check = self._jws._prepare_signature_check(
+            key, algorithms, options
+        )
+
+        self.options: dict[str, Any] = {**jwt_obj.options, **options}
+        self._claim_plan = jwt_obj._compile_claim_checks(
+            self.options,
+            audience=audience,
+            issuer=issuer,
+            subject=subject,
+            leeway=leeway,
+            clock=clock,
+        )
+
+    def decode_complete(
+        self,
+        jwt: str | bytes,
+        detached_payload: bytes | None = None,
+    ) -> dict[str, Any]:
+        cache_key = None
+        if self.cache is not None and detached_payload is None:
+            cache_key = self.cache.token_key(jwt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        decoded = self._jws._decode_prepared(
+            jwt, self._signature_check, detached_payload
+        )
+        return self._finish(jwt, decoded, cache_key)
+
+    def decode(
+        self,
+        jwt: str | bytes,
+        detached_payload: bytes | None = None,
+    ) -> Any:
+        return self.decode_complete(jwt, detached_payload)["payload"]
+
+    def decode_many(
+        self,
+        jwts: Iterable[str | bytes],
+        max_workers: int | None = None,
+        engine: VerificationEngine | None = None,
+    ) -> Iterator[Any]:
+        """
+        Decodes a stream of tokens, yielding each payload in input order, or
+        the exception of a token that fails validation.
+
+        ``max_workers`` spreads the work across a thread pool. With an
+        ``engine``, tokens are parsed and their claims checked on the calling
+        thread while the engine checks the signatures with the algorithm this
+        verifier resolves for each token. The engine must hold a key equal to
+        the one this verifier was created with, or :class:`ValueError` is
+        raised.
+        """
+        if engine is not None and not engine.holds_key(self._key):
+            raise ValueError("engine must hold the key of the verifier")
+
+        signature_check = self._signature_check
+        if engine is None or signature_check is None:
+            return imap_ordered(self.decode, jwts, max_workers)
+        return self._decode_on_engine(jwts, engine, signature_check)
+
+    def _decode_on_engine(
+        self,
+        jwts: Iterable[str | bytes],
+        engine: VerificationEngine,
+        signature_check: api_jws._SignatureCheck,
+    ) -> Iterator[Any]:
+        # Tokens waiting for their signature check, in input order, as
+        # (jwt, cache key, decoded). Tokens that are already done are queued
+        # as (result, None, None) so that they are yielded in place.
+        pending: deque[tuple[Any, Any, dict[str, Any] | None]] = deque()
+
+        def signature_jobs() -> Iterator[tuple[Algorithm, bytes, bytes]]:
+            for jwt in jwts:
+                cache_key = None
+                if self.cache is not None:
+                    cache_key = self.cache.token_key(jwt)
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        pending.append((cached["payload"], None, None))
+                        continue
+
+                # Resolving prepares the key here too, so a key that does not
+                # suit the token's algorithm fails this token only.
+                try:
+                    decoded, signing_input = self._jws._load_decoded(jwt)
+                    alg_obj = signature_check.resolve(decoded["header"])[0]
+                except PyJWTError as e:
+                    pending.append((e, None, None))
+                    continue
+
+                pending.append((jwt, cache_key, decoded))
+                yield (alg_obj, signing_input, decoded["signature"])
+
+        for valid in engine.verify_many(signature_jobs()):
+            jwt, cache_key, decoded = pending.popleft()
+            while decoded is None:
+                yield jwt
+                jwt, cache_key, decoded = pending.popleft()
+
+            if isinstance(valid, PyJWTError):
+                yield valid
+                continue
+            if not valid:
+                yield InvalidSignatureError("Signature verification failed")
+                continue
+
+            try:
+                yield self._finish(jwt, decoded, cache_key)["payload"]
+            except PyJWTError as e:
+                yield e
+
+        while pending:
+            yield pending.popleft()[0]
+
+    def _finish(
+        self, jwt: str | bytes, decoded: dict[str, Any], cache_key: Any
+    ) -> dict[str, Any]:
+        raw_payload_size = len(decoded["payload"])
+        payload = self._jwt._decode_payload(decoded)
+
+        self._claim_plan.validate(payload, self._jwt, self.options)
+
+        decoded["payload"] = payload
+        if cache_key is not None and self.cache is not None:
+            self.cache.put(cache_key, decoded, len(jwt) + raw_payload_size)
+        return decoded
+
+
+class Signer:
+    """
+    Encodes JWTs with a fixed key, algorithm and header.
+
+    The key is prepared and the header segment encoded once here, so each
+    token only pays for serializing its payload and the signature. For HMAC
+    algorithms the key and header are absorbed into an ``hmac`` object once,
+    which each token copies. Tokens are identical to ``encode()`` with the
+    same arguments.
+
+    Example usage:
+
+    >>> signer = jwt.Signer(secret, algorithm="HS256")
+    >>> signer.encode({"some": "payload"})
+    """
+
+    def __init__(
+        self,
+        key: AllowedPrivateKeys | PyJWK | str | bytes,
+        algorithm: str | None = None,
+        *,
+        headers: dict[str, Any] | None = None,
+        json_encoder: type[json.JSONEncoder] | None = None,
+        sort_headers: bool = True,
+        jwt_obj: PyJWT | None = None,
+    ) -> None:
+        if jwt_obj is None:
+            jwt_obj = _jwt_global_obj
+        self._jwt = jwt_obj
+        self._jws = api_jws._jws_global_obj
+        self._headers = dict(headers) if headers else None
+        self._json_encoder = json_encoder
+
+        if algorithm is None:
+            if isinstance(key, PyJWK):
+                algorithm = key.algorithm_name
+            else:
+                algorithm = "HS256"
+
+        is_payload_detached = False
+        if headers:
+            if headers.get("alg"):
+                algorithm = headers["alg"]
+            if headers.get("b64") is False:
+                is_payload_detached = True
+
+        self._signing = self._jws._with_mac_template(
+            self._jws._prepare_signing(
+                key,
+                algorithm,
+                self._headers,
+                json_encoder,
+                is_payload_detached,
+                sort_headers,
+            )
+        )
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        json_payload = self._jwt._encode_claims(
+            payload, self._headers, self._json_encoder
+        )
+        return self._jws._encode_prepared(json_payload, self._signing)
+
+    def encode_many(self, payloads: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """
+        Lazily yields the token for each payload, in input order.
+        """
+        return map(self.encode, payloads)
+
+
+# The Signer of a process pool worker started by PyJWT.encode_many().
+_worker_signer: Signer | None = None
+
+
+def _init_encode_worker(
+    jwt_obj: PyJWT, key: Any, algorithm: str | None, signer_kwargs: dict[str, Any]
+) -> None:
+    global _worker_signer
+
+    _worker_signer = Signer(key, algorithm, jwt_obj=jwt_obj, **signer_kwargs)
+
+
+def _encode_chunk(payloads: list[dict[str, Any]]) -> list[str]:
+    if _worker_signer is None:
+        raise RuntimeError("The encode worker was not initialized")
+    return list(map(_worker_signer.encode, payloads))
+
+
 _jwt_global_obj = PyJWT()
 encode = _jwt_global_obj.encode
 decode_complete = _jwt_global_obj.decode_complete
 decode = _jwt_global_obj.decode
+decode_many = _jwt_global_obj.decode_many
+encode_many = _jwt_global_obj.encode_many
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .exceptions import PyJWTError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+T = TypeVar("T")
+
+# How many items each worker may have queued ahead of the consumer.
+PREFETCH_PER_WORKER = 4
+
+
+def _call(func: Callable[[T], Any], item: T) -> Any:
+    try:
+        return func(item)
+    except PyJWTError as e:
+        return e
+
+
+def imap_ordered(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> Iterator[Any]:
+    """
+    Lazily yields ``func(item)`` for each item, in input order.
+
+    A :class:`~jwt.exceptions.PyJWTError` raised for an item is yielded in
+    place of its result instead of being raised, so one bad item does not
+    end the batch. Any other exception propagates.
+
+    With ``max_workers`` greater than 1 the calls run on a thread pool. Only
+    a bounded window of items is read ahead of the consumer, so ``items`` can
+    be an arbitrarily long iterator.
+    """
+    if not max_workers or max_workers <= 1:
+        for item in items:
+            yield _call(func, item)
+        return
+
+    # Imported here so that importing jwt does not load concurrent.futures.
+    from concurrent.futures import ThreadPoolExecutor
+
+    window = max_workers * PREFETCH_PER_WORKER
+    pending: deque[Future[Any]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(_call, func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer stopped early: drop work that has not started.
+            for future in pending:
+                future.cancel()
+
+
+def imap_chunks_in_processes(
+    func: Callable[[list[T]], list[Any]],
+    items: Iterable[T],
+    processes: int,
+    chunksize: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[Any]:
+    """
+    Lazily yields the results of ``func(chunk)`` for consecutive chunks of
+    ``chunksize`` items, flattened and in input order.
+
+    The chunks run on a pool of ``processes`` worker processes, each set up
+    once with ``initializer(*initargs)``. Only a bounded window of chunks is
+    read ahead of the consumer. Exceptions propagate, ending the stream.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be greater than 0")
+
+    # Imported here so that importing jwt does not load concurrent.futures.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=initializer, initargs=initargs
+    ) as executor:
+        yield from imap_chunks(executor, func, items, chunksize, processes * 2)
+
+
+def imap_chunks(
+    executor: Executor,
+    func: Callable[[list[T]], list[Any]],
+    items: Iterable[T],
+    chunksize: int,
+    window: int,
+) -> Iterator[Any]:
+    """
+    Like :func:`imap_chunks_in_processes`, on an existing ``executor`` that
+    is left running. At most ``window`` chunks are submitted ahead of the
+    consumer.
+    """
+    iterator = iter(items)
+    pending: deque[Future[list[Any]]] = deque()
+    try:
+        while True:
+            chunk = list(islice(iterator, chunksize))
+            if not chunk:
+                break
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
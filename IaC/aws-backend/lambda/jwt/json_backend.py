@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import Any
+
+# orjson is optional and only imported when the first document is
+# serialized or parsed.
+has_orjson = importlib.util.find_spec("orjson") is not None
+
+_SEPARATORS = (",", ":")
+_encoder = json.JSONEncoder(separators=_SEPARATORS)
+_sorted_encoder = json.JSONEncoder(separators=_SEPARATORS, sort_keys=True)
+
+# Documents nested deeper than this are left to the json module, which also
+# reports circular references.
+_MAX_DEPTH = 64
+
+
+class JSONBackend:
+    """
+    Serializes and parses the JSON in token headers and payloads with the
+    standard library ``json`` module.
+
+    Subclasses can use a faster library, but :meth:`dumps` must return the
+    exact bytes ``json.dumps()`` returns with compact separators, since the
+    encoded header and payload are signed, and :meth:`loads` must return what
+    ``json.loads()`` returns and raise ``ValueError`` where it does.
+    """
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        encoder = _sorted_encoder if sort_keys else _encoder
+        return encoder.encode(obj).encode("utf-8")
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    Uses ``orjson`` for the documents it handles exactly like ``json``, and
+    falls back to :class:`JSONBackend` for the rest.
+
+    ``orjson`` is only used to serialize dicts with string keys, lists,
+    tuples, strings, integers, booleans and None whose output is printable
+    ASCII: it writes floats and non-ASCII characters differently and accepts
+    types ``json`` rejects. Documents ``orjson`` fails to parse are parsed
+    again by ``json`` so that errors are reported the same way.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._sort_keys_option = orjson.OPT_SORT_KEYS
+
+    def loads(self, data: str | bytes) -> Any:
+        if isinstance(data, (str, bytes, bytearray)):
+            try:
+                obj = self._loads(data)
+            except ValueError:
+                pass
+            else:
+                # orjson reads integers outside the 64-bit range as floats,
+                # so documents with floats are parsed again by json.
+                if not _has_float(obj, 0):
+                    return obj
+
+        return json.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        if _is_plain(obj, 0):
+            option = self._sort_keys_option if sort_keys else 0
+            try:
+                data = self._dumps(obj, option=option)
+            except TypeError:
+                # e.g. integers outside the 64-bit range
+                pass
+            else:
+                if data.isascii() and b"\x7f" not in data:
+                    return data
+
+        return super().dumps(obj, sort_keys)
+
+
+def _is_plain(obj: Any, depth: int) -> bool:
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is bool or obj is None:
+        return True
+
+    if depth >= _MAX_DEPTH:
+        return False
+
+    if obj_type is dict:
+        for name, value in obj.items():
+            if type(name) is not str or not _is_plain(value, depth + 1):
+                return False
+        return True
+
+    if obj_type is list or obj_type is tuple:
+        for value in obj:
+            if not _is_plain(value, depth + 1):
+                return False
+        return True
+
+    return False
+
+
+def _has_float(obj: Any, depth: int) -> bool:
+    obj_type = type(obj)
+    if obj_type is dict:
+        if depth >= _MAX_DEPTH:
+            return True
+        for value in obj.values():
+            if _has_float(value, depth + 1):
+                return True
+        return False
+
+    if obj_type is list:
+        if depth >= _MAX_DEPTH:
+            return True
+        for value in obj:
+            if _has_float(value, depth + 1):
+                return True
+        return False
+
+    return obj_type is float
+
+
+_backend: JSONBackend | None = None
+
+
+def get_backend() -> JSONBackend:
+    """
+    Returns the backend in use: :class:`OrjsonBackend` if ``orjson`` is
+    installed, :class:`JSONBackend` otherwise, unless one was set with
+    :func:`set_backend`.
+    """
+    global _backend
+
+    backend = _backend
+    if backend is None:
+        backend = JSONBackend()
+        if has_orjson:
+            try:
+                backend = OrjsonBackend()
+            except ImportError:
+                # e.g. a wheel built for another platform
+                pass
+        _backend = backend
+    return backend
+
+
+def set_backend(backend: JSONBackend | None) -> None:
+    """
+    Replaces the backend used for every token. None restores the default.
+    """
+    global _backend
+
+    _backend = backend
+
+
+def loads(data: str | bytes) -> Any:
+    return (_backend or get_backend()).loads(data)
+
+
+def dumps(
+    obj: Any,
+    cls: type[json.JSONEncoder] | None = None,
+    sort_keys: bool = False,
+) -> bytes:
+    """
+    Returns ``json.dumps(obj, separators=(",", ":"), cls=cls,
+    sort_keys=sort_keys)`` encoded as UTF-8. A custom encoder class is always
+    run by the ``json`` module.
+    """
+    if cls is not None:
+        return json.dumps(
+            obj, separators=_SEPARATORS, cls=cls, sort_keys=sort_keys
+        ).encode("utf-8")
+
+    return (_backend or get_backend()).dumps(obj, sort_keys)
@@ -1,5 +1,9 @@
+import hashlib
+import json
+import os
+import tempfile
 import time
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from .api_jwk import PyJWKSet, PyJWTSetWithTimestamp
 
@@ -8,19 +12,43 @@ class JWKSetCache:
     def __init__(self, lifespan: int) -> None:
         self.jwk_set_with_timestamp: Optional[PyJWTSetWithTimestamp] = None
         self.lifespan = lifespan
+        # ETag and Last-Modified of the cached response, for revalidation.
+        self.validators: Tuple[Optional[str], Optional[str]] = (None, None)
 
-    def put(self, jwk_set: PyJWKSet) -> None:
+    def put(
+        self,
+        jwk_set: PyJWKSet,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
         if jwk_set is not None:
             self.jwk_set_with_timestamp = PyJWTSetWithTimestamp(jwk_set)
+            self.validators = (etag, last_modified)
         else:
             # clear cache
             self.jwk_set_with_timestamp = None
+            self.validators = (None, None)
 
-    def get(self) -> Optional[PyJWKSet]:
-        if self.jwk_set_with_timestamp is None or self.is_expired():
+    def get(self, allow_expired: bool = False) -> Optional[PyJWKSet]:
+        jwk_set_with_timestamp = self.jwk_set_with_timestamp
+        if jwk_set_with_timestamp is None:
             return None
 
-        return self.jwk_set_with_timestamp.get_jwk_set()
+        if not allow_expired and self.is_expired():
+            return None
+
+        return jwk_set_with_timestamp.get_jwk_set()
+
+    def touch(self) -> None:
+        """
+        Restarts the lifespan of the cached JWK Set, after the server
+        confirmed with a 304 Not Modified that it is still current.
+        """
+        jwk_set_with_timestamp = self.jwk_set_with_timestamp
+        if jwk_set_with_timestamp is not None:
+            self.jwk_set_with_timestamp = PyJWTSetWithTimestamp(
+                jwk_set_with_timestamp.get_jwk_set()
+            )
 
     def is_expired(self) -> bool:
         return (
@@ -29,3 +57,149 @@ class JWKSetCache:
             and time.monotonic()
             > self.jwk_set_with_timestamp.get_timestamp() + self.lifespan
         )
+
+
+class FileJWKSetCache(JWKSetCache):
+    """
+    A JWKSetCache that also keeps the raw JWK Set, its fetch time, ETag and
+    Last-Modified in a file, so that a new process starts with the set the
+    previous one fetched instead of an empty cache.
+
+    The file is replaced atomically on every update. It is only read when
+    the in-memory copy is missing or expired and the file has changed since
+    it was last read, which picks up sets fetched by other processes.
+
+    Files that are not owned by the current user or that other users can
+    write are ignored, since anyone able to write the file could plant keys.
+
+    With ``read_on_get`` set to False, :meth:`get` never touches the file and
+    the owner calls :meth:`read_file` when :meth:`needs_read` says so, e.g.
+    from an executor so that an event loop does not block on file I/O.
+    """
+
+    def __init__(self, lifespan: int, path: str) -> None:
+        super().__init__(lifespan)
+        self.path = path
+        # Wall-clock fetch time, which unlike time.monotonic() is meaningful
+        # across processes.
+        self._fetched_at: Optional[float] = None
+        self._file_mtime_ns: Optional[int] = None
+        self.read_on_get = True
+
+    @staticmethod
+    def default_path(uri: str) -> str:
+        """
+        Returns a cache file path in the temporary directory (``/tmp`` on
+        Lambda) that is unique to the JWKS URI.
+        """
+        digest = hashlib.sha256(uri.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(tempfile.gettempdir(), f"pyjwt-jwks-{digest}.json")
+
+    def put(
+        self,
+        jwk_set: PyJWKSet,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        super().put(jwk_set, etag, last_modified)
+        if jwk_set is None:
+            self._fetched_at = None
+            self._remove_file()
+        else:
+            self._fetched_at = time.time()
+            self._write_file()
+
+    def get(self, allow_expired: bool = False) -> Optional[PyJWKSet]:
+        if self.read_on_get and self.needs_read():
+            self.read_file()
+
+        return super().get(allow_expired)
+
+    def needs_read(self) -> bool:
+        """
+        Whether the in-memory copy is missing or expired, so that the file
+        may hold a newer JWK Set.
+        """
+        return self.jwk_set_with_timestamp is None or self.is_expired()
+
+    def touch(self) -> None:
+        super().touch()
+        if self.jwk_set_with_timestamp is not None:
+            self._fetched_at = time.time()
+            self._write_file()
+
+    def is_expired(self) -> bool:
+        fetched_at = self._fetched_at
+        return (
+            self.jwk_set_with_timestamp is not None
+            and fetched_at is not None
+            and self.lifespan > -1
+            and time.time() > fetched_at + self.lifespan
+        )
+
+    def read_file(self) -> None:
+        """
+        Loads the JWK Set from the file if it changed since it was last read.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_mtime_ns == self._file_mtime_ns or not _is_trusted(stat):
+                    return
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            # Missing, empty or corrupt files are treated as a cache miss.
+            return
+
+        if not isinstance(entry, dict) or not isinstance(entry.get("jwks"), dict):
+            return
+
+        self._file_mtime_ns = stat.st_mtime_ns
+        fetched_at = entry.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            return
+
+        super().put(entry["jwks"], entry.get("etag"), entry.get("last_modified"))
+        self._fetched_at = fetched_at
+
+    def _write_file(self) -> None:
+        entry: Any = {
+            "jwks": super().get(allow_expired=True),
+            "fetched_at": self._fetched_at,
+            "etag": self.validators[0],
+            "last_modified": self.validators[1],
+        }
+        directory = os.path.dirname(self.path) or "."
+        try:
+            # mkstemp creates the file readable and writable by its owner only.
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory, prefix=".pyjwt-jwks-", suffix=".tmp"
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_path, self.path)
+            self._file_mtime_ns = os.stat(self.path).st_mtime_ns
+        except (OSError, TypeError, ValueError):
+            # The in-memory cache still works when the file cannot be written.
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _remove_file(self) -> None:
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        self._file_mtime_ns = None
+
+
+def _is_trusted(stat: os.stat_result) -> bool:
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return True
+    return stat.st_uid == getuid() and not stat.st_mode & 0o022
@@ -1,28 +1,52 @@
 import json
+import threading
+import time
 import urllib.request
 from functools import lru_cache
 from ssl import SSLContext
-from typing import Any, Dict, List, Optional
-from urllib.error import URLError
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
 
 from .api_jwk import PyJWK, PyJWKSet
 from .api_jwt import decode_complete as decode_token
 from .exceptions import PyJWKClientConnectionError, PyJWKClientError
-from .jwk_set_cache import JWKSetCache
+from .jwk_set_cache import FileJWKSetCache, JWKSetCache
 
 
-class PyJWKClient:
+class BaseJWKClient:
+    """
+    Configuration, caching and key selection shared by :class:`PyJWKClient`
+    and :class:`~jwt.jwks_client_async.AsyncPyJWKClient`. Subclasses provide
+    the transport.
+    """
+
     def __init__(
         self,
         uri: str,
-        cache_keys: bool = False,
-        max_cached_keys: int = 16,
         cache_jwk_set: bool = True,
         lifespan: int = 300,
         headers: Optional[Dict[str, Any]] = None,
         timeout: int = 30,
         ssl_context: Optional[SSLContext] = None,
+        stale_while_revalidate: bool = False,
+        min_refresh_interval: float = 0,
+        cache_path: Optional[str] = None,
     ):
+        """
+        With ``cache_path``, the JWK Set is also cached in that file (see
+        :class:`~jwt.jwk_set_cache.FileJWKSetCache`), so that new processes
+        start with the last fetched set and revalidate it with a conditional
+        request. ``FileJWKSetCache.default_path(uri)`` gives a path under the
+        temporary directory.
+
+        With ``stale_while_revalidate``, an expired JWK Set keeps being served
+        while a new one is fetched in the background, so requests never wait
+        on the JWKS endpoint once a set has been fetched.
+
+        ``min_refresh_interval`` is the minimum number of seconds between
+        fetches triggered by tokens whose kid is not in the cached set.
+        Unknown kids within that window fail without contacting the endpoint.
+        """
         if headers is None:
             headers = {}
         self.uri = uri
@@ -30,6 +54,9 @@ class PyJWKClient:
         self.headers = headers
         self.timeout = timeout
         self.ssl_context = ssl_context
+        self.stale_while_revalidate = stale_while_revalidate
+        self.min_refresh_interval = min_refresh_interval
+        self._last_fetch_time: Optional[float] = None
 
         if cache_jwk_set:
             # Init jwt set cache with default or given lifespan.
@@ -38,81 +65,146 @@ class PyJWKClient:
                 raise PyJWKClientError(
                     f'Lifespan must be greater than 0, the input is "{lifespan}"'
                 )
-            self.jwk_set_cache = JWKSetCache(lifespan)
+            if cache_path is not None:
+                self.jwk_set_cache = FileJWKSetCache(lifespan, cache_path)
+            else:
+                self.jwk_set_cache = JWKSetCache(lifespan)
         else:
             self.jwk_set_cache = None
 
-        if cache_keys:
-            # Cache signing keys
-            # Ignore mypy (https://github.com/python/mypy/issues/2427)
-            self.get_signing_key = lru_cache(maxsize=max_cached_keys)(
-                self.get_signing_key
-            )  # type: ignore
+        # The last parsed JWK Set and the data it was parsed from, so that
+        # cached data is not parsed again on every lookup.
+        self._parsed_jwk_set: Optional[Tuple[Any, PyJWKSet]] = None
 
-    def fetch_data(self) -> Any:
-        jwk_set: Any = None
+    def _get_cached_data(self, refresh: bool = False) -> Tuple[Any, bool]:
+        """
+        Returns the cached JWKS data, or None if it has to be fetched, and
+        whether the data is expired and should be refreshed in the background.
+        """
+        if self.jwk_set_cache is None or refresh:
+            return None, False
+
+        data = self.jwk_set_cache.get()
+        if data is None and self.stale_while_revalidate:
+            data = self.jwk_set_cache.get(allow_expired=True)
+            return data, data is not None
+
+        return data, False
+
+    def _to_jwk_set(self, data: Any) -> PyJWKSet:
+        if not isinstance(data, dict):
+            raise PyJWKClientError("The JWKS endpoint did not return a JSON object")
+
+        parsed = self._parsed_jwk_set
+        if parsed is not None and parsed[0] is data:
+            return parsed[1]
+
+        jwk_set = PyJWKSet.from_dict(data)
+        self._parsed_jwk_set = (data, jwk_set)
+        return jwk_set
+
+    def _request_headers(self) -> Dict[str, Any]:
+        """
+        Returns the request headers, with the validators of the cached JWK Set
+        added so that the server can answer 304 Not Modified.
+        """
+        cache = self.jwk_set_cache
+        if cache is None or cache.get(allow_expired=True) is None:
+            return self.headers
+
+        headers = dict(self.headers)
+        etag, last_modified = cache.validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _store(
+        self,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        if self.jwk_set_cache is not None:
+            self.jwk_set_cache.put(data, etag, last_modified)
+
+    def _not_modified(self) -> Any:
+        """
+        Handles a 304 Not Modified response: the cached JWK Set is current.
+        """
+        data = None
+        if self.jwk_set_cache is not None:
+            data = self.jwk_set_cache.get(allow_expired=True)
+
+        if data is None:
+            raise PyJWKClientError(
+                "The JWKS endpoint returned 304 Not Modified without a cached JWK Set"
+            )
+
+        self.jwk_set_cache.touch()
+        return data
+
+    def _fetch_blocking(self) -> Any:
         try:
-            r = urllib.request.Request(url=self.uri, headers=self.headers)
+            r = urllib.request.Request(url=self.uri, headers=self._request_headers())
             with urllib.request.urlopen(
                 r, timeout=self.timeout, context=self.ssl_context
             ) as response:
                 jwk_set = json.load(response)
+                response_headers = response.headers
+        except HTTPError as e:
+            if e.code == 304:
+                return self._not_modified()
+            raise self._connection_error(e) from e
         except (URLError, TimeoutError) as e:
-            raise PyJWKClientConnectionError(
-                f'Fail to fetch data from the url, err: "{e}"'
-            ) from e
+            # Keep serving the last good JWK Set, if any.
+            raise self._connection_error(e) from e
+        except ValueError as e:
+            raise self._invalid_json_error(e) from e
         else:
+            self._store(
+                jwk_set,
+                response_headers.get("ETag"),
+                response_headers.get("Last-Modified"),
+            )
             return jwk_set
-        finally:
-            if self.jwk_set_cache is not None:
-                self.jwk_set_cache.put(jwk_set)
-
-    def get_jwk_set(self, refresh: bool = False) -> PyJWKSet:
-        data = None
-        if self.jwk_set_cache is not None and not refresh:
-            data = self.jwk_set_cache.get()
 
-        if data is None:
-            data = self.fetch_data()
-
-        if not isinstance(data, dict):
-            raise PyJWKClientError("The JWKS endpoint did not return a JSON object")
+    @staticmethod
+    def _connection_error(error: Exception) -> PyJWKClientConnectionError:
+        return PyJWKClientConnectionError(
+            f'Fail to fetch data from the url, err: "{error}"'
+        )
 
-        return PyJWKSet.from_dict(data)
+    @staticmethod
+    def _invalid_json_error(error: Exception) -> PyJWKClientError:
+        return PyJWKClientError(
+            f'The JWKS endpoint did not return valid JSON, err: "{error}"'
+        )
 
-    def get_signing_keys(self, refresh: bool = False) -> List[PyJWK]:
-        jwk_set = self.get_jwk_set(refresh)
-        signing_keys = [
-            jwk_set_key
-            for jwk_set_key in jwk_set.keys
-            if jwk_set_key.public_key_use in ["sig", None] and jwk_set_key.key_id
-        ]
-
-        if not signing_keys:
+    @staticmethod
+    def _check_signing_keys(jwk_set: PyJWKSet) -> PyJWKSet:
+        if not jwk_set.signing_keys:
             raise PyJWKClientError("The JWKS endpoint did not contain any signing keys")
 
-        return signing_keys
-
-    def get_signing_key(self, kid: str) -> PyJWK:
-        signing_keys = self.get_signing_keys()
-        signing_key = self.match_kid(signing_keys, kid)
-
-        if not signing_key:
-            # If no matching signing key from the jwk set, refresh the jwk set and try again.
-            signing_keys = self.get_signing_keys(refresh=True)
-            signing_key = self.match_kid(signing_keys, kid)
+        return jwk_set
 
-            if not signing_key:
-                raise PyJWKClientError(
-                    f'Unable to find a signing key that matches: "{kid}"'
-                )
+    def _refresh_allowed(self) -> bool:
+        last_fetch_time = self._last_fetch_time
+        return (
+            last_fetch_time is None
+            or time.monotonic() - last_fetch_time >= self.min_refresh_interval
+        )
 
-        return signing_key
+    @staticmethod
+    def _no_matching_key(kid: str) -> PyJWKClientError:
+        return PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
 
-    def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+    @staticmethod
+    def _kid_from_jwt(token: str) -> Any:
         unverified = decode_token(token, options={"verify_signature": False})
         header = unverified["header"]
-        return self.get_signing_key(header.get("kid"))
+        return header.get("kid")
 
     @staticmethod
     def match_kid(signing_keys: List[PyJWK], kid: str) -> Optional[PyJWK]:
@@ -124,3 +216,133 @@ class PyJWKClient:
                 break
 
         return signing_key
+
+
+class PyJWKClient(BaseJWKClient):
+    def __init__(
+        self,
+        uri: str,
+        cache_keys: bool = False,
+        max_cached_keys: int = 16,
+        cache_jwk_set: bool = True,
+        lifespan: int = 300,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        ssl_context: Optional[SSLContext] = None,
+        stale_while_revalidate: bool = False,
+        min_refresh_interval: float = 0,
+        cache_path: Optional[str] = None,
+    ):
+        super().__init__(
+            uri,
+            cache_jwk_set=cache_jwk_set,
+            lifespan=lifespan,
+            headers=headers,
+            timeout=timeout,
+            ssl_context=ssl_context,
+            stale_while_revalidate=stale_while_revalidate,
+            min_refresh_interval=min_refresh_interval,
+            cache_path=cache_path,
+        )
+
+        # Concurrent callers that need a fetch share one request: the first
+        # one fetches while holding _fetch_lock, the others wait and reuse its
+        # outcome, identified by _fetch_count.
+        self._fetch_lock = threading.Lock()
+        self._fetch_count = 0
+        self._last_fetch: Tuple[Any, Optional[Exception]] = (None, None)
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_thread_lock = threading.Lock()
+
+        if cache_keys:
+            # Cache signing keys
+            # Ignore mypy (https://github.com/python/mypy/issues/2427)
+            self.get_signing_key = lru_cache(maxsize=max_cached_keys)(
+                self.get_signing_key
+            )  # type: ignore
+
+    def fetch_data(self) -> Any:
+        return self._fetch_blocking()
+
+    def get_jwk_set(self, refresh: bool = False) -> PyJWKSet:
+        data, is_stale = self._get_cached_data(refresh)
+        if is_stale:
+            self._start_background_refresh()
+
+        if data is None:
+            data = self._fetch_shared(refresh)
+
+        return self._to_jwk_set(data)
+
+    def _fetch_shared(self, refresh: bool = False) -> Any:
+        """
+        Calls fetch_data(), unless another caller completed a fetch while this
+        one was waiting for the lock, in which case its outcome is reused.
+        """
+        fetch_count = self._fetch_count
+        with self._fetch_lock:
+            if self._fetch_count != fetch_count:
+                data, error = self._last_fetch
+                if error is not None:
+                    raise error
+                return data
+
+            if not refresh and self.jwk_set_cache is not None:
+                data = self.jwk_set_cache.get()
+                if data is not None:
+                    return data
+
+            try:
+                data = self.fetch_data()
+            except Exception as e:
+                # Waiters must see this outcome too, whatever fetch_data()
+                # (possibly overridden) raised.
+                self._last_fetch = (None, e)
+                raise
+            else:
+                self._last_fetch = (data, None)
+                return data
+            finally:
+                self._last_fetch_time = time.monotonic()
+                self._fetch_count += 1
+
+    def _start_background_refresh(self) -> None:
+        with self._refresh_thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+
+            # Do not retry a failing endpoint on every request.
+            if not self._refresh_allowed():
+                return
+
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="PyJWKClient-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._fetch_shared(refresh=True)
+        except Exception:
+            # The stale JWK Set stays in the cache and is retried later.
+            pass
+
+    def get_signing_keys(self, refresh: bool = False) -> List[PyJWK]:
+        return list(self._check_signing_keys(self.get_jwk_set(refresh)).signing_keys)
+
+    def get_signing_key(self, kid: str) -> PyJWK:
+        jwk_set = self._check_signing_keys(self.get_jwk_set())
+        signing_key = jwk_set.find_signing_key(kid)
+
+        if not signing_key and self._refresh_allowed():
+            # If no matching signing key from the jwk set, refresh the jwk set and try again.
+            jwk_set = self._check_signing_keys(self.get_jwk_set(refresh=True))
+            signing_key = jwk_set.find_signing_key(kid)
+
+        if not signing_key:
+            raise self._no_matching_key(kid)
+
+        return signing_key
+
+    def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        return self.get_signing_key(self._kid_from_jwt(token))
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import time
+from concurrent.futures import Executor
+from functools import partial
+from ssl import SSLContext
+from typing import TYPE_CHECKING, Any
+
+from . import api_jwt
+from .algorithms import HMACAlgorithm, NoneAlgorithm
+from .api_jwk import PyJWK, PyJWKSet
+from .jwk_set_cache import FileJWKSetCache
+from .jwks_client import BaseJWKClient
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# aiohttp is optional and only imported when the first request is made.
+has_aiohttp = importlib.util.find_spec("aiohttp") is not None
+
+
+class AsyncPyJWKClient(BaseJWKClient):
+    """
+    An asyncio version of :class:`~jwt.PyJWKClient`.
+
+    With ``aiohttp`` installed, the JWK Set is fetched with a client session
+    that keeps connections open between fetches; call :meth:`close` (or use
+    the client as an async context manager) to release it. Without
+    ``aiohttp``, the blocking ``urllib`` fetch runs in ``executor``.
+
+    Concurrent callers that need a fetch await a single shared request, and
+    with ``stale_while_revalidate`` an expired JWK Set is refreshed by a
+    background task. With ``cache_path``, the cache file is read and written
+    in ``executor`` as well.
+
+    :meth:`decode` verifies RSA, EC and EdDSA signatures in ``executor``
+    (the event loop's default executor if None), which costs some throughput
+    but keeps the loop responsive under sustained load. Pass
+    ``offload_verification=False`` to verify on the loop instead. HMAC tokens
+    are always verified inline.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        cache_jwk_set: bool = True,
+        lifespan: int = 300,
+        headers: dict[str, Any] | None = None,
+        timeout: int = 30,
+        ssl_context: SSLContext | None = None,
+        stale_while_revalidate: bool = False,
+        min_refresh_interval: float = 0,
+        cache_path: str | None = None,
+        executor: Executor | None = None,
+        offload_verification: bool = True,
+    ):
+        super().__init__(
+            uri,
+            cache_jwk_set=cache_jwk_set,
+            lifespan=lifespan,
+            headers=headers,
+            timeout=timeout,
+            ssl_context=ssl_context,
+            stale_while_revalidate=stale_while_revalidate,
+            min_refresh_interval=min_refresh_interval,
+            cache_path=cache_path,
+        )
+        self.executor = executor
+        self.offload_verification = offload_verification
+        if isinstance(self.jwk_set_cache, FileJWKSetCache):
+            # Read in get_jwk_set() instead, off the event loop.
+            self.jwk_set_cache.read_on_get = False
+        self._session: aiohttp.ClientSession | None = None
+        self._fetch_task: asyncio.Task[Any] | None = None
+
+    async def __aenter__(self) -> AsyncPyJWKClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def fetch_data(self) -> Any:
+        if has_aiohttp:
+            return await self._fetch_with_aiohttp()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._fetch_blocking)
+
+    async def _fetch_with_aiohttp(self) -> Any:
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+        request_kwargs: dict[str, Any] = {}
+        if self.ssl_context is not None:
+            request_kwargs["ssl"] = self.ssl_context
+
+        try:
+            async with self._session.get(
+                self.uri,
+                headers=self._request_headers(),
+                raise_for_status=True,
+                **request_kwargs,
+            ) as response:
+                not_modified = response.status == 304
+                if not not_modified:
+                    jwk_set = json.loads(await response.read())
+                response_headers = response.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise self._connection_error(e) from e
+        except ValueError as e:
+            raise self._invalid_json_error(e) from e
+
+        if not_modified:
+            return await self._run_cache_io(self._not_modified)
+
+        await self._run_cache_io(
+            partial(
+                self._store,
+                jwk_set,
+                response_headers.get("ETag"),
+                response_headers.get("Last-Modified"),
+            )
+        )
+        return jwk_set
+
+    async def _run_cache_io(self, func: Any) -> Any:
+        """
+        Calls ``func``, in ``executor`` if it may write the cache file.
+        """
+        if not isinstance(self.jwk_set_cache, FileJWKSetCache):
+            return func()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func)
+
+    async def get_jwk_set(self, refresh: bool = False) -> PyJWKSet:
+        cache = self.jwk_set_cache
+        if not refresh and isinstance(cache, FileJWKSetCache) and cache.needs_read():
+            await self._run_cache_io(cache.read_file)
+
+        data, is_stale = self._get_cached_data(refresh)
+        if is_stale and self._fetch_task is None and self._refresh_allowed():
+            self._shared_fetch().add_done_callback(_ignore_fetch_error)
+
+        if data is None:
+            # Shielded so that a cancelled caller does not cancel the fetch
+            # other callers are waiting for.
+            data = await asyncio.shield(self._shared_fetch())
+
+        return self._to_jwk_set(data)
+
+    def _shared_fetch(self) -> asyncio.Task[Any]:
+        """
+        Returns the fetch in progress, starting one if there is none.
+        """
+        if self._fetch_task is None:
+            self._fetch_task = asyncio.ensure_future(self._fetch())
+        return self._fetch_task
+
+    async def _fetch(self) -> Any:
+        try:
+            return await self.fetch_data()
+        finally:
+            self._last_fetch_time = time.monotonic()
+            self._fetch_task = None
+
+    async def get_signing_keys(self, refresh: bool = False) -> list[PyJWK]:
+        jwk_set = await self.get_jwk_set(refresh)
+        return list(self._check_signing_keys(jwk_set).signing_keys)
+
+    async def get_signing_key(self, kid: str) -> PyJWK:
+        jwk_set = self._check_signing_keys(await self.get_jwk_set())
+        signing_key = jwk_set.find_signing_key(kid)
+
+        if not signing_key and self._refresh_allowed():
+            # If no matching signing key from the jwk set, refresh the jwk set and try again.
+            jwk_set = self._check_signing_keys(await self.get_jwk_set(refresh=True))
+            signing_key = jwk_set.find_signing_key(kid)
+
+        if not signing_key:
+            raise self._no_matching_key(kid)
+
+        return signing_key
+
+    async def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        return await self.get_signing_key(self._kid_from_jwt(token))
+
+    async def decode(self, token: str, **kwargs: Any) -> Any:
+        """
+        Looks up the signing key for ``token`` and decodes it with
+        :func:`jwt.decode`, passing ``kwargs`` through.
+        """
+        signing_key = await self.get_signing_key_from_jwt(token)
+        if not self.offload_verification or isinstance(
+            signing_key.Algorithm, (HMACAlgorithm, NoneAlgorithm)
+        ):
+            return api_jwt.decode(token, signing_key, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(api_jwt.decode, token, signing_key, **kwargs)
+        )
+
+
+def _ignore_fetch_error(task: asyncio.Task[Any]) -> None:
+    # A failed background refresh keeps the stale JWK Set in the cache; the
+    # error is retrieved here so that asyncio does not log it as unhandled.
+    if not task.cancelled():
+        task.exception()
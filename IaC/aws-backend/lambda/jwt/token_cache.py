@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from .utils import force_bytes
+
+
+class TokenCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    currbytes: int
+
+
+class _Entry(NamedTuple):
+    decoded: dict[str, Any]
+    expires_at: float
+    size: int
+
+
+# Leaves of a JSON document that can be shared between copies.
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _copy_document(value: Any) -> Any:
+    """
+    Returns a deep copy of a decoded JSON document. Dicts and lists are copied
+    directly and anything a custom JSON decoder may have produced goes
+    through :func:`copy.deepcopy`.
+    """
+    cls = type(value)
+    if cls in _IMMUTABLE_TYPES:
+        return value
+    if cls is dict:
+        return {k: _copy_document(v) for k, v in value.items()}
+    if cls is list:
+        return [_copy_document(v) for v in value]
+    return copy.deepcopy(value)
+
+
+class VerifiedTokenCache:
+    """
+    Remembers tokens that already passed verification so that decoding the
+    same token again skips parsing, the signature check and claim checks.
+
+    Entries are keyed by a digest of the full token and expire at the
+    earlier of the token's ``exp`` claim and ``ttl`` seconds after they were
+    stored. The cache holds at most ``maxsize`` entries and roughly
+    ``max_bytes`` of token and payload data, evicting the least recently
+    used entries first.
+
+    A cache belongs to a single :class:`~jwt.Verifier`: sharing one between
+    verifiers with different keys or settings would let a token accepted by
+    one skip the checks of the other.
+
+    Entries hold a private deep copy of the header and payload, and every hit
+    returns a fresh copy, so callers mutating nested claims cannot change
+    what later hits return.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_bytes: int = 4 * 1024 * 1024,
+        ttl: float = 300,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if maxsize <= 0 or max_bytes <= 0:
+            raise ValueError("maxsize and max_bytes must be greater than 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def token_key(jwt: str | bytes) -> bytes:
+        return hashlib.blake2b(force_bytes(jwt), digest_size=16).digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        """
+        Returns a deep copy of the decoded token stored under ``key``, or None if
+        there is no live entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        decoded = entry.decoded
+        return {
+            "payload": _copy_document(decoded["payload"]),
+            "header": _copy_document(decoded["header"]),
+            "signature": decoded["signature"],
+        }
+
+    def put(self, key: bytes, decoded: dict[str, Any], size: int) -> None:
+        """
+        Stores a verified token. ``size`` is the approximate number of bytes
+        the entry keeps alive, used for the ``max_bytes`` bound.
+        """
+        now = self._clock()
+        expires_at = now + self.ttl
+        try:
+            expires_at = min(expires_at, int(decoded["payload"]["exp"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        if expires_at <= now or size > self.max_bytes:
+            return
+
+        entry = _Entry(
+            {
+                "payload": _copy_document(decoded["payload"]),
+                "header": _copy_document(decoded["header"]),
+                "signature": decoded["signature"],
+            },
+            expires_at,
+            size,
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> TokenCacheInfo:
+        with self._lock:
+            return TokenCacheInfo(
+                self.hits, self.misses, self.evictions, len(self._entries), self._bytes
+            )
+
+    def _remove(self, key: bytes) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,16 +1,10 @@
 import base64
 import binascii
 import re
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-try:
+if TYPE_CHECKING:
     from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurve
-    from cryptography.hazmat.primitives.asymmetric.utils import (
-        decode_dss_signature,
-        encode_dss_signature,
-    )
-except ModuleNotFoundError:
-    pass
 
 
 def force_bytes(value: Union[bytes, str]) -> bytes:
@@ -55,12 +49,20 @@ def from_base64url_uint(val: Union[bytes, str]) -> int:
 
 
 def number_to_bytes(num: int, num_bytes: int) -> bytes:
-    padded_hex = "%0*x" % (2 * num_bytes, num)
-    return binascii.a2b_hex(padded_hex.encode("ascii"))
+    try:
+        return num.to_bytes(num_bytes, "big")
+    except OverflowError:
+        # Negative values and values wider than num_bytes keep the result of
+        # the hex conversion this replaced (an error or a longer string).
+        padded_hex = "%0*x" % (2 * num_bytes, num)
+        return binascii.a2b_hex(padded_hex.encode("ascii"))
 
 
 def bytes_to_number(string: bytes) -> int:
-    return int(binascii.b2a_hex(string), 16)
+    if not string:
+        # As int(binascii.b2a_hex(string), 16) did.
+        raise ValueError("invalid literal for int() with base 16: b''")
+    return int.from_bytes(string, "big")
 
 
 def bytes_from_int(val: int, *, bit_length: Optional[int] = None) -> bytes:
@@ -71,13 +73,65 @@ def bytes_from_int(val: int, *, bit_length: Optional[int] = None) -> bytes:
     return val.to_bytes(byte_length, "big", signed=False)
 
 
+def _der_integer(value: bytes) -> bytes:
+    # Minimal big-endian encoding of a non-negative INTEGER: no leading zero
+    # bytes except one that keeps the sign bit clear.
+    value = value.lstrip(b"\x00") or b"\x00"
+    if value[0] & 0x80:
+        value = b"\x00" + value
+    return b"\x02" + bytes((len(value),)) + value
+
+
+def _split_der_signature(der_sig: bytes) -> Optional[tuple[bytes, bytes]]:
+    """
+    Returns the contents of the two INTEGERs in a DER ECDSA signature as
+    cryptography produces it, or None if ``der_sig`` has any other layout.
+    """
+    if len(der_sig) < 8 or der_sig[0] != 0x30:
+        return None
+
+    # Short length form, or the long form with one length byte that P-521
+    # signatures need.
+    start = 3 if der_sig[1] == 0x81 else 2
+    if der_sig[start - 1] != len(der_sig) - start or der_sig[start] != 0x02:
+        return None
+
+    r_end = start + 2 + der_sig[start + 1]
+    if r_end + 3 > len(der_sig) or der_sig[r_end] != 0x02:
+        return None
+    if der_sig[r_end + 1] != len(der_sig) - r_end - 2:
+        return None
+
+    r = der_sig[start + 2 : r_end]
+    s = der_sig[r_end + 2 :]
+    if not (_is_der_uint(r) and _is_der_uint(s)):
+        return None
+    return r, s
+
+
+def _is_der_uint(value: bytes) -> bool:
+    # Non-empty, non-negative and minimally encoded.
+    if not value or value[0] & 0x80:
+        return False
+    return value[0] != 0 or len(value) == 1 or bool(value[1] & 0x80)
+
+
 def der_to_raw_signature(der_sig: bytes, curve: "EllipticCurve") -> bytes:
     num_bits = curve.key_size
     num_bytes = (num_bits + 7) // 8
 
-    r, s = decode_dss_signature(der_sig)
+    integers = _split_der_signature(der_sig)
+    if integers is not None:
+        r = integers[0].lstrip(b"\x00")
+        s = integers[1].lstrip(b"\x00")
+        if len(r) <= num_bytes and len(s) <= num_bytes:
+            return r.rjust(num_bytes, b"\x00") + s.rjust(num_bytes, b"\x00")
 
-    return number_to_bytes(r, num_bytes) + number_to_bytes(s, num_bytes)
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+    r_num, s_num = decode_dss_signature(der_sig)
+
+    return number_to_bytes(r_num, num_bytes) + number_to_bytes(s_num, num_bytes)
 
 
 def raw_to_der_signature(raw_sig: bytes, curve: "EllipticCurve") -> bytes:
@@ -87,10 +141,12 @@ def raw_to_der_signature(raw_sig: bytes, curve: "EllipticCurve") -> bytes:
     if len(raw_sig) != 2 * num_bytes:
         raise ValueError("Invalid signature")
 
-    r = bytes_to_number(raw_sig[:num_bytes])
-    s = bytes_to_number(raw_sig[num_bytes:])
-
-    return bytes(encode_dss_signature(r, s))
+    # Encoded directly from the fixed-width halves, without converting them
+    # to integers: the same bytes encode_dss_signature() returns.
+    body = _der_integer(raw_sig[:num_bytes]) + _der_integer(raw_sig[num_bytes:])
+    if len(body) < 0x80:
+        return b"\x30" + bytes((len(body),)) + body
+    return b"\x30\x81" + bytes((len(body),)) + body
 
 
 # Based on https://github.com/hynek/pem/blob/7ad94db26b0bc21d10953f5dbad3acfdfacf57aa/src/pem/_core.py#L224-L252
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from . import api_jws
+from .api_jwk import PyJWK
+from .batch import imap_chunks
+from .exceptions import PyJWTError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .algorithms import Algorithm, AllowedPublicKeys
+
+# A signature to check: (algorithm, signing input, signature). The algorithm
+# is an Algorithm object, or a name looked up in the default registry.
+SignatureJob = tuple["Algorithm | str", bytes, bytes]
+
+MODES = ("sync", "thread", "process")
+
+
+class _KeyCheck:
+    """
+    Checks signatures with one key, prepared at most once per algorithm
+    class (``prepare_key`` does not depend on the hash an instance uses).
+    """
+
+    def __init__(self, key: Any) -> None:
+        self._key = key
+        self._prepared: dict[type[Algorithm], Any] = {}
+
+    def __call__(
+        self, alg: Algorithm | str, signing_input: bytes, signature: bytes
+    ) -> bool:
+        if isinstance(alg, str):
+            alg = api_jws.get_algorithm_by_name(alg)
+
+        try:
+            prepared_key = self._prepared[type(alg)]
+        except KeyError:
+            prepared_key = alg.prepare_key(self._key)
+            self._prepared[type(alg)] = prepared_key
+
+        return alg.verify(signing_input, prepared_key, signature)
+
+    def check_job(self, job: SignatureJob) -> bool | PyJWTError:
+        try:
+            return self(*job)
+        except PyJWTError as e:
+            return e
+
+    def check_chunk(self, jobs: list[SignatureJob]) -> list[bool | PyJWTError]:
+        return list(map(self.check_job, jobs))
+
+
+# The key check of a process pool worker started by a VerificationEngine.
+_worker_check: _KeyCheck | None = None
+
+
+def _init_verify_worker(key_data: str | bytes) -> None:
+    global _worker_check
+
+    _worker_check = _KeyCheck(key_data)
+
+
+def _check_chunk(jobs: list[SignatureJob]) -> list[bool | PyJWTError]:
+    if _worker_check is None:
+        raise RuntimeError("The verification worker was not initialized")
+    return _worker_check.check_chunk(jobs)
+
+
+def _key_material(key: Any) -> Any:
+    """
+    Returns ``key`` in a form that compares equal for keys that prepare to
+    the same key: the key of a PyJWK, and str secrets as UTF-8 bytes.
+    """
+    if isinstance(key, PyJWK):
+        key = key.key
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    return key
+
+
+def _serialize_key(key: Any) -> str | bytes:
+    """
+    Returns ``key`` as data a worker process can prepare: secrets and PEM
+    keys as they are, ``cryptography`` keys as their public key in PEM.
+    """
+    if isinstance(key, (str, bytes)):
+        return key
+
+    from cryptography.hazmat.primitives.serialization import (
+        Encoding,
+        PublicFormat,
+    )
+
+    public_key = key.public_key() if hasattr(key, "public_key") else key
+    return public_key.public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+
+
+class VerificationEngine:
+    """
+    Checks signatures made with one key on a pool of workers, so that
+    verifying RSA, EC and EdDSA tokens at volume is not limited to the
+    calling thread.
+
+    ``mode`` is one of:
+
+    * ``"thread"``: a thread pool of ``max_workers`` threads;
+      ``cryptography`` releases the GIL while checking signatures.
+    * ``"process"``: a pool of ``max_workers`` processes. The key is
+      serialized (as PEM for ``cryptography`` keys) once and loaded once by
+      each worker, and signatures travel in chunks of ``chunksize``.
+    * ``"sync"``: every signature is checked on the calling thread.
+
+    ``max_workers`` defaults to the number of CPUs. The pool is started on
+    first use and kept until :meth:`close`; the engine can also be used as a
+    context manager. Pass it to :func:`jwt.decode_many` or
+    :meth:`Verifier.decode_many`, which parse tokens and check claims on the
+    calling thread and only send the signature checks to the engine.
+
+    :func:`jwt.decode_many` and :meth:`Verifier.decode_many` send the
+    algorithm they resolved for each token (from their allow-list, or the
+    ``Algorithm`` of a PyJWK), so decoding on an engine accepts the same
+    tokens as ``decode()``. Algorithm names passed to :meth:`verify` and
+    :meth:`verify_many` are looked up in the default registry.
+
+    Example usage:
+
+    >>> with jwt.VerificationEngine(public_key, mode="process") as engine:
+    ...     payloads = jwt.decode_many(tokens, algorithms=["RS256"], engine=engine)
+    """
+
+    def __init__(
+        self,
+        key: AllowedPublicKeys | PyJWK | str | bytes,
+        mode: str = "thread",
+        max_workers: int | None = None,
+        chunksize: int = 64,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be greater than 0")
+
+        self.key = key
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+
+        self._key = key.key if isinstance(key, PyJWK) else key
+        self._check = _KeyCheck(self._key)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> VerificationEngine:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts the pool down, waiting for running checks. The engine starts a
+        new pool if it is used again.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def holds_key(self, key: AllowedPublicKeys | PyJWK | str | bytes) -> bool:
+        """
+        Returns whether ``key`` is equal to the key of this engine.
+        """
+        return _key_material(key) == _key_material(self._key)
+
+    def verify(
+        self, alg: Algorithm | str, signing_input: bytes, signature: bytes
+    ) -> bool:
+        """
+        Checks a single signature on the calling thread.
+        """
+        return self._check(alg, signing_input, signature)
+
+    def verify_many(self, jobs: Iterable[SignatureJob]) -> Iterator[bool | PyJWTError]:
+        """
+        Lazily yields whether each ``(alg, signing_input, signature)`` job
+        has a valid signature, in input order.
+
+        A :class:`~jwt.exceptions.PyJWTError` raised for a job (e.g. the key
+        does not suit its algorithm) is yielded in place of its result. Any
+        other exception (e.g. an unsupported algorithm name) ends the stream.
+        Only a bounded window of chunks is read ahead of the consumer, so
+        ``jobs`` can be an arbitrarily long iterator.
+        """
+        if self.mode == "sync":
+            return map(self._check.check_job, jobs)
+
+        if self.mode == "thread":
+            func = self._check.check_chunk
+        else:
+            func = _check_chunk
+        return imap_chunks(
+            self._get_executor(), func, jobs, self.chunksize, self.max_workers * 2
+        )
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # Imported here so that importing jwt does not load
+                # concurrent.futures.
+                from concurrent.futures import (
+                    ProcessPoolExecutor,
+                    ThreadPoolExecutor,
+                )
+
+                if self.mode == "thread":
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        initializer=_init_verify_worker,
+                        initargs=(_serialize_key(self._key),),
+                    )
+            return self._executor
@@ -0,0 +1,129 @@
+"""
+Lambda 핸들러들이 공유하는 런타임 컨텍스트
+
+warm 컨테이너에서는 모듈 전역 상태가 호출 사이에 유지되므로, boto3 세션,
+DynamoDB 클라이언트, SES 클라이언트, JWT 키/서명기/검증기를 컨테이너당 한 번만
+(처음 필요할 때) 만들고 이후 호출에서 재사용한다. AWS 클라이언트의 연결 풀, 재시도,
+타임아웃, 엔드포인트 설정은 client_factory를 따른다.
+
+테스트에서는 reset()으로 캐시를 비우거나 로컬 대체 객체를 주입할 수 있다:
+
+    runtime_context.reset(dynamodb_client=FakeDynamoDBClient(), jwt_secret='test')
+"""
+import os
+import threading
+
+import boto3
+
+import client_factory
+
+USERS_TABLE = 'alcolook-users'
+USER_PROFILES_TABLE = 'alcolook-user-profiles'
+
+DEFAULT_JWT_SECRET = 'your-super-secret-jwt-key-change-this-in-production'
+
+# 검증된 JWT를 재검증 없이 재사용하는 시간 (초)
+JWT_CACHE_TTL = int(os.environ.get('JWT_CACHE_TTL', '300'))
+
+_lock = threading.RLock()
+_state = {}
+
+
+def _get_or_create(name, factory):
+    # 빠른 경로: 이미 만들어진 객체는 락 없이 반환
+    try:
+        return _state[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        if name not in _state:
+            _state[name] = factory()
+        return _state[name]
+
+
+def get_session():
+    return _get_or_create('session', boto3.session.Session)
+
+
+def get_dynamodb_client():
+    # 핸들러는 user_store를 통해 저수준 클라이언트만 사용
+    return _get_or_create(
+        'dynamodb_client',
+        lambda: client_factory.create_client(get_session(), 'dynamodb'),
+    )
+
+
+def _create_ses():
+    # SES는 선택적으로 사용 (클라이언트를 만들 수 없으면 None)
+    try:
+        return client_factory.create_client(get_session(), 'ses')
+    except Exception as e:
+        print(f"SES client unavailable: {e}")
+        return None
+
+
+def get_ses():
+    return _get_or_create('ses', _create_ses)
+
+
+def get_jwt_secret():
+    return _get_or_create(
+        'jwt_secret', lambda: os.environ.get('JWT_SECRET', DEFAULT_JWT_SECRET)
+    )
+
+
+def _prepare_jwt_key():
+    # HS256 키 검증(PEM/SSH 키 여부 검사)을 컨테이너당 한 번만 수행
+    import jwt
+
+    return jwt.get_algorithm_by_name('HS256').prepare_key(get_jwt_secret())
+
+
+def get_jwt_key():
+    return _get_or_create('jwt_key', _prepare_jwt_key)
+
+
+def _create_jwt_signer():
+    import jwt
+
+    return jwt.Signer(get_jwt_key(), algorithm='HS256')
+
+
+def get_jwt_signer():
+    return _get_or_create('jwt_signer', _create_jwt_signer)
+
+
+def _create_jwt_verifier():
+    import jwt
+
+    # 무제한 토큰이므로 exp 검증 비활성화
+    # 앱은 같은 토큰을 매 요청마다 보내므로 검증된 토큰은 TTL 동안 캐시해 재검증을 생략
+    return jwt.Verifier(
+        get_jwt_key(),
+        algorithms=['HS256'],
+        options={'verify_exp': False},
+        cache=jwt.VerifiedTokenCache(maxsize=256, ttl=JWT_CACHE_TTL),
+    )
+
+
+def get_jwt_verifier():
+    return _get_or_create('jwt_verifier', _create_jwt_verifier)
+
+
+def reset(session=None, dynamodb_client=None, ses=None, jwt_secret=None):
+    """
+    캐시된 객체를 모두 버린다. 인자로 넘긴 객체는 다음 호출부터 그대로 사용된다.
+    (테스트에서 로컬 DynamoDB/SES 대체 객체를 주입할 때 사용)
+    """
+    with _lock:
+        _state.clear()
+
+        if session is not None:
+            _state['session'] = session
+        if dynamodb_client is not None:
+            _state['dynamodb_client'] = dynamodb_client
+        if ses is not None:
+            _state['ses'] = ses
+        if jwt_secret is not None:
+            _state['jwt_secret'] = jwt_secret
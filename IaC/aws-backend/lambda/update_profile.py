@@ -1,9 +1,10 @@
-import json
-import boto3
 import jwt
-import os
 from datetime import datetime
 
+import json_codec
+import runtime_context
+import user_store
+
 def lambda_handler(event, context):
     # CORS 헤더
     headers = {
@@ -17,7 +18,7 @@ def lambda_handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({'message': 'CORS preflight'})
+            'body': json_codec.dumps({'message': 'CORS preflight'})
         }
     
     try:
@@ -29,15 +30,15 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 401,
                 'headers': headers,
-                'body': json.dumps({'error': 'Authorization token required'})
+                'body': json_codec.dumps({'error': 'Authorization token required'})
             }
         
         token = auth_header.replace('Bearer ', '')
-        jwt_secret = os.environ.get('JWT_SECRET', 'your-super-secret-jwt-key-change-this-in-production')
+        jwt_verifier = runtime_context.get_jwt_verifier()
         
         try:
-            # 무제한 토큰이므로 exp 검증 비활성화
-            decoded_token = jwt.decode(token, jwt_secret, algorithms=['HS256'], options={"verify_exp": False})
+            # 무제한 토큰이므로 exp 검증 비활성화 (runtime_context에서 설정)
+            decoded_token = jwt_verifier.decode(token)
             token_user_id = decoded_token.get('user_id')
             print(f"Decoded token user_id: {token_user_id}")
         except jwt.InvalidTokenError as e:
@@ -45,15 +46,11 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 401,
                 'headers': headers,
-                'body': json.dumps({'error': 'Invalid token'})
+                'body': json_codec.dumps({'error': 'Invalid token'})
             }
         
-        # DynamoDB 클라이언트 초기화
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table('alcolook-user-profiles')
-        
         # 요청 본문 파싱
-        body = json.loads(event['body'])
+        body = json_codec.loads(event['body'])
         user_id = body.get('userId') or body.get('user_id')
         sex = body.get('sex', 'UNSET')
         age = body.get('age')
@@ -68,7 +65,7 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 403,
                 'headers': headers,
-                'body': json.dumps({'error': 'Access denied'})
+                'body': json_codec.dumps({'error': 'Access denied'})
             }
         
         # 필수 필드 검증
@@ -76,47 +73,35 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 400,
                 'headers': headers,
-                'body': json.dumps({'error': 'userId is required'})
+                'body': json_codec.dumps({'error': 'userId is required'})
             }
         
         # 업데이트할 데이터 준비
-        update_expression = "SET sex = :sex, updated_at = :time"
-        expression_values = {
-            ':sex': sex,
-            ':time': datetime.utcnow().isoformat() + 'Z'
+        update_values = {
+            'sex': sex,
+            'updated_at': datetime.utcnow().isoformat() + 'Z'
         }
         
         # 선택적 필드들 추가
         if age is not None:
-            update_expression += ", age = :age"
-            expression_values[':age'] = age
+            update_values['age'] = age
             
         if is_senior_65 is not None:
-            update_expression += ", isSenior65 = :senior"
-            expression_values[':senior'] = is_senior_65
+            update_values['isSenior65'] = is_senior_65
             
         if weekly_goal is not None:
-            update_expression += ", weeklyGoalStdDrinks = :goal"
-            expression_values[':goal'] = weekly_goal
-        
-        print(f"DynamoDB update: {update_expression}")
+            update_values['weeklyGoalStdDrinks'] = weekly_goal
         
-        # DynamoDB 업데이트 (upsert)
-        response = table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_values,
-            ReturnValues='ALL_NEW'
-        )
+        print(f"DynamoDB update: {', '.join(update_values)}")
         
-        # 응답 데이터 준비
-        updated_item = response['Attributes']
+        # DynamoDB 업데이트 (upsert), 갱신된 프로필 전체를 반환
+        updated_item = user_store.update_profile(user_id, update_values)
         print(f"Profile updated successfully for user: {user_id}")
         
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'message': 'Profile updated successfully',
                 'profile': {
                     'user_id': updated_item['user_id'],
@@ -134,5 +119,5 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': headers,
-            'body': json.dumps({'error': f'Internal server error: {str(e)}'})
+            'body': json_codec.dumps({'error': f'Internal server error: {str(e)}'})
         }
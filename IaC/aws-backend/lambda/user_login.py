@@ -1,15 +1,9 @@
-import json
-import boto3
 import hashlib
-import jwt
-import os
 from datetime import datetime, timedelta
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('alcolook-users')
-
-# JWT 시크릿 키 (환경변수에서 가져오기)
-JWT_SECRET = os.environ.get('JWT_SECRET', 'your-super-secret-jwt-key-change-this-in-production')
+import json_codec
+import runtime_context
+import user_store
 
 def lambda_handler(event, context):
     try:
@@ -26,11 +20,11 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 200,
                 'headers': headers,
-                'body': json.dumps({'message': 'OK'})
+                'body': json_codec.dumps({'message': 'OK'})
             }
         
         # 요청 본문 파싱
-        body = json.loads(event['body'])
+        body = json_codec.loads(event['body'])
         email = body.get('email')
         password = body.get('password')
         
@@ -39,32 +33,30 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 400,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '이메일과 비밀번호를 입력해주세요.'
                 })
             }
         
         # 사용자 조회
-        response = table.get_item(Key={'email': email})
+        user = user_store.get_user(email)
         
-        if 'Item' not in response:
+        if user is None:
             return {
                 'statusCode': 401,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '이메일 또는 비밀번호가 잘못되었습니다.'
                 })
             }
         
-        user = response['Item']
-        
         # 비밀번호 검증
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         if user['password_hash'] != password_hash:
             return {
                 'statusCode': 401,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '이메일 또는 비밀번호가 잘못되었습니다.'
                 })
             }
@@ -76,13 +68,14 @@ def lambda_handler(event, context):
             'name': user['name']
             # exp 제거 - 무제한 기한
         }
-        token = jwt.encode(payload, JWT_SECRET, algorithm='HS256')
+        # 키와 헤더는 컨테이너당 한 번만 준비된 서명기로 발급
+        token = runtime_context.get_jwt_signer().encode(payload)
         
         # 로그인 성공
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'message': '로그인이 완료되었습니다.',
                 'user_id': user['user_id'],
                 'email': user['email'],
@@ -99,7 +92,7 @@ def lambda_handler(event, context):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'error': '서버 오류가 발생했습니다.'
             })
         }
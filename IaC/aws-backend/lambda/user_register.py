@@ -1,11 +1,9 @@
-import json
-import boto3
 import hashlib
 import uuid
 from datetime import datetime
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('alcolook-users')
+import json_codec
+import user_store
 
 def lambda_handler(event, context):
     try:
@@ -26,7 +24,7 @@ def lambda_handler(event, context):
             }
         
         # 요청 본문 파싱
-        body = json.loads(event['body'])
+        body = json_codec.loads(event['body'])
         email = body.get('email')
         password = body.get('password')
         name = body.get('name')
@@ -36,32 +34,17 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 400,
                 'headers': headers,
-                'body': json.dumps({
+                'body': json_codec.dumps({
                     'error': '이메일, 비밀번호, 이름은 필수입니다.'
                 })
             }
         
-        # 이메일 중복 확인
-        try:
-            response = table.get_item(Key={'email': email})
-            if 'Item' in response:
-                return {
-                    'statusCode': 409,
-                    'headers': headers,
-                    'body': json.dumps({
-                        'error': '이미 존재하는 이메일입니다.'
-                    })
-                }
-        except Exception as e:
-            print(f"Error checking email: {e}")
-        
         # 비밀번호 해시화
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         
         # 사용자 ID 생성
         user_id = str(uuid.uuid4())
         
-        # 사용자 정보 저장
         user_item = {
             'email': email,
             'user_id': user_id,
@@ -71,12 +54,20 @@ def lambda_handler(event, context):
             'updated_at': datetime.utcnow().isoformat()
         }
         
-        table.put_item(Item=user_item)
+        # 사용자 정보 저장 (같은 이메일이 없을 때만 저장하므로 중복 확인 조회가 필요 없음)
+        if not user_store.create_user(user_item):
+            return {
+                'statusCode': 409,
+                'headers': headers,
+                'body': json_codec.dumps({
+                    'error': '이미 존재하는 이메일입니다.'
+                })
+            }
         
         return {
             'statusCode': 201,
             'headers': headers,
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'message': '회원가입이 완료되었습니다.',
                 'user_id': user_id,
                 'email': email,
@@ -89,7 +80,7 @@ def lambda_handler(event, context):
         return {
             'statusCode': 500,
             'headers': headers,
-            'body': json.dumps({
+            'body': json_codec.dumps({
                 'error': '서버 오류가 발생했습니다.'
             })
         }
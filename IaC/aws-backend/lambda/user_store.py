@@ -0,0 +1,364 @@
+"""
+alcolook-users / alcolook-user-profiles 테이블 데이터 접근 모듈
+
+boto3 리소스 계층(boto3.resource('dynamodb').Table) 대신 저수준 DynamoDB
+클라이언트를 직접 호출한다. 리소스 계층은 import와 생성 비용이 크고, 매 호출마다
+TypeSerializer/TypeDeserializer로 모든 값을 변환한다. 여기서는 두 테이블의 고정된
+스키마에 맞춘 속성별 변환 함수를 미리 만들어 두고, 결과는 일반 dict로 돌려준다.
+
+스키마:
+
+    alcolook-users          email(키), user_id, name, password_hash, created_at,
+                            updated_at, reset_token, reset_expires, reset_created
+                            (모두 문자열)
+    alcolook-user-profiles  user_id(키), sex, updated_at (문자열),
+                            age, weeklyGoalStdDrinks (정수), isSenior65 (불리언)
+
+스키마에 없는 속성이나 스키마와 다른 타입의 값은 리소스 계층의 TypeSerializer로
+변환한다. (float는 지원하지 않고, 소수가 있는 숫자는 Decimal로, 바이너리는 bytes로 읽는다)
+
+클라이언트는 runtime_context.get_dynamodb_client()에서 가져오므로, 테스트에서는
+runtime_context.reset(dynamodb_client=...)으로 대체 객체를 주입할 수 있다.
+"""
+import random
+import time
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+import runtime_context
+
+
+# batch_write_item / batch_get_item 한 번에 보낼 수 있는 최대 항목 수
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+
+# 처리되지 않은 항목(Unprocessed*) 재시도: 최대 시도 횟수, 첫 대기 시간(초, 매번 두 배)과
+# 최대 대기 시간
+BATCH_MAX_ATTEMPTS = 10
+BATCH_BACKOFF = 0.05
+BATCH_BACKOFF_MAX = 5.0
+
+# TypeSerializer는 38자리를 넘는 숫자를 거부하므로 그보다 작은 정수만 바로 변환
+_MAX_INT = 10 ** 38
+
+# 빠른 경로에 맞지 않는 값은 리소스 계층과 똑같이 변환
+_encode_value = TypeSerializer().serialize
+
+
+def _decode_number(text):
+    # 정수는 int, 소수/지수 표기는 Decimal
+    try:
+        return int(text)
+    except ValueError:
+        return Decimal(text)
+
+
+def _decode_value(attr):
+    (tag, raw), = attr.items()
+    if tag == 'S':
+        return raw
+    if tag == 'N':
+        return _decode_number(raw)
+    if tag == 'BOOL':
+        return raw
+    if tag == 'NULL':
+        return None
+    if tag == 'M':
+        return {k: _decode_value(v) for k, v in raw.items()}
+    if tag == 'L':
+        return [_decode_value(v) for v in raw]
+    if tag == 'B':
+        return raw
+    if tag == 'SS' or tag == 'BS':
+        return set(raw)
+    if tag == 'NS':
+        return {_decode_number(v) for v in raw}
+    raise TypeError(f'Dynamodb type {tag} is not supported')
+
+
+def _string_codec():
+    def encode(value):
+        if type(value) is str:
+            return {'S': value}
+        return _encode_value(value)
+
+    def decode(attr):
+        try:
+            return attr['S']
+        except KeyError:
+            return _decode_value(attr)
+
+    return encode, decode
+
+
+def _int_codec():
+    def encode(value):
+        if type(value) is int and -_MAX_INT < value < _MAX_INT:
+            return {'N': str(value)}
+        return _encode_value(value)
+
+    def decode(attr):
+        try:
+            return int(attr['N'])
+        except (KeyError, ValueError):
+            return _decode_value(attr)
+
+    return encode, decode
+
+
+def _bool_codec():
+    def encode(value):
+        if type(value) is bool:
+            return {'BOOL': value}
+        return _encode_value(value)
+
+    def decode(attr):
+        try:
+            return attr['BOOL']
+        except KeyError:
+            return _decode_value(attr)
+
+    return encode, decode
+
+
+_CODECS = {'S': _string_codec(), 'N': _int_codec(), 'BOOL': _bool_codec()}
+
+
+class _Schema:
+    def __init__(self, table_name, key_name, attribute_types):
+        self.table_name = table_name
+        self.key_name = key_name
+        codecs = {name: _CODECS[tag] for name, tag in attribute_types.items()}
+        self._encoders = {name: codec[0] for name, codec in codecs.items()}
+        self._decoders = {name: codec[1] for name, codec in codecs.items()}
+        self._encode_key = self._encoders[key_name]
+        # 속성 이름 조합별 UpdateExpression (핸들러마다 조합이 몇 개뿐이라 크기가 작음)
+        self._update_plans = {}
+
+    def key(self, value):
+        return {self.key_name: self._encode_key(value)}
+
+    def encode_item(self, item):
+        encoders = self._encoders
+        return {
+            name: encoders.get(name, _encode_value)(value)
+            for name, value in item.items()
+        }
+
+    def decode_item(self, item):
+        decoders = self._decoders
+        return {
+            name: decoders.get(name, _decode_value)(attr)
+            for name, attr in item.items()
+        }
+
+    def update_plan(self, names):
+        try:
+            return self._update_plans[names]
+        except KeyError:
+            pass
+
+        # name 같은 예약어도 쓸 수 있도록 속성 이름은 항상 #n 자리표시자로 넘김
+        expression = 'SET ' + ', '.join(
+            f'#n{i} = :v{i}' for i in range(len(names))
+        )
+        attribute_names = {f'#n{i}': name for i, name in enumerate(names)}
+        placeholders = tuple(
+            (f':v{i}', self._encoders.get(name, _encode_value))
+            for i, name in enumerate(names)
+        )
+        plan = (expression, attribute_names, placeholders)
+        self._update_plans[names] = plan
+        return plan
+
+    def update_request(self, key, values):
+        expression, attribute_names, placeholders = self.update_plan(tuple(values))
+        return {
+            'TableName': self.table_name,
+            'Key': self.key(key),
+            'UpdateExpression': expression,
+            'ExpressionAttributeNames': attribute_names,
+            'ExpressionAttributeValues': {
+                placeholder: encode(value)
+                for (placeholder, encode), value in zip(placeholders, values.values())
+            },
+        }
+
+
+USERS = _Schema(
+    runtime_context.USERS_TABLE,
+    'email',
+    {
+        'email': 'S',
+        'user_id': 'S',
+        'name': 'S',
+        'password_hash': 'S',
+        'created_at': 'S',
+        'updated_at': 'S',
+        'reset_token': 'S',
+        'reset_expires': 'S',
+        'reset_created': 'S',
+    },
+)
+
+USER_PROFILES = _Schema(
+    runtime_context.USER_PROFILES_TABLE,
+    'user_id',
+    {
+        'user_id': 'S',
+        'sex': 'S',
+        'age': 'N',
+        'isSenior65': 'BOOL',
+        'weeklyGoalStdDrinks': 'N',
+        'updated_at': 'S',
+    },
+)
+
+
+def get_user(email):
+    """
+    이메일로 사용자를 조회한다. 없으면 None.
+    """
+    response = runtime_context.get_dynamodb_client().get_item(
+        TableName=USERS.table_name, Key=USERS.key(email)
+    )
+    item = response.get('Item')
+    if item is None:
+        return None
+    return USERS.decode_item(item)
+
+
+def put_user(user):
+    """
+    사용자 항목 전체를 저장한다. (같은 이메일이 있으면 덮어씀)
+    """
+    runtime_context.get_dynamodb_client().put_item(
+        TableName=USERS.table_name, Item=USERS.encode_item(user)
+    )
+
+
+def create_user(user):
+    """
+    같은 이메일의 사용자가 없을 때만 저장한다. (조건부 put_item 한 번)
+    저장했으면 True, 이미 있는 이메일이면 False.
+    """
+    try:
+        runtime_context.get_dynamodb_client().put_item(
+            TableName=USERS.table_name,
+            Item=USERS.encode_item(user),
+            ConditionExpression='attribute_not_exists(email)',
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+            return False
+        raise
+    return True
+
+
+def _batch_call(call, request, unprocessed_field, handle_response=None):
+    # 처리되지 않은 항목만 다시 보내며, 지수 백오프(full jitter)로 대기
+    for attempt in range(BATCH_MAX_ATTEMPTS):
+        response = call(RequestItems=request)
+        if handle_response is not None:
+            handle_response(response)
+        request = response.get(unprocessed_field)
+        if not request:
+            return
+        delay = min(BATCH_BACKOFF_MAX, BATCH_BACKOFF * 2 ** attempt)
+        time.sleep(random.uniform(0, delay))
+
+    # UnprocessedItems: {테이블: [요청...]}, UnprocessedKeys: {테이블: {'Keys': [...]}}
+    remaining = sum(
+        len(pending['Keys'] if isinstance(pending, dict) else pending)
+        for pending in request.values()
+    )
+    raise RuntimeError(
+        f'{remaining} items still unprocessed after {BATCH_MAX_ATTEMPTS} attempts'
+    )
+
+
+def put_users(users):
+    """
+    사용자 항목들을 batch_write_item으로 25개씩 저장한다. (같은 이메일이 있으면 덮어씀)
+    한 번에 넘기는 항목들의 이메일은 서로 달라야 한다. 처리되지 않은 항목은 백오프하며
+    재시도하고, BATCH_MAX_ATTEMPTS번 안에 끝나지 않으면 RuntimeError.
+    """
+    client = runtime_context.get_dynamodb_client()
+    for start in range(0, len(users), BATCH_WRITE_LIMIT):
+        request = {
+            USERS.table_name: [
+                {'PutRequest': {'Item': USERS.encode_item(user)}}
+                for user in users[start:start + BATCH_WRITE_LIMIT]
+            ]
+        }
+        _batch_call(client.batch_write_item, request, 'UnprocessedItems')
+
+
+def find_existing_emails(emails):
+    """
+    emails 중 이미 가입된 이메일의 집합을 반환한다. (batch_get_item, 100개씩)
+    """
+    client = runtime_context.get_dynamodb_client()
+    emails = list(dict.fromkeys(emails))
+    found = set()
+
+    def collect(response):
+        for item in response.get('Responses', {}).get(USERS.table_name, ()):
+            found.add(item['email']['S'])
+
+    for start in range(0, len(emails), BATCH_GET_LIMIT):
+        request = {
+            USERS.table_name: {
+                'Keys': [
+                    USERS.key(email) for email in emails[start:start + BATCH_GET_LIMIT]
+                ],
+                'ProjectionExpression': '#e',
+                'ExpressionAttributeNames': {'#e': 'email'},
+            }
+        }
+        _batch_call(client.batch_get_item, request, 'UnprocessedKeys', collect)
+    return found
+
+
+def scan_users(segment=0, total_segments=1, page_size=None):
+    """
+    사용자 항목들을 차례로 반환하는 제너레이터. 병렬 스캔에서는 세그먼트마다 따로
+    호출한다. (한 번에 한 페이지만 메모리에 둠)
+    """
+    client = runtime_context.get_dynamodb_client()
+    request = {'TableName': USERS.table_name}
+    if total_segments > 1:
+        request['Segment'] = segment
+        request['TotalSegments'] = total_segments
+    if page_size:
+        request['Limit'] = page_size
+
+    while True:
+        response = client.scan(**request)
+        for item in response.get('Items', ()):
+            yield USERS.decode_item(item)
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        request['ExclusiveStartKey'] = last_key
+
+
+def update_user(email, values):
+    """
+    사용자 항목의 속성들을 values 값으로 설정한다.
+    """
+    runtime_context.get_dynamodb_client().update_item(
+        **USERS.update_request(email, values)
+    )
+
+
+def update_profile(user_id, values):
+    """
+    프로필 속성들을 values 값으로 설정하고(없으면 생성) 갱신된 프로필 전체를 반환한다.
+    """
+    response = runtime_context.get_dynamodb_client().update_item(
+        ReturnValues='ALL_NEW', **USER_PROFILES.update_request(user_id, values)
+    )
+    return USER_PROFILES.decode_item(response['Attributes'])
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 테스트는 Lambda 배포 패키지와 같은 평면 구조(핸들러, 공유 모듈, 벤더링한 jwt)를 import
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'lambda')
+sys.path.insert(0, LAMBDA_DIR)
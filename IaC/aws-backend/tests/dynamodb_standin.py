@@ -0,0 +1,155 @@
+"""
+테스트용 DynamoDB 대체 서버
+
+DynamoDB JSON 프로토콜로 GetItem, PutItem(attribute_not_exists 조건 포함),
+BatchGetItem, BatchWriteItem(PutRequest), Scan(병렬 스캔과 페이지 포함)만 처리하는
+메모리 기반 HTTP 서버. 실제 boto3 클라이언트를 DYNAMODB_ENDPOINT_URL로 붙여 쓴다.
+
+failing_scan_segments에 세그먼트 번호를 넣으면 그 세그먼트의 두 번째 페이지부터
+Scan이 실패한다. connection_count는 지금까지 받은 TCP 연결 수다.
+"""
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_CONDITION_FAILED = 'com.amazonaws.dynamodb.v20120810#ConditionalCheckFailedException'
+_NOT_FOUND = 'com.amazonaws.dynamodb.v20120810#ResourceNotFoundException'
+
+
+class DynamoDBStandIn:
+    def __init__(self, keys):
+        # 테이블 이름 -> 키 속성 이름
+        self.keys = keys
+        self.tables = {name: {} for name in keys}
+        self.put_count = 0
+        self.connection_count = 0
+        self.failing_scan_segments = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint_url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, operation, request):
+        if operation == 'BatchGetItem':
+            return self._batch_get(request['RequestItems'])
+        if operation == 'BatchWriteItem':
+            return self._batch_write(request['RequestItems'])
+
+        table_name = request['TableName']
+        table = self.tables[table_name]
+        key_name = self.keys[table_name]
+
+        with self._lock:
+            if operation == 'GetItem':
+                item = table.get(request['Key'][key_name]['S'])
+                return 200, {'Item': item} if item else {}
+
+            if operation == 'PutItem':
+                item = request['Item']
+                key = item[key_name]['S']
+                condition = request.get('ConditionExpression')
+                if condition == f'attribute_not_exists({key_name})' and key in table:
+                    return 400, {
+                        '__type': _CONDITION_FAILED,
+                        'message': 'The conditional request failed',
+                    }
+                table[key] = item
+                self.put_count += 1
+                return 200, {}
+
+            if operation == 'Scan':
+                return self._scan(table, key_name, request)
+
+        return 400, {'__type': 'UnknownOperationException'}
+
+    def _batch_get(self, request_items):
+        responses = {}
+        with self._lock:
+            for table_name, request in request_items.items():
+                key_name = self.keys[table_name]
+                table = self.tables[table_name]
+                found = responses.setdefault(table_name, [])
+                for key in request['Keys']:
+                    item = table.get(key[key_name]['S'])
+                    if item:
+                        # ProjectionExpression은 키 속성만 쓰므로 키만 반환
+                        found.append({key_name: item[key_name]})
+        return 200, {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def _batch_write(self, request_items):
+        with self._lock:
+            for table_name, requests in request_items.items():
+                key_name = self.keys[table_name]
+                for request in requests:
+                    item = request['PutRequest']['Item']
+                    self.tables[table_name][item[key_name]['S']] = item
+                    self.put_count += 1
+        return 200, {'UnprocessedItems': {}}
+
+    def _scan(self, table, key_name, request):
+        segment = request.get('Segment', 0)
+        total_segments = request.get('TotalSegments', 1)
+        start_key = request.get('ExclusiveStartKey')
+        if start_key and segment in self.failing_scan_segments:
+            return 400, {'__type': _NOT_FOUND, 'message': 'Scan failed'}
+
+        # 실제 DynamoDB처럼 키의 해시로 세그먼트를 나누고 세그먼트 안에서는 키 순서
+        keys = sorted(
+            key for key in table
+            if zlib.crc32(key.encode()) % total_segments == segment
+        )
+        if start_key:
+            keys = [key for key in keys if key > start_key[key_name]['S']]
+
+        limit = request.get('Limit', len(keys))
+        page = keys[:limit]
+        response = {'Items': [table[key] for key in page], 'Count': len(page)}
+        if len(keys) > limit:
+            response['LastEvaluatedKey'] = {key_name: {'S': page[-1]}}
+        return 200, response
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문을 따로 쓰므로 keep-alive 연결에서 지연 ACK를 기다리지 않도록
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with standin._lock:
+                    standin.connection_count += 1
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                operation = self.headers.get('X-Amz-Target', '').split('.')[-1]
+                status, response = standin.handle(operation, request)
+
+                body = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/x-amz-json-1.0')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('x-amzn-RequestId', 'standin')
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
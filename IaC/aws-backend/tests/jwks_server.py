@@ -0,0 +1,60 @@
+"""
+테스트용 JWKS 엔드포인트
+
+body를 그대로 응답하는 HTTP 서버. 응답 지연(delay)과 상태 코드(status)를 바꿀 수 있고,
+받은 요청 수를 request_count로 센다.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# cryptography 없이 쓸 수 있는 HMAC 키 하나짜리 JWK Set
+JWKS = {'keys': [{'kty': 'oct', 'kid': 'key-1', 'alg': 'HS256', 'k': 'c2VjcmV0'}]}
+
+
+class JWKSServer:
+    def __init__(self, body=None, delay=0, status=200):
+        self.body = json.dumps(JWKS).encode() if body is None else body
+        self.delay = delay
+        self.status = status
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/.well-known/jwks.json'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                if server.delay:
+                    time.sleep(server.delay)
+
+                body = server.body
+                self.send_response(server.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
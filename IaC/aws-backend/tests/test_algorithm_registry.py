@@ -0,0 +1,76 @@
+import hashlib
+import hmac
+
+import pytest
+
+import jwt
+from jwt import algorithms
+
+
+class ReversedHMAC(algorithms.HMACAlgorithm):
+    # 등록한 인스턴스에서만 쓰이는지 확인하기 위한 알고리즘
+    def sign(self, msg, key):
+        return super().sign(msg, key)[::-1]
+
+    def verify(self, msg, key, sig):
+        return hmac.compare_digest(sig, self.sign(msg, key))
+
+
+def test_instances_share_the_default_algorithm_objects():
+    first, second = jwt.PyJWS(), jwt.PyJWS(algorithms=['HS256', 'RS256'])
+
+    assert set(first.get_algorithms()) == set(algorithms.get_default_algorithms())
+    assert sorted(second.get_algorithms()) == ['HS256', 'RS256']
+    assert first.get_algorithm_by_name('HS256') is second.get_algorithm_by_name(
+        'HS256'
+    )
+    assert first.get_algorithm_by_name('HS256') is jwt.get_algorithm_by_name('HS256')
+
+    jwk = jwt.PyJWK({'kty': 'oct', 'k': 'c2VjcmV0'})
+    assert jwk.Algorithm is first.get_algorithm_by_name('HS256')
+    with pytest.raises(NotImplementedError):
+        second.get_algorithm_by_name('HS384')
+
+
+def test_register_and_unregister_change_only_one_instance():
+    custom = jwt.PyJWS()
+    other = jwt.PyJWS()
+    custom.register_algorithm('HS256R', ReversedHMAC(hashlib.sha256))
+    custom.unregister_algorithm('HS512')
+
+    token = custom.encode(b'payload', 'secret', algorithm='HS256R')
+    assert custom.decode(token, 'secret', algorithms=['HS256R']) == b'payload'
+
+    assert 'HS256R' not in other.get_algorithms()
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        other.decode(token, 'secret', algorithms=['HS256R'])
+
+    # 다른 인스턴스와 공유 객체에는 영향이 없어야 함
+    assert 'HS512' in other.get_algorithms()
+    assert 'HS512' in algorithms.default_algorithms
+    assert other.encode(b'p', 'secret', algorithm='HS512')
+    assert jwt.PyJWK({'kty': 'oct', 'k': 'c2VjcmV0', 'alg': 'HS512'}).key
+
+
+def test_registry_errors_match_the_baseline():
+    jws = jwt.PyJWS()
+
+    with pytest.raises(ValueError, match='already has a handler'):
+        jws.register_algorithm('HS256', ReversedHMAC(hashlib.sha256))
+    with pytest.raises(TypeError):
+        jws.register_algorithm('X', object())
+    with pytest.raises(KeyError):
+        jws.unregister_algorithm('X')
+
+    # 교체한 항목은 그 인스턴스에서만 바뀜
+    jws.unregister_algorithm('HS256')
+    jws.register_algorithm('HS256', ReversedHMAC(hashlib.sha256))
+    assert type(jws.get_algorithm_by_name('HS256')) is ReversedHMAC
+    assert type(jwt.get_algorithm_by_name('HS256')) is algorithms.HMACAlgorithm
+
+
+def test_default_algorithms_is_read_only():
+    with pytest.raises(TypeError):
+        algorithms.default_algorithms['HS256'] = ReversedHMAC(hashlib.sha256)
+    with pytest.raises(KeyError):
+        algorithms.default_algorithms['HS999']
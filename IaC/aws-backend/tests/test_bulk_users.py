@@ -0,0 +1,236 @@
+import hashlib
+import io
+import json
+import threading
+
+import pytest
+
+pytest.importorskip('boto3')
+
+import bulk_users  # noqa: E402
+import runtime_context  # noqa: E402
+from botocore.exceptions import ClientError  # noqa: E402
+from dynamodb_standin import DynamoDBStandIn  # noqa: E402
+
+
+class FakeDynamoDB:
+    def __init__(self):
+        self.items = {}
+
+    def batch_get_item(self, RequestItems):
+        ((table, request),) = RequestItems.items()
+        found = [
+            {'email': key['email']}
+            for key in request['Keys']
+            if key['email']['S'] in self.items
+        ]
+        return {'Responses': {table: found}, 'UnprocessedKeys': {}}
+
+    def batch_write_item(self, RequestItems):
+        ((table, requests),) = RequestItems.items()
+        for request in requests:
+            item = request['PutRequest']['Item']
+            self.items[item['email']['S']] = item
+        return {'UnprocessedItems': {}}
+
+
+@pytest.fixture
+def client():
+    client = FakeDynamoDB()
+    runtime_context.reset(dynamodb_client=client)
+    yield client
+    runtime_context.reset()
+
+
+def test_import_skips_malformed_lines(client):
+    stream = io.StringIO(
+        '{"email": "a@x.com", "password": "pw", "name": "A"}\n'
+        '{bad json\n'
+        '{"email": "b@x.com", "password": "pw", "name": "B"}\n'
+    )
+
+    stats = bulk_users.import_users(stream, hash_workers=0, writers=1)
+
+    assert stats == {'imported': 2, 'existing': 0, 'duplicate': 0, 'invalid': 1}
+    assert sorted(client.items) == ['a@x.com', 'b@x.com']
+    assert client.items['a@x.com']['password_hash'] == {
+        'S': hashlib.sha256(b'pw').hexdigest()
+    }
+
+
+@pytest.mark.parametrize(
+    'password_hash',
+    [123, {'x': 1}, 'not-a-hash', 'A' * 64, 'a' * 63],
+)
+def test_import_rejects_invalid_password_hash(client, password_hash):
+    record = {'email': 'a@x.com', 'name': 'A', 'password_hash': password_hash}
+    line = bulk_users.json_codec.dumps(record) + '\n'
+
+    stats = bulk_users.import_users(io.StringIO(line), hash_workers=0, writers=1)
+
+    assert stats['invalid'] == 1
+    assert client.items == {}
+
+
+def test_import_keeps_valid_password_hash(client):
+    password_hash = hashlib.sha256(b'pw').hexdigest()
+    line = bulk_users.json_codec.dumps(
+        {'email': 'a@x.com', 'name': 'A', 'password_hash': password_hash}
+    )
+
+    stats = bulk_users.import_users(io.StringIO(line), hash_workers=0, writers=1)
+
+    assert stats['imported'] == 1
+    assert client.items['a@x.com']['password_hash'] == {'S': password_hash}
+
+
+@pytest.mark.parametrize('field', ['user_id', 'created_at', 'updated_at'])
+@pytest.mark.parametrize('value', ['', 123, ['x'], {'S': 'x'}])
+def test_import_rejects_invalid_copied_fields(client, field, value):
+    record = {'email': 'a@x.com', 'name': 'A', 'password': 'pw', field: value}
+    line = bulk_users.json_codec.dumps(record) + '\n'
+
+    stats = bulk_users.import_users(io.StringIO(line), hash_workers=0, writers=1)
+
+    assert stats['invalid'] == 1
+    assert client.items == {}
+
+
+def test_csv_empty_cells_are_missing_values(client):
+    stream = io.StringIO(
+        'email,password,name,user_id,created_at\n'
+        'a@x.com,pw,A,,\n'
+        'b@x.com,pw,B,user-b,2024-01-01T00:00:00\n'
+    )
+
+    stats = bulk_users.import_users(stream, 'csv', hash_workers=0, writers=1)
+
+    assert stats['imported'] == 2
+    assert client.items['a@x.com']['user_id']['S']
+    assert client.items['b@x.com']['user_id'] == {'S': 'user-b'}
+    assert client.items['b@x.com']['created_at'] == {'S': '2024-01-01T00:00:00'}
+
+
+USERS = 40
+
+
+@pytest.fixture
+def dynamodb(monkeypatch):
+    # 작은 페이지와 큐로 여러 페이지, 가득 찬 큐를 거치게 함
+    monkeypatch.setattr(bulk_users, 'EXPORT_PAGE_SIZE', 3)
+    monkeypatch.setattr(bulk_users, 'EXPORT_QUEUE_PAGES', 1)
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+    def start():
+        standin = DynamoDBStandIn({runtime_context.USERS_TABLE: 'email'})
+        standin.__enter__()
+        standins.append(standin)
+        monkeypatch.setenv('DYNAMODB_ENDPOINT_URL', standin.endpoint_url)
+        runtime_context.reset()
+        return standin
+
+    standins = []
+    yield start
+    for standin in standins:
+        standin.__exit__(None, None, None)
+    runtime_context.reset()
+
+
+def _import_users(count):
+    lines = [
+        bulk_users.json_codec.dumps(
+            {'email': f'user{i}@x.com', 'password': f'pw{i}', 'name': f'사용자 {i}'}
+        )
+        for i in range(count)
+    ]
+    stream = io.StringIO('\n'.join(lines))
+    return bulk_users.import_users(stream, hash_workers=0, writers=2)
+
+
+def _export_in_thread(stream, segments):
+    # 스캔 스레드가 멈추면 테스트도 멈추지 않도록 별도 스레드에서 실행
+    result = {}
+
+    def run():
+        try:
+            result['count'] = bulk_users.export_users(stream, segments=segments)
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive()
+    return result
+
+
+@pytest.mark.parametrize('segments', [1, 4])
+def test_export_round_trip(dynamodb, segments):
+    source = dynamodb()
+    assert _import_users(USERS)['imported'] == USERS
+    for item in source.tables[runtime_context.USERS_TABLE].values():
+        item['reset_token'] = {'S': 'secret'}
+
+    stream = io.StringIO()
+    assert _export_in_thread(stream, segments) == {'count': USERS}
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == USERS
+    assert all('reset_token' not in json.loads(line) for line in lines)
+
+    # 내보낸 파일을 빈 테이블로 다시 가져오면 같은 항목이 됨
+    target = dynamodb()
+    stats = bulk_users.import_users(io.StringIO(stream.getvalue()), hash_workers=0)
+    assert stats == {'imported': USERS, 'existing': 0, 'duplicate': 0, 'invalid': 0}
+
+    expected = source.tables[runtime_context.USERS_TABLE]
+    for item in expected.values():
+        del item['reset_token']
+    assert target.tables[runtime_context.USERS_TABLE] == expected
+
+
+@pytest.fixture
+def scan_threads(monkeypatch):
+    # 세그먼트를 스캔한 스레드를 기록
+    threads = []
+    scan_segment = bulk_users._scan_segment
+
+    def recording_scan_segment(*args):
+        threads.append(threading.current_thread())
+        scan_segment(*args)
+
+    monkeypatch.setattr(bulk_users, '_scan_segment', recording_scan_segment)
+    return threads
+
+
+def test_export_scan_error_stops_every_segment(dynamodb, scan_threads):
+    standin = dynamodb()
+    _import_users(USERS)
+    standin.failing_scan_segments.add(1)
+
+    result = _export_in_thread(io.StringIO(), 4)
+
+    assert isinstance(result['error'], ClientError)
+    assert len(scan_threads) == 4
+    assert not any(thread.is_alive() for thread in scan_threads)
+
+
+class FailingStream(io.StringIO):
+    def write(self, text):
+        if self.tell() > 100:
+            raise OSError('disk full')
+        return super().write(text)
+
+
+def test_export_write_error_drains_scan_threads(dynamodb, scan_threads):
+    dynamodb()
+    _import_users(USERS)
+
+    result = _export_in_thread(FailingStream(), 4)
+
+    # 가득 찬 큐에서 기다리던 스캔 스레드도 모두 끝나야 함
+    assert isinstance(result['error'], OSError)
+    assert len(scan_threads) == 4
+    assert not any(thread.is_alive() for thread in scan_threads)
@@ -0,0 +1,88 @@
+import gc
+import weakref
+
+import pytest
+
+import jwt
+from jwt import api_jwt
+
+NOW = 1_700_000_000
+
+PAYLOADS = [
+    {'sub': 'a', 'aud': 'api', 'iss': 'issuer', 'exp': NOW + 60},
+    {'sub': 'a', 'aud': 'api', 'iss': 'issuer', 'exp': NOW - 60},
+    {'sub': 'a', 'aud': 'other', 'iss': 'issuer', 'exp': NOW + 60},
+    {'sub': 'a', 'aud': ['api', 'x'], 'iss': 'other', 'exp': NOW + 60},
+    {'sub': 'b', 'aud': 'api', 'iss': 'issuer', 'nbf': NOW + 60},
+    {'aud': 'api', 'iss': 'issuer'},
+    {'sub': 'a', 'aud': 'api', 'iss': 'issuer', 'iat': 'soon'},
+]
+
+EXPECTATIONS = [
+    {},
+    {'audience': 'api'},
+    {'audience': ['api', 'x'], 'issuer': ['issuer']},
+    {'audience': 'api', 'issuer': 'issuer', 'subject': 'a', 'leeway': 120},
+    {'audience': 'api', 'options': {'require': ['exp', 'sub']}},
+    {'audience': 'api', 'options': {'strict_aud': True, 'verify_exp': False}},
+]
+
+
+@pytest.fixture
+def plan_cache():
+    api_jwt.claim_plan_cache.clear()
+    yield api_jwt.claim_plan_cache
+    api_jwt.claim_plan_cache.resize(32)
+    api_jwt.claim_plan_cache.clear()
+
+
+def _outcome(jwt_obj, token, kwargs):
+    try:
+        return jwt_obj.decode(token, 'secret', algorithms=['HS256'], **kwargs)
+    except jwt.PyJWTError as e:
+        return type(e)
+
+
+def test_cached_plans_reject_the_same_claims_as_uncached(plan_cache):
+    tokens = [jwt.encode(payload, 'secret') for payload in PAYLOADS]
+
+    plan_cache.resize(0)
+    uncached = [
+        _outcome(jwt.PyJWT(clock=lambda: NOW), token, kwargs)
+        for kwargs in EXPECTATIONS
+        for token in tokens
+    ]
+
+    plan_cache.resize(32)
+    # 인스턴스를 매번 새로 만들어도 두 번째부터는 캐시된 계획을 씀
+    for _ in range(2):
+        cached = [
+            _outcome(jwt.PyJWT(clock=lambda: NOW), token, kwargs)
+            for kwargs in EXPECTATIONS
+            for token in tokens
+        ]
+        assert cached == uncached
+    assert len(plan_cache) == len(EXPECTATIONS)
+
+
+def test_shared_plan_uses_each_instance_clock(plan_cache):
+    token = jwt.encode({'exp': NOW}, 'secret')
+    before = jwt.PyJWT(clock=lambda: NOW - 10)
+    after = jwt.PyJWT(clock=lambda: NOW + 10)
+
+    assert before.decode(token, 'secret', algorithms=['HS256']) == {'exp': NOW}
+    with pytest.raises(jwt.ExpiredSignatureError):
+        after.decode(token, 'secret', algorithms=['HS256'])
+    assert len(plan_cache) == 1
+
+
+def test_cache_does_not_keep_instances_alive(plan_cache):
+    jwt_obj = jwt.PyJWT()
+    jwt_obj.decode(jwt.encode({}, 'secret'), 'secret', algorithms=['HS256'])
+    ref = weakref.ref(jwt_obj)
+
+    del jwt_obj
+    gc.collect()
+
+    assert ref() is None
+    assert len(plan_cache) == 1
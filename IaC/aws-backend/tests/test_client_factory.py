@@ -0,0 +1,176 @@
+import os
+import re
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('boto3')
+
+import boto3  # noqa: E402
+from botocore.exceptions import ReadTimeoutError  # noqa: E402
+
+import client_factory  # noqa: E402
+from dynamodb_standin import DynamoDBStandIn  # noqa: E402
+
+TEMPLATE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    'cloudformation',
+    'alcolook-infrastructure.yaml',
+)
+
+# 함수별 AWS 호출 수 (DynamoDB + SES)
+AWS_CALLS = {
+    'user_register': 1,
+    'user_login': 1,
+    'forgot_password': 3,
+}
+
+SETTINGS = [
+    'BOTO_MAX_POOL_CONNECTIONS',
+    'BOTO_CONNECT_TIMEOUT',
+    'BOTO_READ_TIMEOUT',
+    'BOTO_TCP_KEEPALIVE',
+    'AWS_MAX_ATTEMPTS',
+    'AWS_RETRY_MODE',
+    'DYNAMODB_ENDPOINT_URL',
+    'SES_ENDPOINT_URL',
+]
+
+
+@pytest.fixture
+def env(monkeypatch):
+    for name in SETTINGS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    return monkeypatch
+
+
+def _worst_case_seconds(config):
+    # 시도마다 연결 + 읽기 타임아웃, standard 모드의 첫 재시도 전 대기는 최대 1초
+    attempts = config.retries['total_max_attempts']
+    backoff = 1 if attempts > 1 else 0
+    return attempts * (config.connect_timeout + config.read_timeout) + backoff
+
+
+def test_defaults(env):
+    config = client_factory.client_config()
+
+    assert config.max_pool_connections == client_factory.DEFAULT_MAX_POOL_CONNECTIONS
+    assert config.connect_timeout == client_factory.DEFAULT_CONNECT_TIMEOUT
+    assert config.read_timeout == client_factory.DEFAULT_READ_TIMEOUT
+    assert config.tcp_keepalive is True
+    assert config.retries == {
+        'total_max_attempts': client_factory.DEFAULT_MAX_ATTEMPTS,
+        'mode': client_factory.DEFAULT_RETRY_MODE,
+    }
+    assert client_factory.endpoint_url('dynamodb') is None
+    assert client_factory.endpoint_url('ses') is None
+
+
+def test_environment_and_arguments(env):
+    env.setenv('BOTO_MAX_POOL_CONNECTIONS', '32')
+    env.setenv('BOTO_CONNECT_TIMEOUT', '0.2')
+    env.setenv('BOTO_READ_TIMEOUT', '3')
+    env.setenv('BOTO_TCP_KEEPALIVE', 'off')
+    env.setenv('AWS_MAX_ATTEMPTS', '1')
+    env.setenv('AWS_RETRY_MODE', 'adaptive')
+    env.setenv('DYNAMODB_ENDPOINT_URL', 'http://localhost:8000')
+    env.setenv('SES_ENDPOINT_URL', '')
+
+    config = client_factory.client_config()
+    assert config.max_pool_connections == 32
+    assert config.connect_timeout == 0.2
+    assert config.read_timeout == 3.0
+    assert config.tcp_keepalive is False
+    assert config.retries == {'total_max_attempts': 1, 'mode': 'adaptive'}
+    assert client_factory.endpoint_url('dynamodb') == 'http://localhost:8000'
+    assert client_factory.endpoint_url('ses') is None
+
+    # 인자로 넘긴 값이 환경 변수보다 우선
+    config = client_factory.client_config(read_timeout=5, max_pool_connections=2)
+    assert config.read_timeout == 5
+    assert config.max_pool_connections == 2
+    assert config.connect_timeout == 0.2
+
+    client = client_factory.create_client(boto3.session.Session(), 'dynamodb')
+    assert client.meta.endpoint_url == 'http://localhost:8000'
+    assert client.meta.config.read_timeout == 3.0
+    assert client.meta.config.retries['total_max_attempts'] == 1
+
+
+def test_default_worst_case_fits_the_function_timeouts(env):
+    worst = _worst_case_seconds(client_factory.client_config())
+    assert worst == 4
+
+    with open(TEMPLATE, encoding='utf-8') as f:
+        template = f.read()
+    pattern = r'Handler: (\w+)\.lambda_handler\n(?:\s*#.*\n)*\s*Timeout: (\d+)'
+    timeouts = dict(re.findall(pattern, template))
+
+    assert set(timeouts) == set(AWS_CALLS)
+    for handler, calls in AWS_CALLS.items():
+        assert calls * worst < int(timeouts[handler]), handler
+
+
+def test_read_timeout_bounds_a_hung_call(env):
+    env.setenv('BOTO_CONNECT_TIMEOUT', '0.2')
+    env.setenv('BOTO_READ_TIMEOUT', '0.2')
+    env.setenv('AWS_MAX_ATTEMPTS', '1')
+
+    # 연결은 받지만 응답하지 않는 서버
+    with socket.create_server(('127.0.0.1', 0)) as hung:
+        host, port = hung.getsockname()
+        env.setenv('DYNAMODB_ENDPOINT_URL', f'http://{host}:{port}')
+        client = client_factory.create_client(boto3.session.Session(), 'dynamodb')
+
+        started = time.monotonic()
+        with pytest.raises(ReadTimeoutError):
+            client.get_item(TableName='t', Key={'id': {'S': '1'}})
+        assert time.monotonic() - started < 2
+
+
+def test_sequential_calls_reuse_one_connection(env):
+    with DynamoDBStandIn({'t': 'id'}) as standin:
+        env.setenv('DYNAMODB_ENDPOINT_URL', standin.endpoint_url)
+        client = client_factory.create_client(boto3.session.Session(), 'dynamodb')
+
+        client.put_item(TableName='t', Item={'id': {'S': '1'}})
+        for _ in range(20):
+            item = client.get_item(TableName='t', Key={'id': {'S': '1'}})['Item']
+            assert item == {'id': {'S': '1'}}
+
+    assert standin.connection_count == 1
+
+
+def test_concurrent_calls_stay_within_the_pool(env):
+    threads_count = 8
+    env.setenv('BOTO_MAX_POOL_CONNECTIONS', str(threads_count))
+
+    with DynamoDBStandIn({'t': 'id'}) as standin:
+        env.setenv('DYNAMODB_ENDPOINT_URL', standin.endpoint_url)
+        client = client_factory.create_client(boto3.session.Session(), 'dynamodb')
+        errors = []
+
+        def worker(i):
+            try:
+                for j in range(10):
+                    client.put_item(TableName='t', Item={'id': {'S': f'{i}-{j}'}})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,)) for i in range(threads_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    assert len(standin.tables['t']) == threads_count * 10
+    # 풀보다 많은 연결을 열었다 버리지 않아야 함
+    assert standin.connection_count <= threads_count
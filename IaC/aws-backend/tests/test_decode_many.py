@@ -0,0 +1,101 @@
+import itertools
+import time
+
+import pytest
+
+import jwt
+from jwt import batch
+
+NOW = int(time.time())
+
+TOKENS = [
+    jwt.encode({'sub': str(i), 'aud': 'api', 'exp': NOW + 600}, 'secret')
+    for i in range(20)
+] + [
+    jwt.encode({'sub': 'expired', 'aud': 'api', 'exp': NOW - 600}, 'secret'),
+    jwt.encode({'sub': 'other-key', 'aud': 'api'}, 'other'),
+    jwt.encode({'sub': 'web', 'aud': 'web'}, 'secret'),
+    jwt.encode({'sub': 'hs384', 'aud': 'api'}, 'secret', algorithm='HS384'),
+    'not.a.token',
+    'e30',
+]
+
+
+def _outcome(result):
+    if isinstance(result, Exception):
+        return type(result), str(result)
+    return result
+
+
+def _one_by_one(decode, tokens):
+    outcomes = []
+    for token in tokens:
+        try:
+            outcomes.append(decode(token))
+        except jwt.PyJWTError as e:
+            outcomes.append((type(e), str(e)))
+    return outcomes
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_jwt_decode_many_matches_decode(max_workers):
+    expected = _one_by_one(
+        lambda t: jwt.decode(t, 'secret', algorithms=['HS256'], audience='api'),
+        TOKENS,
+    )
+
+    results = jwt.PyJWT().decode_many(
+        iter(TOKENS),
+        'secret',
+        algorithms=['HS256'],
+        audience='api',
+        max_workers=max_workers,
+    )
+
+    assert [_outcome(result) for result in results] == expected
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_jws_decode_many_matches_decode(max_workers):
+    jws = jwt.PyJWS()
+    expected = _one_by_one(
+        lambda t: jws.decode(t, 'secret', algorithms=['HS256']), TOKENS
+    )
+
+    results = jws.decode_many(
+        TOKENS, 'secret', algorithms=['HS256'], max_workers=max_workers
+    )
+
+    assert [_outcome(result) for result in results] == expected
+
+
+def test_decode_many_reads_a_bounded_window_ahead():
+    read = []
+
+    def tokens():
+        for i in itertools.count():
+            read.append(i)
+            yield TOKENS[i % 20]
+
+    results = jwt.PyJWT().decode_many(
+        tokens(), 'secret', algorithms=['HS256'], audience='api', max_workers=2
+    )
+    first = list(itertools.islice(results, 5))
+    results.close()
+
+    assert [payload['sub'] for payload in first] == ['0', '1', '2', '3', '4']
+    assert len(read) <= 5 + 2 * batch.PREFETCH_PER_WORKER
+
+
+def test_decode_many_raises_errors_that_are_not_token_errors():
+    def tokens():
+        yield TOKENS[0]
+        raise RuntimeError('source failed')
+
+    results = jwt.PyJWT().decode_many(
+        tokens(), 'secret', algorithms=['HS256'], audience='api'
+    )
+
+    assert next(results)['sub'] == '0'
+    with pytest.raises(RuntimeError):
+        next(results)
@@ -0,0 +1,141 @@
+import binascii
+import os
+import random
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from cryptography.hazmat.primitives import hashes  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric.utils import (  # noqa: E402
+    decode_dss_signature,
+    encode_dss_signature,
+)
+
+import jwt  # noqa: E402
+from jwt.utils import (  # noqa: E402
+    bytes_to_number,
+    der_to_raw_signature,
+    number_to_bytes,
+    raw_to_der_signature,
+)
+
+CURVES = [ec.SECP256R1(), ec.SECP384R1(), ec.SECP521R1(), ec.SECP256K1()]
+
+
+def _width(curve):
+    return (curve.key_size + 7) // 8
+
+
+# 직접 변환 이전의 구현 (16진수 문자열과 정수를 거쳐 cryptography로 인코딩/디코딩)
+def _reference_number_to_bytes(num, num_bytes):
+    padded_hex = '%0*x' % (2 * num_bytes, num)
+    return binascii.a2b_hex(padded_hex.encode('ascii'))
+
+
+def _reference_bytes_to_number(string):
+    return int(binascii.b2a_hex(string), 16)
+
+
+def _reference_der_to_raw(der_sig, curve):
+    r, s = decode_dss_signature(der_sig)
+    width = _width(curve)
+    return _reference_number_to_bytes(r, width) + _reference_number_to_bytes(s, width)
+
+
+def _reference_raw_to_der(raw_sig, curve):
+    width = _width(curve)
+    if len(raw_sig) != 2 * width:
+        raise ValueError('Invalid signature')
+    r = _reference_bytes_to_number(raw_sig[:width])
+    s = _reference_bytes_to_number(raw_sig[width:])
+    return encode_dss_signature(r, s)
+
+
+def _halves(width, rng):
+    yield bytes(width)
+    yield b'\xff' * width
+    yield b'\x00' * (width - 1) + b'\x01'
+    yield b'\x00' * (width - 1) + b'\x80'
+    yield b'\x80' + bytes(width - 1)
+    yield b'\x00\x80' + bytes(width - 2)
+    yield b'\x00\x7f' + b'\xff' * (width - 2)
+    for _ in range(20):
+        yield rng.randbytes(width)
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize('curve', CURVES, ids=lambda curve: curve.name)
+def test_raw_signatures_match_reference(curve):
+    rng = random.Random(curve.name)
+    halves = list(_halves(_width(curve), rng))
+
+    for r in halves:
+        for s in halves[:8]:
+            raw = r + s
+            der = raw_to_der_signature(raw, curve)
+            assert der == _reference_raw_to_der(raw, curve)
+            assert der_to_raw_signature(der, curve) == raw
+
+    for raw in (b'', bytes(2 * _width(curve) - 1), bytes(2 * _width(curve) + 1)):
+        with pytest.raises(ValueError):
+            raw_to_der_signature(raw, curve)
+
+
+@pytest.mark.parametrize('curve', CURVES, ids=lambda curve: curve.name)
+def test_real_and_mutated_der_signatures_match_reference(curve):
+    key = ec.generate_private_key(curve)
+    rng = random.Random(curve.name)
+
+    for _ in range(10):
+        der = key.sign(os.urandom(16), ec.ECDSA(hashes.SHA256()))
+        assert der_to_raw_signature(der, curve) == _reference_der_to_raw(der, curve)
+
+        for _ in range(50):
+            mutated = bytearray(der)
+            mutated[rng.randrange(len(mutated))] = rng.randrange(256)
+            mutated = bytes(mutated)
+            assert _outcome(der_to_raw_signature, mutated, curve) == _outcome(
+                _reference_der_to_raw, mutated, curve
+            )
+
+
+@pytest.mark.parametrize('curve', CURVES, ids=lambda curve: curve.name)
+def test_non_minimal_der_integers_match_reference(curve):
+    width = _width(curve)
+    body = b'\x02\x02\x00\x01' + b'\x02\x01\x01'
+    padded = b'\x30' + bytes((len(body),)) + body
+    negative = b'\x30\x06\x02\x01\x80\x02\x01\x01'
+
+    for der in (padded, negative):
+        assert _outcome(der_to_raw_signature, der, curve) == _outcome(
+            _reference_der_to_raw, der, curve
+        )
+    assert len(der_to_raw_signature(encode_dss_signature(1, 1), curve)) == 2 * width
+
+
+def test_number_conversions_match_reference():
+    for num in (0, 1, 255, 256, 2**255, 2**256 - 1, 2**256, 2**260, -1):
+        for num_bytes in (1, 32, 33):
+            assert _outcome(number_to_bytes, num, num_bytes) == _outcome(
+                _reference_number_to_bytes, num, num_bytes
+            )
+
+    for string in (b'', b'\x00', b'\x00\x01', b'\xff' * 66):
+        assert _outcome(bytes_to_number, string) == _outcome(
+            _reference_bytes_to_number, string
+        )
+
+
+def test_es256_tokens_round_trip():
+    key = ec.generate_private_key(ec.SECP256R1())
+    for i in range(20):
+        token = jwt.encode({'n': i}, key, algorithm='ES256')
+        assert jwt.decode(token, key.public_key(), algorithms=['ES256']) == {'n': i}
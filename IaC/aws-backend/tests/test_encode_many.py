@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+import jwt
+
+PAYLOADS = [{'sub': str(i), 'name': f'사용자 {i}', 'n': i} for i in range(40)]
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'algorithm': 'HS256'},
+        {'algorithm': 'HS512', 'headers': {'kid': 'k1'}},
+        {'algorithm': 'HS256', 'headers': {'b': 1, 'a': 2}, 'sort_headers': False},
+    ],
+)
+def test_encode_many_matches_encode(processes, kwargs):
+    expected = [jwt.encode(payload, 'secret', **kwargs) for payload in PAYLOADS]
+
+    tokens = jwt.PyJWT().encode_many(
+        iter(PAYLOADS), 'secret', processes=processes, chunksize=7, **kwargs
+    )
+
+    assert list(tokens) == expected
+
+
+def test_encode_many_is_lazy():
+    read = []
+
+    def payloads():
+        for i in itertools.count():
+            read.append(i)
+            yield {'sub': str(i)}
+
+    tokens = jwt.PyJWT().encode_many(payloads(), 'secret')
+    first = list(itertools.islice(tokens, 3))
+
+    assert first == [jwt.encode({'sub': str(i)}, 'secret') for i in range(3)]
+    assert len(read) == 3
+
+
+def test_encode_many_errors():
+    with pytest.raises(NotImplementedError):
+        jwt.PyJWT().encode_many(PAYLOADS, 'secret', algorithm='HS999')
+    with pytest.raises(ValueError):
+        list(jwt.PyJWT().encode_many(PAYLOADS, 'secret', processes=2, chunksize=0))
+
+    # 직렬화할 수 없는 payload에서 멈추고 예외를 그대로 전달
+    tokens = jwt.PyJWT().encode_many([{'sub': '1'}, {'x': object()}], 'secret')
+    assert next(tokens) == jwt.encode({'sub': '1'}, 'secret')
+    with pytest.raises(TypeError):
+        next(tokens)
@@ -0,0 +1,68 @@
+import pytest
+
+import jwt
+from jwt import api_jws, json_backend
+
+
+@pytest.fixture
+def header_cache():
+    api_jws.header_cache.clear()
+    yield api_jws.header_cache
+    api_jws.header_cache.resize(32)
+    api_jws.header_cache.clear()
+    json_backend.set_backend(None)
+
+
+class KidBackend(json_backend.JSONBackend):
+    # 헤더에 kid가 없으면 기본값을 채우는 백엔드
+    def loads(self, data):
+        obj = super().loads(data)
+        if isinstance(obj, dict):
+            obj.setdefault('kid', 'default')
+        return obj
+
+
+class StrictJWS(jwt.PyJWS):
+    def _parse_header(self, header_segment):
+        parsed = super()._parse_header(header_segment)
+        if 'kid' not in parsed.header:
+            raise jwt.DecodeError('kid is required')
+        return parsed
+
+
+def _token(headers=None):
+    return jwt.encode({'sub': '1'}, 'secret', algorithm='HS256', headers=headers)
+
+
+@pytest.mark.parametrize('maxsize', [32, 0])
+def test_hits_and_misses_match_uncached_headers(header_cache, maxsize):
+    header_cache.resize(maxsize)
+    tokens = [_token(), _token({'kid': 'a'}), _token({'x': {'nested': 1}})]
+
+    for _ in range(2):
+        for token in tokens:
+            segment = token.split('.')[0].encode()
+            header = jwt.get_unverified_header(token)
+            assert header == api_jws.PyJWS()._parse_header(segment).header
+            # 호출자가 받은 사본을 고쳐도 캐시에는 영향이 없어야 함
+            header['alg'] = 'none'
+            assert jwt.get_unverified_header(token)['alg'] == 'HS256'
+
+
+def test_subclass_does_not_reuse_the_base_class_header(header_cache):
+    token = _token()
+    assert jwt.PyJWS().decode(token, 'secret', algorithms=['HS256'])
+
+    with pytest.raises(jwt.DecodeError, match='kid is required'):
+        StrictJWS().decode(token, 'secret', algorithms=['HS256'])
+
+
+def test_backend_change_parses_the_header_again(header_cache):
+    token = _token()
+    assert 'kid' not in jwt.get_unverified_header(token)
+
+    json_backend.set_backend(KidBackend())
+    assert jwt.get_unverified_header(token)['kid'] == 'default'
+
+    json_backend.set_backend(None)
+    assert 'kid' not in jwt.get_unverified_header(token)
@@ -0,0 +1,77 @@
+import hashlib
+import hmac
+import pickle
+import threading
+
+import pytest
+
+import jwt
+from jwt import algorithms
+
+
+@pytest.fixture
+def template_cache():
+    algorithms.hmac_template_cache.clear()
+    yield algorithms.hmac_template_cache
+    algorithms.hmac_template_cache.resize(64)
+    algorithms.hmac_template_cache.clear()
+
+
+@pytest.mark.parametrize('maxsize', [64, 0])
+def test_signatures_match_hmac_new(template_cache, maxsize):
+    template_cache.resize(maxsize)
+    hs256 = jwt.get_algorithm_by_name('HS256')
+    hs512 = jwt.get_algorithm_by_name('HS512')
+
+    for key in (b'', b'a', b'secret' * 30):
+        for msg in (b'', b'header.payload'):
+            sha256 = hmac.new(key, msg, hashlib.sha256).digest()
+            sha512 = hmac.new(key, msg, hashlib.sha512).digest()
+            # 캐시 미스와 히트 모두 hmac.new와 같아야 함
+            for _ in range(2):
+                assert hs256.sign(msg, key) == sha256
+                assert hs512.sign(msg, key) == sha512
+                assert hs256.verify(msg, key, sha256)
+                assert not hs256.verify(msg, key, b'\0' * 32)
+
+
+def test_shared_algorithm_has_no_per_key_state(template_cache):
+    hs256 = jwt.get_algorithm_by_name('HS256')
+    keys = [f'secret-{i}'.encode() for i in range(8)]
+    errors = []
+
+    def sign_all():
+        for _ in range(200):
+            for key in keys:
+                expected = hmac.new(key, b'msg', hashlib.sha256).digest()
+                if hs256.sign(b'msg', key) != expected:
+                    errors.append(key)
+
+    threads = [threading.Thread(target=sign_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # 프로세스 풀 작업자에게 보낼 수 있어야 함 (키 상태를 들고 있지 않음)
+    copy = pickle.loads(pickle.dumps(hs256))
+    assert copy.sign(b'msg', keys[0]) == hs256.sign(b'msg', keys[0])
+
+
+def test_verifier_template_matches_decode(template_cache):
+    verifier = jwt.Verifier('secret', algorithms=['HS256', 'HS384'])
+    tokens = [
+        jwt.encode({'sub': '1'}, 'secret', algorithm='HS256'),
+        jwt.encode({'sub': '2'}, 'secret', algorithm='HS384'),
+        jwt.encode({'sub': '3'}, 'other', algorithm='HS256'),
+    ]
+
+    for token in tokens * 2:
+        try:
+            expected = jwt.decode(token, 'secret', algorithms=['HS256', 'HS384'])
+        except jwt.InvalidSignatureError:
+            with pytest.raises(jwt.InvalidSignatureError):
+                verifier.decode(token)
+        else:
+            assert verifier.decode(token) == expected
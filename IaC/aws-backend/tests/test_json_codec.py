@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+import json_codec
+from jwt import json_backend
+
+DOCUMENTS = [
+    {'error': '이메일과 비밀번호를 입력해주세요.'},
+    {'message': '로그인 성공', 'user': {'name': '홍길동', 'tags': ['a', 'b']}},
+    {'count': 3, 'ratio': 0.5, 'big': 2**70, 'ok': True, 'none': None},
+    [' ', 'emoji 😀', 'tab\t'],
+]
+
+
+def _backends():
+    yield json_backend.JSONBackend()
+    try:
+        yield json_backend.OrjsonBackend()
+    except ImportError:
+        pass
+
+
+@pytest.fixture(params=list(_backends()), ids=lambda backend: backend.name)
+def backend(request):
+    json_backend.set_backend(request.param)
+    yield request.param
+    json_backend.set_backend(None)
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_dumps_matches_json_dumps(backend, document):
+    # orjson 설치 여부와 관계없이 기존 응답 본문과 같은 문자열
+    assert json_codec.dumps(document) == json.dumps(document)
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_loads_matches_json_loads(backend, document):
+    text = json.dumps(document, ensure_ascii=False)
+    assert json_codec.loads(text) == json.loads(text)
+    assert json_codec.loads(text.encode()) == json.loads(text)
+
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads(text[:-1])
+    with pytest.raises(TypeError):
+        json_codec.loads(None)
+
+
+def test_handler_body_matches_baseline(backend):
+    pytest.importorskip('boto3')
+    import user_login
+
+    event = {'httpMethod': 'POST', 'body': json.dumps({'email': '사용자@x.com'})}
+    response = user_login.lambda_handler(event, None)
+
+    assert response['statusCode'] == 400
+    assert response['body'] == json.dumps({'error': '이메일과 비밀번호를 입력해주세요.'})
@@ -0,0 +1,104 @@
+import pytest
+
+import jwt
+
+OCT_KEY = {'kty': 'oct', 'k': 'c2VjcmV0', 'kid': 'hs'}
+
+
+def _ec_key(kid):
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    from jwt.algorithms import ECAlgorithm
+
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    return {**ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True), 'kid': kid}
+
+
+def _broken_ec_key(kid):
+    # 멤버는 갖췄지만 좌표 길이가 곡선과 맞지 않는 키
+    return {'kty': 'EC', 'crv': 'P-256', 'x': 'AAAA', 'y': 'AAAA', 'kid': kid}
+
+
+def test_broken_key_material_raises_on_first_use():
+    pytest.importorskip('cryptography')
+    jwk = jwt.PyJWK(_broken_ec_key('a'))
+
+    with pytest.raises(jwt.InvalidKeyError):
+        jwk.key
+
+
+def test_broken_key_does_not_shadow_a_later_key_with_the_same_kid():
+    good = _ec_key('shared')
+    jwk_set = jwt.PyJWKSet([OCT_KEY, _broken_ec_key('shared'), good])
+
+    # 예전처럼 깨진 키는 읽을 때 건너뛰어 같은 kid의 다음 키가 쓰임
+    assert [key.key_id for key in jwk_set.keys] == ['hs', 'shared']
+    assert jwk_set['shared']._jwk_data is good
+    assert jwk_set.find_signing_key('shared')._jwk_data is good
+    assert jwk_set['shared'].key is not None
+
+
+def test_set_without_usable_key_material_is_rejected():
+    pytest.importorskip('cryptography')
+
+    with pytest.raises(jwt.PyJWKSetError, match='usable keys'):
+        jwt.PyJWKSet([_broken_ec_key('a'), _broken_ec_key('b')])
+
+
+def test_unique_keys_after_the_first_usable_one_stay_lazy():
+    jwk_set = jwt.PyJWKSet([OCT_KEY, _ec_key('a'), _broken_ec_key('b')])
+
+    assert [key.key_id for key in jwk_set.keys] == ['hs', 'a', 'b']
+    with pytest.raises(jwt.InvalidKeyError):
+        jwk_set['b'].key
+
+
+def test_key_is_assignable():
+    jwk = jwt.PyJWK(OCT_KEY)
+    jwk.key = b'other'
+    assert jwk.key == b'other'
+
+    jwk.key = None
+    assert jwk.key is None
+
+
+def _linear_lookup(keys, kid):
+    # 인덱스 도입 전의 순차 검색
+    for key in keys:
+        if key.key_id == kid:
+            return key
+    return None
+
+
+def test_kid_index_matches_linear_lookup():
+    keys = [
+        {'kty': 'oct', 'k': 'YQ', 'kid': 'a'},
+        {'kty': 'oct', 'k': 'Yg', 'kid': 'a'},
+        {'kty': 'oct', 'k': 'Yw', 'kid': 'enc', 'use': 'enc'},
+        {'kty': 'oct', 'k': 'ZA', 'kid': 'enc', 'use': 'sig'},
+        {'kty': 'oct', 'k': 'ZQ', 'kid': 1},
+        {'kty': 'oct', 'k': 'Zg'},
+        {'kty': 'oct', 'k': 'Zw', 'kid': ''},
+    ]
+    jwk_set = jwt.PyJWKSet(keys)
+    signing_keys = [
+        key
+        for key in jwk_set.keys
+        if key.public_key_use in ['sig', None] and key.key_id
+    ]
+    assert jwk_set.signing_keys == signing_keys
+
+    for kid in ('a', 'enc', 1, True, 1.0, '1', None, '', 'missing', ['a']):
+        expected = _linear_lookup(jwk_set.keys, kid)
+        if expected is None or isinstance(kid, list):
+            with pytest.raises(KeyError):
+                jwk_set[kid]
+        else:
+            assert jwk_set[kid] is expected
+        assert jwk_set.find_signing_key(kid) is (
+            None if isinstance(kid, list) else _linear_lookup(signing_keys, kid)
+        )
+        assert jwt.PyJWKClient.match_kid(signing_keys, kid) is _linear_lookup(
+            signing_keys, kid
+        )
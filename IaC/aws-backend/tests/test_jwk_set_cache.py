@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+import jwt
+from jwt import jwks_client_async
+from jwt.jwk_set_cache import FileJWKSetCache
+from jwks_server import JWKS, JWKSServer
+
+
+@pytest.fixture
+def file_io_threads(monkeypatch):
+    # 캐시 파일을 읽고 쓴 스레드를 기록
+    threads = []
+    read_file = FileJWKSetCache.read_file
+    write_file = FileJWKSetCache._write_file
+
+    def recording_read(self):
+        threads.append(threading.get_ident())
+        read_file(self)
+
+    def recording_write(self):
+        threads.append(threading.get_ident())
+        write_file(self)
+
+    monkeypatch.setattr(FileJWKSetCache, 'read_file', recording_read)
+    monkeypatch.setattr(FileJWKSetCache, '_write_file', recording_write)
+    return threads
+
+
+def test_new_client_starts_from_the_cache_file(tmp_path):
+    path = str(tmp_path / 'jwks.json')
+    with JWKSServer() as server:
+        jwt.PyJWKClient(server.url, cache_path=path).get_jwk_set()
+        jwk_set = jwt.PyJWKClient(server.url, cache_path=path).get_jwk_set()
+
+    assert server.request_count == 1
+    assert [key.key_id for key in jwk_set.keys] == ['key-1']
+
+
+def test_file_is_read_again_only_when_it_changed(tmp_path):
+    path = str(tmp_path / 'jwks.json')
+    writer = FileJWKSetCache(300, path)
+    writer.put(JWKS)
+
+    reader = FileJWKSetCache(300, path)
+    assert reader.get() == JWKS
+
+    reader._fetched_at = 0
+    # 파일이 그대로면 만료된 메모리 사본을 다시 읽지 않음
+    assert reader.get() is None
+    assert reader.get(allow_expired=True) == JWKS
+
+
+@pytest.mark.parametrize('transport', ['aiohttp', 'urllib'])
+def test_async_client_does_file_io_off_the_event_loop(
+    tmp_path, monkeypatch, file_io_threads, transport
+):
+    if transport == 'aiohttp':
+        pytest.importorskip('aiohttp')
+    monkeypatch.setattr(jwks_client_async, 'has_aiohttp', transport == 'aiohttp')
+    path = str(tmp_path / 'jwks.json')
+
+    async def run(server):
+        loop_thread = threading.get_ident()
+        for _ in range(2):
+            async with jwks_client_async.AsyncPyJWKClient(
+                server.url, cache_path=path
+            ) as client:
+                key = await client.get_signing_key('key-1')
+                assert key.key_id == 'key-1'
+                assert await client.get_jwk_set() is not None
+        return loop_thread
+
+    with JWKSServer() as server:
+        loop_thread = asyncio.run(run(server))
+
+    # 두 번째 클라이언트는 첫 클라이언트가 쓴 파일에서 시작
+    assert server.request_count == 1
+    assert file_io_threads
+    assert loop_thread not in file_io_threads
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+
+import pytest
+
+import jwt
+from jwks_server import JWKSServer
+
+
+def test_non_json_body_is_client_error():
+    with JWKSServer(body=b'<html>maintenance</html>') as server:
+        client = jwt.PyJWKClient(server.url)
+        with pytest.raises(jwt.PyJWKClientError, match='valid JSON'):
+            client.get_jwk_set()
+
+
+def test_waiters_share_any_fetch_error():
+    with JWKSServer() as server:
+        client = jwt.PyJWKClient(server.url, cache_jwk_set=False)
+        client.get_jwk_set()
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_fetch():
+            started.set()
+            release.wait(5)
+            raise RuntimeError('fetch failed')
+
+        client.fetch_data = failing_fetch
+        results = []
+
+        def get_jwk_set():
+            try:
+                results.append(client.get_jwk_set())
+            except Exception as e:
+                results.append(e)
+
+        first = threading.Thread(target=get_jwk_set)
+        first.start()
+        started.wait(5)
+        # 첫 요청이 가져오는 동안 기다린 요청도 같은 오류를 받아야 함 (이전 결과가 아니라)
+        waiter = threading.Thread(target=get_jwk_set)
+        waiter.start()
+        time.sleep(0.1)
+        release.set()
+        first.join(5)
+        waiter.join(5)
+
+    assert len(results) == 2
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_background_refresh_survives_non_json_body(monkeypatch):
+    uncaught = []
+    monkeypatch.setattr(threading, 'excepthook', uncaught.append)
+
+    with JWKSServer() as server:
+        client = jwt.PyJWKClient(server.url, stale_while_revalidate=True)
+        jwk_set = client.get_jwk_set()
+
+        server.body = b'not json'
+        client.jwk_set_cache.lifespan = 0
+        time.sleep(0.01)
+
+        # 만료된 JWK Set을 그대로 쓰고 백그라운드 갱신은 실패해도 캐시를 유지
+        assert client.get_jwk_set() is jwk_set
+        client._refresh_thread.join(5)
+        assert server.request_count == 2
+        assert isinstance(client._last_fetch[1], jwt.PyJWKClientError)
+        assert client.get_jwk_set() is jwk_set
+
+    assert uncaught == []
+
+
+def test_parsed_jwk_set_is_reused_until_the_data_changes():
+    with JWKSServer() as server:
+        client = jwt.PyJWKClient(server.url)
+        jwk_set = client.get_jwk_set()
+        assert client.get_jwk_set() is jwk_set
+        assert client.get_signing_key('key-1') is jwk_set['key-1']
+
+        server.body = json.dumps(
+            {'keys': [{'kty': 'oct', 'kid': 'key-2', 'k': 'c2VjcmV0'}]}
+        ).encode()
+        # 모르는 kid면 다시 가져와 새로 파싱한 JWK Set에서 찾음
+        assert client.get_signing_key('key-2').key_id == 'key-2'
+        assert client.get_jwk_set() is not jwk_set
+        assert server.request_count == 2
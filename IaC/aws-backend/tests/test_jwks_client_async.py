@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+import jwt
+from jwt import jwks_client_async
+from jwks_server import JWKSServer
+
+
+@pytest.fixture(params=['aiohttp', 'urllib'])
+def transport(request, monkeypatch):
+    # aiohttp가 있으면 세션으로, 없으면 executor에서 urllib로 가져옴
+    if request.param == 'aiohttp':
+        pytest.importorskip('aiohttp')
+    monkeypatch.setattr(jwks_client_async, 'has_aiohttp', request.param == 'aiohttp')
+    return request.param
+
+
+def test_concurrent_callers_share_one_fetch(transport):
+    async def run(server):
+        async with jwks_client_async.AsyncPyJWKClient(server.url) as client:
+            return await asyncio.gather(*(client.get_jwk_set() for _ in range(20)))
+
+    with JWKSServer(delay=0.2) as server:
+        jwk_sets = asyncio.run(run(server))
+
+    assert server.request_count == 1
+    assert all(jwk_set is jwk_sets[0] for jwk_set in jwk_sets)
+
+
+def test_failed_refresh_keeps_cached_jwk_set(transport):
+    async def run(server):
+        async with jwks_client_async.AsyncPyJWKClient(
+            server.url, stale_while_revalidate=True
+        ) as client:
+            jwk_set = await client.get_jwk_set()
+
+            server.status = 500
+            with pytest.raises(jwt.PyJWKClientConnectionError):
+                await client.get_jwk_set(refresh=True)
+            assert client.jwk_set_cache.get() is not None
+
+            # 만료된 뒤에는 기존 JWK Set을 쓰면서 백그라운드에서 갱신 (실패해도 유지)
+            client.jwk_set_cache.lifespan = 0
+            await asyncio.sleep(0.01)
+            assert await client.get_jwk_set() is jwk_set
+            await asyncio.wait([client._fetch_task])
+            assert await client.get_jwk_set() is jwk_set
+            assert (await client.get_signing_key('key-1')).key_id == 'key-1'
+            if client._fetch_task is not None:
+                await asyncio.wait([client._fetch_task])
+
+    with JWKSServer() as server:
+        asyncio.run(run(server))
+
+    assert server.request_count >= 3
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import jwt
+from conftest import LAMBDA_DIR
+
+
+def _run(code, *paths):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([*paths, LAMBDA_DIR]))
+    result = subprocess.run(
+        [sys.executable, '-c', textwrap.dedent(code)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_broken_cryptography_degrades_like_a_missing_one(tmp_path):
+    # 다른 플랫폼용 휠처럼 설치는 되어 있지만 import할 수 없는 cryptography
+    package = tmp_path / 'cryptography'
+    package.mkdir()
+    (package / '__init__.py').write_text("raise ImportError('wrong platform')\n")
+
+    _run(
+        """
+        import jwt
+        import pytest
+
+        token = jwt.encode({'sub': '1'}, 'secret', algorithm='HS256')
+        assert jwt.decode(token, 'secret', algorithms=['HS256']) == {'sub': '1'}
+
+        assert jwt.algorithms.has_crypto is False
+        assert not hasattr(jwt.algorithms, 'RSAAlgorithm')
+        with pytest.raises(jwt.InvalidAlgorithmError):
+            jwt.decode(token, 'secret', algorithms=['RS256'])
+        with pytest.raises(NotImplementedError, match='cryptography'):
+            jwt.get_algorithm_by_name('RS256')
+        with pytest.raises(jwt.exceptions.MissingCryptographyError):
+            jwt.PyJWK({'kty': 'RSA', 'n': 'AQAB', 'e': 'AQAB'})
+
+        algorithms = jwt.algorithms.get_default_algorithms()
+        assert 'HS256' in algorithms and 'RS256' not in algorithms
+        assert 'RS256' not in jwt.PyJWS().get_algorithms()
+        """,
+        str(tmp_path),
+    )
+
+
+def test_hs256_does_not_import_cryptography():
+    _run(
+        """
+        import sys
+
+        import jwt
+
+        token = jwt.encode({'sub': '1'}, 'secret', algorithm='HS256')
+        jwt.decode(token, 'secret', algorithms=['HS256'])
+        assert 'cryptography' not in sys.modules
+        """
+    )
+
+
+def test_get_default_algorithms_returns_a_new_dict():
+    algorithms = jwt.algorithms.get_default_algorithms()
+
+    assert type(algorithms) is dict
+    assert set(algorithms) == set(jwt.algorithms.default_algorithms)
+    assert algorithms['HS256'] is jwt.get_algorithm_by_name('HS256')
+
+    del algorithms['HS256']
+    assert 'HS256' in jwt.algorithms.get_default_algorithms()
@@ -0,0 +1,97 @@
+import pytest
+
+import jwt
+from jwt import algorithms
+
+PEM = b'-----BEGIN PUBLIC KEY-----\nabc\n-----END PUBLIC KEY-----\n'
+
+
+@pytest.fixture(params=[64, 0], ids=['cached', 'uncached'])
+def key_cache(request):
+    algorithms.prepared_key_cache.clear()
+    algorithms.prepared_key_cache.resize(request.param)
+    yield algorithms.prepared_key_cache
+    algorithms.prepared_key_cache.resize(64)
+    algorithms.prepared_key_cache.clear()
+
+
+def _pem_keys():
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    def pems(private_key):
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return private_pem, public_pem
+
+    return {
+        'RS256': pems(rsa.generate_private_key(65537, 2048)),
+        'ES256': pems(ec.generate_private_key(ec.SECP256R1())),
+        'EdDSA': pems(ed25519.Ed25519PrivateKey.generate()),
+    }
+
+
+def test_hmac_keys_are_checked_every_time(key_cache):
+    hs256 = jwt.get_algorithm_by_name('HS256')
+
+    for _ in range(2):
+        assert hs256.prepare_key('secret') == b'secret'
+        assert hs256.prepare_key(b'secret') == b'secret'
+        assert hs256.prepare_key('비밀') == '비밀'.encode()
+        with pytest.raises(jwt.InvalidKeyError):
+            hs256.prepare_key(PEM)
+        with pytest.raises(jwt.InvalidKeyError):
+            hs256.prepare_key('ssh-rsa AAAA')
+
+    # 형식 확인이 캐시 조회보다 싸므로 HMAC 비밀 값은 캐시하지 않음
+    assert len(key_cache) == 0
+
+
+@pytest.mark.parametrize('name', ['RS256', 'ES256', 'EdDSA'])
+def test_asymmetric_keys_match_uncached(key_cache, name):
+    private_pem, public_pem = _pem_keys()[name]
+    algorithm = jwt.get_algorithm_by_name(name)
+
+    for key in (private_pem, private_pem.decode()):
+        # 캐시 미스와 히트 모두 같은 키로 서명하고 검증해야 함
+        for _ in range(2):
+            token = jwt.encode({'sub': '1'}, key, algorithm=name)
+            assert jwt.decode(token, public_pem, algorithms=[name]) == {'sub': '1'}
+
+    first = algorithm.prepare_key(public_pem)
+    second = algorithm.prepare_key(public_pem)
+    assert first.public_bytes(*_spki()) == second.public_bytes(*_spki())
+
+
+def _spki():
+    from cryptography.hazmat.primitives import serialization
+
+    return (
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def test_invalid_keys_are_not_cached(key_cache):
+    keys = _pem_keys()
+    size = len(key_cache)
+
+    for _ in range(2):
+        # 다른 알고리즘 계열의 키는 캐시에 있어도 계속 거부됨
+        jwt.get_algorithm_by_name('RS256').prepare_key(keys['RS256'][1])
+        with pytest.raises((jwt.InvalidKeyError, ValueError)):
+            jwt.get_algorithm_by_name('ES256').prepare_key(keys['RS256'][1])
+        with pytest.raises(jwt.InvalidKeyError):
+            jwt.get_algorithm_by_name('HS256').prepare_key(keys['RS256'][1])
+        with pytest.raises(jwt.InvalidKeyError):
+            jwt.get_algorithm_by_name('RS256').prepare_key(b'not a key')
+
+    assert len(key_cache) == size + (1 if key_cache.maxsize else 0)
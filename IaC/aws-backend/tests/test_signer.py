@@ -0,0 +1,89 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import jwt
+from jwt import api_jws
+
+
+class DateEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+PAYLOAD = {'sub': '1', 'name': '홍길동', 'iat': 1_700_000_000}
+
+ARGUMENTS = [
+    {'algorithm': 'HS256'},
+    {'algorithm': 'HS512', 'headers': {'kid': 'k1'}},
+    {'algorithm': 'HS256', 'headers': {'kid': 'k1', 'typ': None}},
+    {'algorithm': 'HS256', 'headers': {'x': 1}},
+    {'algorithm': 'HS256', 'headers': {'x': True}},
+    {'algorithm': 'HS256', 'headers': {'x': 1.0, 'b': 'b', 'a': 'a'}},
+    {'algorithm': 'HS256', 'headers': {'b': 'b', 'a': 'a'}, 'sort_headers': False},
+    {'algorithm': 'HS256', 'headers': {'nested': {'a': [1, 2]}}},
+    {'algorithm': 'HS256', 'headers': {'alg': 'HS384'}},
+    {'algorithm': 'HS256', 'json_encoder': DateEncoder},
+    {'algorithm': 'none'},
+]
+
+
+@pytest.fixture
+def header_cache():
+    api_jws.encoded_header_cache.clear()
+    yield api_jws.encoded_header_cache
+    api_jws.encoded_header_cache.resize(32)
+    api_jws.encoded_header_cache.clear()
+
+
+def _key(kwargs):
+    return None if kwargs['algorithm'] == 'none' else 'secret'
+
+
+@pytest.mark.parametrize('kwargs', ARGUMENTS)
+def test_encode_is_the_same_with_and_without_the_header_cache(header_cache, kwargs):
+    header_cache.resize(0)
+    expected = jwt.encode(PAYLOAD, _key(kwargs), **kwargs)
+
+    header_cache.resize(32)
+    # 캐시 미스와 히트 모두 캐시 없이 만든 토큰과 같아야 함
+    for _ in range(2):
+        assert jwt.encode(PAYLOAD, _key(kwargs), **kwargs) == expected
+
+
+def test_header_values_that_compare_equal_do_not_share_an_encoding(header_cache):
+    one = jwt.encode(PAYLOAD, 'secret', headers={'x': 1})
+    true = jwt.encode(PAYLOAD, 'secret', headers={'x': True})
+
+    assert jwt.get_unverified_header(one)['x'] == 1
+    assert jwt.get_unverified_header(true)['x'] is True
+
+
+@pytest.mark.parametrize('maxsize', [32, 0])
+@pytest.mark.parametrize('kwargs', ARGUMENTS)
+def test_signer_matches_encode(header_cache, kwargs, maxsize):
+    header_cache.resize(maxsize)
+    kwargs = dict(kwargs)
+    algorithm = kwargs.pop('algorithm')
+    signer = jwt.Signer(_key({'algorithm': algorithm}), algorithm, **kwargs)
+
+    for payload in (PAYLOAD, {'sub': '2'}, {'when': datetime.now(timezone.utc)}):
+        try:
+            expected = jwt.encode(
+                payload, _key({'algorithm': algorithm}), algorithm, **kwargs
+            )
+        except TypeError:
+            with pytest.raises(TypeError):
+                signer.encode(payload)
+        else:
+            assert signer.encode(payload) == expected
+
+
+def test_signer_rejects_bad_arguments_up_front():
+    with pytest.raises(NotImplementedError):
+        jwt.Signer('secret', 'HS999')
+    with pytest.raises(jwt.InvalidKeyError):
+        jwt.Signer('-----BEGIN PUBLIC KEY-----\nabc\n-----END PUBLIC KEY-----\n')
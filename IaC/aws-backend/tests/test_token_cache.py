@@ -0,0 +1,37 @@
+import jwt
+
+KEY = 'secret'
+
+
+def _verifier():
+    return jwt.Verifier(
+        KEY, algorithms=['HS256'], cache=jwt.VerifiedTokenCache(maxsize=8)
+    )
+
+
+def test_cache_hits_do_not_share_nested_claims():
+    verifier = _verifier()
+    token = jwt.encode(
+        {'sub': '1', 'roles': ['user'], 'org': {'id': 7}}, KEY, algorithm='HS256'
+    )
+
+    first = verifier.decode(token)
+    first['roles'].append('admin')
+    first['org']['id'] = 8
+
+    second = verifier.decode(token)
+    assert second == {'sub': '1', 'roles': ['user'], 'org': {'id': 7}}
+    assert verifier.cache.info().hits == 1
+
+    second['roles'].append('admin')
+    assert verifier.decode(token)['roles'] == ['user']
+
+
+def test_cache_hits_do_not_share_nested_headers():
+    verifier = _verifier()
+    token = jwt.encode(
+        {'sub': '1'}, KEY, algorithm='HS256', headers={'ext': {'crit': ['a']}}
+    )
+
+    verifier.decode_complete(token)['header']['ext']['crit'].append('b')
+    assert verifier.decode_complete(token)['header']['ext'] == {'crit': ['a']}
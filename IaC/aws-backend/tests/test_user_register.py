@@ -0,0 +1,65 @@
+import json
+import threading
+
+import pytest
+
+pytest.importorskip('boto3')
+
+import runtime_context  # noqa: E402
+import user_register  # noqa: E402
+from dynamodb_standin import DynamoDBStandIn  # noqa: E402
+
+SIGNUPS = 16
+
+
+@pytest.fixture
+def dynamodb(monkeypatch):
+    with DynamoDBStandIn({runtime_context.USERS_TABLE: 'email'}) as standin:
+        monkeypatch.setenv('DYNAMODB_ENDPOINT_URL', standin.endpoint_url)
+        monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+        monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+        monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+        monkeypatch.setenv('BOTO_MAX_POOL_CONNECTIONS', str(SIGNUPS))
+        runtime_context.reset()
+        yield standin
+    runtime_context.reset()
+
+
+def _register(email, name='n'):
+    event = {
+        'httpMethod': 'POST',
+        'body': json.dumps({'email': email, 'password': 'pw', 'name': name}),
+    }
+    return user_register.lambda_handler(event, None)
+
+
+def test_register_then_duplicate(dynamodb):
+    assert _register('a@x.com')['statusCode'] == 201
+    assert _register('a@x.com', name='other')['statusCode'] == 409
+
+    stored = dynamodb.tables[runtime_context.USERS_TABLE]['a@x.com']
+    assert stored['name'] == {'S': 'n'}
+    assert dynamodb.put_count == 1
+
+
+def test_concurrent_signups_create_one_user(dynamodb):
+    barrier = threading.Barrier(SIGNUPS)
+    responses = []
+
+    def signup(i):
+        barrier.wait()
+        responses.append(_register('race@x.com', name=f'user{i}'))
+
+    threads = [threading.Thread(target=signup, args=(i,)) for i in range(SIGNUPS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    codes = sorted(response['statusCode'] for response in responses)
+    assert codes == [201] + [409] * (SIGNUPS - 1)
+    assert dynamodb.put_count == 1
+
+    created = next(r for r in responses if r['statusCode'] == 201)
+    stored = dynamodb.tables[runtime_context.USERS_TABLE]['race@x.com']
+    assert stored['user_id'] == {'S': json.loads(created['body'])['user_id']}
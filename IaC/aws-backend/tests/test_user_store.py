@@ -0,0 +1,156 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip('boto3')
+
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer  # noqa: E402
+
+import runtime_context  # noqa: E402
+import user_store  # noqa: E402
+from dynamodb_standin import DynamoDBStandIn  # noqa: E402
+
+VALUES = [
+    '',
+    '홍길동',
+    0,
+    -5,
+    27,
+    10 ** 38 - 1,
+    10 ** 38,
+    -(10 ** 40),
+    True,
+    False,
+    None,
+    Decimal('1.5'),
+    Decimal('1E+2'),
+    Decimal('NaN'),
+    1.5,
+    b'\x00\xff',
+    bytearray(b'ab'),
+    [1, 'a', None],
+    ('t', 2),
+    {'nested': {'n': 1, 'l': [True]}},
+    {'a', 'b'},
+    frozenset({1, 2}),
+    {Decimal('1.5'), 3},
+    {True, False},
+    {b'x', b'y'},
+    {1, 'a'},
+    set(),
+    [set()],
+    object(),
+]
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e)
+
+
+def _reference_encode(item):
+    serializer = TypeSerializer()
+    return {name: serializer.serialize(value) for name, value in item.items()}
+
+
+def _plain(value):
+    # user_store는 정수는 int, 바이너리는 bytes로 돌려주는 것만 다름
+    if isinstance(value, Decimal) and value.as_tuple().exponent == 0:
+        return int(value)
+    if isinstance(value, Binary):
+        return value.value
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, set):
+        return {_plain(v) for v in value}
+    return value
+
+
+def _reference_decode(item):
+    deserializer = TypeDeserializer()
+    return {name: _plain(deserializer.deserialize(attr)) for name, attr in item.items()}
+
+
+def _random_items(schema, count):
+    rng = random.Random(schema.table_name)
+    names = list(schema._encoders) + ['extra']
+    for _ in range(count):
+        yield {
+            name: rng.choice(VALUES)
+            for name in rng.sample(names, rng.randint(1, len(names)))
+        }
+
+
+@pytest.mark.parametrize(
+    'schema', [user_store.USERS, user_store.USER_PROFILES], ids=lambda s: s.table_name
+)
+def test_items_match_the_resource_layer(schema):
+    for item in _random_items(schema, 2000):
+        encoded = _outcome(schema.encode_item, item)
+        assert encoded == _outcome(_reference_encode, item)
+        if isinstance(encoded, dict):
+            assert schema.decode_item(encoded) == _reference_decode(encoded)
+
+
+def test_numbers_are_read_as_int_or_decimal():
+    decoded = user_store.USER_PROFILES.decode_item(
+        {'age': {'N': '27'}, 'weeklyGoalStdDrinks': {'N': '2.5'}, 'x': {'N': '1E+2'}}
+    )
+
+    assert decoded == {'age': 27, 'weeklyGoalStdDrinks': Decimal('2.5'), 'x': 100}
+    assert type(decoded['age']) is int
+    assert type(decoded['x']) is Decimal
+
+
+def test_update_requests_match_the_resource_layer():
+    values = {'sex': 'F', 'age': 30, 'isSenior65': False, 'name': '예약어', 'x': [1]}
+
+    cached = user_store.USER_PROFILES.update_request('u1', values)
+    # 캐시된 계획을 다시 쓴 요청도 처음 만든 요청과 같아야 함
+    assert user_store.USER_PROFILES.update_request('u1', values) == cached
+
+    names = cached['ExpressionAttributeNames']
+    placeholders = cached['UpdateExpression'][len('SET '):].split(', ')
+    assigned = {}
+    for assignment in placeholders:
+        name, placeholder = assignment.split(' = ')
+        assigned[names[name]] = cached['ExpressionAttributeValues'][placeholder]
+
+    assert assigned == _reference_encode(values)
+    assert cached['Key'] == {'user_id': {'S': 'u1'}}
+    assert cached['TableName'] == runtime_context.USER_PROFILES_TABLE
+
+
+@pytest.fixture
+def dynamodb(monkeypatch):
+    with DynamoDBStandIn({runtime_context.USERS_TABLE: 'email'}) as standin:
+        monkeypatch.setenv('DYNAMODB_ENDPOINT_URL', standin.endpoint_url)
+        monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+        monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+        monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+        runtime_context.reset()
+        yield standin
+    runtime_context.reset()
+
+
+def test_users_round_trip_through_dynamodb(dynamodb):
+    user = {
+        'email': 'a@x.com',
+        'user_id': 'u1',
+        'name': '홍길동',
+        'password_hash': 'h',
+        'created_at': '2024-01-01T00:00:00',
+        'extra': {'tags': {'a', 'b'}, 'n': Decimal('1.5')},
+    }
+    user_store.put_user(user)
+
+    stored = dynamodb.tables[runtime_context.USERS_TABLE]['a@x.com']
+    assert stored == _reference_encode(user)
+    assert user_store.get_user('a@x.com') == user
+    assert user_store.get_user('missing@x.com') is None
+    assert user_store.create_user(user) is False
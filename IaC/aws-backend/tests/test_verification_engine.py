@@ -0,0 +1,125 @@
+import pytest
+
+import jwt
+
+
+def test_verifier_rejects_engine_with_other_key():
+    verifier = jwt.Verifier('secret-a', algorithms=['HS256'])
+    token = jwt.encode({'sub': '1'}, 'secret-b', algorithm='HS256')
+
+    with jwt.VerificationEngine('secret-b', mode='sync') as engine:
+        with pytest.raises(ValueError):
+            verifier.decode_many([token], engine=engine)
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        verifier.decode(token)
+
+
+def test_verifier_decode_many_on_engine():
+    key = 'secret-a'
+    verifier = jwt.Verifier(key, algorithms=['HS256'])
+    good = jwt.encode({'sub': '1'}, key, algorithm='HS256')
+    forged = jwt.encode({'sub': '2'}, 'secret-b', algorithm='HS256')
+
+    with jwt.VerificationEngine(key, mode='thread', max_workers=2) as engine:
+        results = list(verifier.decode_many([good, forged, good], engine=engine))
+
+    assert results[0] == {'sub': '1'}
+    assert isinstance(results[1], jwt.InvalidSignatureError)
+    assert results[2] == {'sub': '1'}
+
+
+def test_decode_many_rejects_key_other_than_engine_key():
+    with jwt.VerificationEngine('secret-b', mode='sync') as engine:
+        with pytest.raises(ValueError):
+            jwt.decode_many([], 'secret-a', algorithms=['HS256'], engine=engine)
+
+
+def _outcome(result):
+    # 페이로드 또는 예외 종류로 비교
+    return type(result) if isinstance(result, Exception) else result
+
+
+def _plain_outcomes(tokens, key, **kwargs):
+    outcomes = []
+    for token in tokens:
+        try:
+            outcomes.append(jwt.decode(token, key, **kwargs))
+        except jwt.PyJWTError as e:
+            outcomes.append(type(e))
+    return outcomes
+
+
+def test_engine_accepts_equal_key_built_at_runtime():
+    key = ''.join(['secret', '-a'])
+    token = jwt.encode({'sub': '1'}, 'secret-a', algorithm='HS256')
+
+    with jwt.VerificationEngine('secret-a', mode='sync') as engine:
+        results = jwt.decode_many([token], key, algorithms=['HS256'], engine=engine)
+        assert list(results) == [{'sub': '1'}]
+        verifier = jwt.Verifier(key.encode(), algorithms=['HS256'])
+        assert list(verifier.decode_many([token], engine=engine)) == [{'sub': '1'}]
+
+
+@pytest.mark.parametrize('mode', ['sync', 'thread', 'process'])
+def test_engine_matches_decode_with_allow_list(mode):
+    key = 'secret-a'
+    tokens = [
+        jwt.encode({'sub': '1'}, key, algorithm='HS256'),
+        jwt.encode({'sub': '2'}, key, algorithm='HS512'),
+        jwt.encode({'sub': '3'}, 'secret-b', algorithm='HS256'),
+        jwt.encode({'sub': '4'}, None, algorithm='none'),
+        'not-a-token',
+    ]
+    expected = _plain_outcomes(tokens, key, algorithms=['HS256'])
+
+    with jwt.VerificationEngine(key, mode=mode, max_workers=2, chunksize=2) as engine:
+        results = jwt.decode_many(tokens, key, algorithms=['HS256'], engine=engine)
+        assert list(map(_outcome, results)) == expected
+    assert expected[0] == {'sub': '1'}
+
+
+def test_engine_verifies_with_the_algorithm_of_a_pyjwk():
+    # 헤더가 HS512여도 PyJWK의 알고리즘(HS256)으로 검증하는 decode()와 같아야 함
+    jwk = jwt.PyJWK({'kty': 'oct', 'k': 'c2VjcmV0', 'alg': 'HS256'})
+    tokens = [
+        jwt.encode({'sub': '1'}, b'secret', algorithm='HS256'),
+        jwt.encode({'sub': '2'}, b'secret', algorithm='HS512'),
+    ]
+    algorithms = ['HS256', 'HS512']
+    expected = _plain_outcomes(tokens, jwk, algorithms=algorithms)
+    assert expected == [{'sub': '1'}, jwt.InvalidSignatureError]
+
+    with jwt.VerificationEngine(jwk, mode='thread', max_workers=2) as engine:
+        results = jwt.decode_many(tokens, jwk, algorithms=algorithms, engine=engine)
+        assert list(map(_outcome, results)) == expected
+
+
+def test_engine_key_error_fails_only_its_token():
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    tokens = [
+        jwt.encode({'sub': '1'}, private_key, algorithm='RS256'),
+        # PEM 공개 키는 HMAC 비밀로 쓸 수 없음 (InvalidKeyError)
+        jwt.encode({'sub': '2'}, 'secret', algorithm='HS256'),
+        jwt.encode({'sub': '3'}, private_key, algorithm='RS256'),
+    ]
+    algorithms = ['RS256', 'HS256']
+    expected = _plain_outcomes(tokens, public_pem, algorithms=algorithms)
+    assert expected == [{'sub': '1'}, jwt.InvalidKeyError, {'sub': '3'}]
+
+    for mode in ('sync', 'thread', 'process'):
+        with jwt.VerificationEngine(public_pem, mode=mode, max_workers=2) as engine:
+            verifier = jwt.Verifier(public_pem, algorithms=algorithms)
+            results = verifier.decode_many(tokens, engine=engine)
+            assert list(map(_outcome, results)) == expected
+        # 엔진에 직접 보낸 작업도 키 오류는 해당 작업만 실패
+        with jwt.VerificationEngine(public_pem, mode=mode, max_workers=2) as engine:
+            results = list(engine.verify_many([('HS256', b'a.b', b'sig')] * 3))
+            assert all(isinstance(r, jwt.InvalidKeyError) for r in results)
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+import jwt
+
+NOW = int(time.time())
+
+TOKENS = [
+    jwt.encode({'sub': 'a', 'aud': 'api', 'exp': NOW + 600}, 'secret'),
+    jwt.encode({'sub': 'a', 'aud': 'api', 'exp': NOW - 600}, 'secret'),
+    jwt.encode({'sub': 'a', 'aud': 'web', 'iss': 'me'}, 'secret'),
+    jwt.encode({'sub': 'b', 'nbf': NOW + 600}, 'secret', algorithm='HS384'),
+    jwt.encode({'sub': 'a', 'aud': 'api'}, 'other'),
+    jwt.encode({'sub': 'a'}, None, algorithm='none'),
+    jwt.encode({'sub': 'a'}, 'secret', headers={'kid': 'k', 'x': [1]}),
+    'not.a.token',
+    'e30.e30',
+    b'\xff.\xff.\xff',
+]
+
+EXPECTATIONS = [
+    {'algorithms': ['HS256']},
+    {'algorithms': ['HS256', 'HS384'], 'audience': 'api'},
+    {'algorithms': ['HS256'], 'audience': ['api', 'web'], 'issuer': 'me'},
+    {'algorithms': ['HS256'], 'leeway': 1200, 'subject': 'a'},
+    {'algorithms': ['HS256'], 'options': {'verify_exp': False, 'require': ['sub']}},
+    {'algorithms': ['HS256'], 'options': {'verify_signature': False}},
+]
+
+
+def _outcome(decode, token):
+    try:
+        return decode(token)
+    except jwt.PyJWTError as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize('kwargs', EXPECTATIONS)
+def test_verifier_matches_decode(kwargs):
+    verifier = jwt.Verifier('secret', **kwargs)
+    compiled = jwt.PyJWT().compile('secret', **kwargs)
+
+    for token in TOKENS:
+        expected = _outcome(lambda t: jwt.decode(t, 'secret', **kwargs), token)
+        # 같은 Verifier를 반복해 써도 결과가 같아야 함
+        for _ in range(2):
+            assert _outcome(verifier.decode, token) == expected
+            assert _outcome(compiled.decode, token) == expected
+
+
+def test_verifier_decode_complete_matches_decode_complete():
+    verifier = jwt.Verifier('secret', algorithms=['HS256'], audience='api')
+
+    for token in TOKENS[:3]:
+        expected = _outcome(
+            lambda t: jwt.decode_complete(
+                t, 'secret', algorithms=['HS256'], audience='api'
+            ),
+            token,
+        )
+        assert _outcome(verifier.decode_complete, token) == expected
+
+
+def test_verifier_results_are_independent():
+    verifier = jwt.Verifier('secret', algorithms=['HS256'], audience='api')
+
+    payload = verifier.decode(TOKENS[0])
+    payload['sub'] = 'changed'
+
+    assert verifier.decode(TOKENS[0])['sub'] == 'a'